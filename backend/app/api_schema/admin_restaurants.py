@@ -1,9 +1,10 @@
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 from pydantic.config import ConfigDict
 from uuid import UUID
 
 from app.models.restaurant import BusinessStatus
+from app.utils.photo_store import stored_photo_url
 
 class RestaurantCreate(BaseModel):
     """Schema for creating a new restaurant using restaurant name with optional city and country"""
@@ -32,6 +33,11 @@ class RestaurantUpdate(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+    @validator('photo_url')
+    def store_photo_url(cls, v):
+        """Store photo proxy URLs as paths; responses resolve them again"""
+        return stored_photo_url(v)
+
 class RestaurantTagUpdate(BaseModel):
     """Schema for updating restaurant tags"""
     tag_ids: List[UUID] = Field(..., description="List of tag IDs to associate with the restaurant")
@@ -21,6 +21,7 @@ class JobResponse(BaseModel):
     logs: Optional[str] = None
     started_by: Optional[str] = None
     redis_lock_key: Optional[str] = None
+    payload: Optional[Dict[str, Any]] = None
     
     # Advanced tracking fields
     queue_size: Optional[int] = None
@@ -207,6 +208,7 @@ class JobCreateRequest(BaseModel):
     started_by: Optional[str] = None
     redis_lock_key: Optional[str] = None
     trigger_type: Optional[LockType] = LockType.AUTOMATIC
+    payload: Optional[Dict[str, Any]] = None
 
 class JobUpdateRequest(BaseModel):
     status: Optional[JobStatus] = None
@@ -292,4 +294,9 @@ class ActiveJobsResponse(BaseModel):
 class CleanupStaleJobsResponse(BaseModel):
     cleaned_jobs: List[JobResponse]
     total_cleaned: int
-    threshold_minutes: int
\ No newline at end of file
+    threshold_minutes: int
+
+
+class EventsTokenResponse(BaseModel):
+    token: str
+    expires_in: int = Field(..., description="Seconds the token can be used to connect to an event stream")
@@ -1,11 +1,12 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from pydantic.config import ConfigDict
 
 from app.api_schema.tags import TagResponse
 from app.api_schema.cuisines import CuisineResponse
+from app.utils.photo_store import public_photo_url
 
 if TYPE_CHECKING:
     from app.api_schema.listings import ListingLightResponse
@@ -31,6 +32,11 @@ class RestaurantResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @validator('photo_url')
+    def resolve_photo_url(cls, v):
+        """Resolve stored photo proxy paths against this API's public URL"""
+        return public_photo_url(v)
+
 class CityRestaurantsResponse(BaseModel):
     """Response model for city with its top restaurants"""
     city: str
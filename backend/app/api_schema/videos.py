@@ -22,6 +22,16 @@ class VideoResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+class TranscriptSegment(BaseModel):
+    start: float  # Seconds from the start of the video
+    end: float
+    text: str
+
+class TranscriptSegmentsResponse(BaseModel):
+    video_id: UUID
+    segments: List[TranscriptSegment]
+    total: int
+
 class VideosResponse(BaseModel):
     videos: List[VideoResponse]
     total: int
@@ -11,12 +11,25 @@ ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", None)
 # Redis lock keys
 SCRAPE_YOUTUBE_LOCK = "lock:scrape_youtube"
 TRANSCRIPTION_NLP_LOCK = "lock:transcription_nlp"
+BATCH_EXTRACTION_LOCK = "lock:batch_extraction"
+JOB_LOCK_TTL = int(os.getenv("JOB_LOCK_TTL", 900)) # Seconds a job lock outlives the job's last heartbeat
+CHANNEL_LOCK_TTL = int(os.getenv("CHANNEL_LOCK_TTL", 120)) # Seconds a channel is locked while its influencer is stored
+
+# Job queue workers (python -m app.worker claim queued jobs and per-video tasks from Postgres)
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", 5)) # Videos processed at once by one worker
+WORKER_POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", 5)) # Seconds between queue polls when idle
+TASK_LEASE_SECONDS = int(os.getenv("TASK_LEASE_SECONDS", 300)) # A claimed video is redelivered if its lease is not renewed in time
+TASK_MAX_ATTEMPTS = int(os.getenv("TASK_MAX_ATTEMPTS", 3)) # Deliveries of a video before it is failed
+JOB_HEARTBEAT_TIMEOUT = int(os.getenv("JOB_HEARTBEAT_TIMEOUT", 600)) # A scrape or batch job is redelivered after this long without a heartbeat
+BACKLOG_PAGE_SIZE = int(os.getenv("BACKLOG_PAGE_SIZE", 50)) # Videos a backlog job queues at a time, refilled when fewer are pending
+JOB_PROGRESS_FLUSH_INTERVAL = float(os.getenv("JOB_PROGRESS_FLUSH_INTERVAL", 2)) # Seconds between a worker's batched job progress writes
 
 # supabase
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
 ALGORITHM = "HS256"
+JOB_EVENTS_TOKEN_TTL = int(os.getenv("JOB_EVENTS_TOKEN_TTL", 60)) # Seconds an event stream token can be used to connect
 
 # admin
 ADMIN_EMAIL = os.getenv("ADMIN_EMAIL")
@@ -28,6 +41,20 @@ YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 PEXELS_API_KEY = os.getenv("PEXELS_API_KEY")
 
+# Google Maps web services client (shared by the pipeline and API routes)
+GOOGLE_MAPS_QPS = float(os.getenv("GOOGLE_MAPS_QPS", 10)) # Requests per second across the process
+GOOGLE_MAPS_MAX_CONNECTIONS = int(os.getenv("GOOGLE_MAPS_MAX_CONNECTIONS", 20)) # Pooled HTTP connections
+
+# Google Places lookup cache
+PLACES_CACHE_TTL = int(os.getenv("PLACES_CACHE_TTL", 30 * 24 * 3600)) # Seconds to keep successful lookups
+PLACES_NEGATIVE_CACHE_TTL = int(os.getenv("PLACES_NEGATIVE_CACHE_TTL", 24 * 3600)) # Seconds to keep ZERO_RESULTS lookups
+GOOGLE_REVIEWS_FRESH_TTL = int(os.getenv("GOOGLE_REVIEWS_FRESH_TTL", 6 * 3600)) # Age after which cached reviews are refreshed in the background
+GOOGLE_REVIEWS_MAX_AGE = int(os.getenv("GOOGLE_REVIEWS_MAX_AGE", 7 * 24 * 3600)) # Age after which cached reviews are dropped
+
+# Restaurant photo proxy (photos are fetched from Google once and served from disk)
+PUBLIC_API_URL = os.getenv("PUBLIC_API_URL", "http://localhost:8030").rstrip("/") # Base URL of this API as seen by browsers
+PHOTO_STORAGE_DIR = os.getenv("PHOTO_STORAGE_DIR", "photos") # Directory holding the resized WebP variants
+
 # Influencer channels
 INFLUENCER_CHANNELS = [
     {"url": "https://www.youtube.com/@alexandertheguest", "name": "Alexander The Guest", "region": None},
@@ -46,8 +73,31 @@ INFLUENCER_CHANNELS = [
 ]
 
 # Entities Extractor
-CHUNK_SIZE = 4000 # Chunk size for transcription
+GPT_MODEL = "gpt-4.1"
+PROMPT_VERSION = "v2" # Bump when the extraction system prompt or response schema changes
+CHUNK_TOKEN_BUDGET = int(os.getenv("CHUNK_TOKEN_BUDGET", 3000)) # Max transcript tokens per GPT chunk
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", 200)) # Tokens repeated between consecutive chunks
 TOKEN_SIZE = 4500
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", 90 * 24 * 3600)) # Seconds to keep cached chunk extractions
+CHUNK_FILTER_ENABLED = os.getenv("CHUNK_FILTER_ENABLED", "false").lower() == "true" # Send chunks likely to mention a place first (opt-in)
+CHUNK_FILTER_THRESHOLD = float(os.getenv("CHUNK_FILTER_THRESHOLD", 4.0)) # Minimum pre-filter score of a candidate chunk (its best window)
+CHUNK_FILTER_NEIGHBORS = int(os.getenv("CHUNK_FILTER_NEIGHBORS", 1)) # Chunks kept on each side of a candidate
+
+# OpenAI rate-limit governor (shared by every pipeline task in the process)
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", 8)) # Simultaneous OpenAI requests
+OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", 500))
+OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", 200000))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", 5))
+
+# OpenAI prices (USD) used to estimate job spend against backlog budgets
+GPT_INPUT_PRICE_PER_MTOK = float(os.getenv("GPT_INPUT_PRICE_PER_MTOK", 2.00)) # Uncached input tokens of GPT_MODEL
+GPT_CACHED_INPUT_PRICE_PER_MTOK = float(os.getenv("GPT_CACHED_INPUT_PRICE_PER_MTOK", 0.50))
+GPT_OUTPUT_PRICE_PER_MTOK = float(os.getenv("GPT_OUTPUT_PRICE_PER_MTOK", 8.00))
+WHISPER_PRICE_PER_MINUTE = float(os.getenv("WHISPER_PRICE_PER_MINUTE", 0.006))
+
+# Batch API extraction for transcribed backlogs
+BATCH_POLL_INTERVAL = int(os.getenv("BATCH_POLL_INTERVAL", 60)) # Seconds between batch status checks
+BATCH_MAX_VIDEOS = int(os.getenv("BATCH_MAX_VIDEOS", 2000)) # Videos per batch job
 
 # Base directory for audio downloads
 AUDIO_BASE_DIR = "audios"
\ No newline at end of file
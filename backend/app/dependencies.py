@@ -1,9 +1,10 @@
 from jose import jwt, JWTError
 
-from fastapi import Depends, HTTPException, Depends
+from fastapi import Depends, HTTPException, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.config import SUPABASE_JWT_SECRET, ALGORITHM, SUPABASE_URL
+from app.utils.job_events import verify_events_token
 from app.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
@@ -41,3 +42,17 @@ def get_current_admin(user = Depends(get_current_user)):
     # if user.get("user_metadata", {}).get("role") != "admin":
     #     raise HTTPException(status_code=403, detail="Admins only")
     return user
+
+def get_event_stream_admin(token: str = Query(..., description="Token from POST /admin/jobs/events/token/")):
+    """
+    Admin access for server-sent event streams. EventSource cannot send an Authorization
+    header, so the streams take a short-lived token issued to a signed-in admin instead.
+    """
+    if not SUPABASE_JWT_SECRET:
+        logger.error("Supabase JWT secret not configured")
+        raise HTTPException(status_code=500, detail="Supabase JWT secret not configured")
+
+    user = verify_events_token(token, SUPABASE_JWT_SECRET)
+    if user is None:
+        raise HTTPException(status_code=403, detail="Invalid or expired token")
+    return user
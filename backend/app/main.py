@@ -1,3 +1,5 @@
+import asyncio
+
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
@@ -28,6 +30,11 @@ from app.routes.admin.tags import admin_tags_router
 from app.routes.admin.cuisines import admin_cuisines_router
 from app.routes.dashboard import router as dashboard_router
 from app.routes.geocoding import router as geocoding_router
+from app.routes.photos import router as photos_router
+from app.database import AsyncSessionLocal
+from app.services.taxonomy import warm_vocabulary_caches
+from app.utils.google_maps_client import close_google_maps_client
+from app.utils.vocabulary_cache import listen_for_invalidations
 
 # Configure logging
 logger = setup_logger(__name__)
@@ -69,9 +76,28 @@ app.include_router(admin_influencers_router, prefix="/admin/influencers", tags=[
 app.include_router(admin_tags_router, prefix="/admin/tags", tags=["admin"])
 app.include_router(admin_cuisines_router, prefix="/admin/cuisines", tags=["admin"])
 app.include_router(geocoding_router, prefix="/geocoding", tags=["geocoding"])
+app.include_router(photos_router, prefix="/photos", tags=["photos"])
 app.include_router(dashboard_router, tags=["dashboard"])
 
 
+@app.on_event("startup")
+async def startup():
+    # Load tag/cuisine name -> id caches and keep them in sync with other processes
+    try:
+        async with AsyncSessionLocal() as db:
+            await warm_vocabulary_caches(db)
+    except Exception as e:
+        logger.warning(f"Could not warm vocabulary caches, loading on first use: {e}")
+    app.state.vocabulary_listener = asyncio.create_task(listen_for_invalidations())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.vocabulary_listener.cancel()
+    # Release pooled connections of the shared Google Maps client
+    await close_google_maps_client()
+
+
 # Custom exception handler for validation errors
 @app.exception_handler(RequestValidationError)
 async def custom_validation_exception_handler(
@@ -105,5 +131,5 @@ def root():
 @app.get("/test-transcribe")
 async def test_transcribe():
     gpt_processor = GPTFoodPlaceProcessor()
-    result = await gpt_processor.transcribe_audio("audios/manual_8WC7UnH_7uU.mp3")
-    return {"result": result}
+    result, segments = await gpt_processor.transcribe_audio("audios/manual_8WC7UnH_7uU.mp3")
+    return {"result": result, "segments": segments}
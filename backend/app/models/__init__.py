@@ -7,7 +7,9 @@ from .tag import Tag
 from .cuisine import Cuisine
 from .restaurant_cuisine import RestaurantCuisine
 from .video import Video
+from .video_processing_job import VideoProcessingJob
 
 # ENUMs
 from .job import JobStatus, JobType
-from .restaurant import BusinessStatus
\ No newline at end of file
+from .restaurant import BusinessStatus
+from .video_processing_job import VideoProcessingStatus, VideoProcessingStage
\ No newline at end of file
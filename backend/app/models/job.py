@@ -3,6 +3,7 @@ from enum import Enum
 
 from sqlalchemy import (Column, UUID, String, Text, DateTime, Boolean, Integer, Float, Enum as SQLEnum, text)
 from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.database import Base
 
@@ -16,6 +17,7 @@ class JobStatus(str, Enum):
 class JobType(str, Enum):
     SCRAPE_YOUTUBE = "scrape_youtube"
     TRANSCRIPTION_NLP = "transcription_nlp"
+    BATCH_EXTRACTION = "batch_extraction"
 
 class LockType(str, Enum):
     """Enum for different types of processing locks."""
@@ -43,6 +45,7 @@ class Job(Base):
     started_by = Column(String(255), nullable=True)  # User who started the job
     redis_lock_key = Column(String(255), nullable=True)  # Redis lock key if applicable
     trigger_type = Column(SQLEnum(LockType), default=LockType.AUTOMATIC, nullable=False)  # Type of trigger (manual/automatic)
+    payload = Column(JSONB, nullable=True)  # Request parameters the worker runs the job with (e.g. video_ids)
     
     # Advanced tracking fields
     queue_size = Column(Integer, default=0, nullable=True)  # Number of items queued for processing
@@ -57,7 +60,7 @@ class Job(Base):
     cancelled_by = Column(String(255), nullable=True)  # User who requested cancellation
     cancelled_at = Column(DateTime(timezone=True), nullable=True)  # When cancellation was requested
     
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
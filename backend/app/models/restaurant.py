@@ -33,7 +33,8 @@ class Restaurant(Base):
         server_default=BusinessStatus.BUSINESS_STATUS_UNSPECIFIED.value,
         nullable=False
     ) # Whether the restaurant is currently operational
-    photo_url = Column(Text, nullable=True) # From Google Places API
+    photo_url = Column(Text, nullable=True) # Photo proxy path (or a custom URL set by an admin)
+    photo_reference = Column(Text, nullable=True) # Google Places photo reference served by /photos/{id}
     is_active = Column(Boolean, default=True) # Soft delete
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -3,7 +3,7 @@ import uuid
 from sqlalchemy import (Column, String, Text, DateTime, ForeignKey, UniqueConstraint)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.database import Base
 
@@ -18,6 +18,7 @@ class Video(Base):
     video_url = Column(String(255), nullable=False)
     published_at = Column(DateTime(timezone=True))
     transcription = Column(Text) # From Whisper
+    transcript_segments = Column(JSONB, nullable=True) # [{"start", "end", "text"}] from Whisper, times in seconds
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -0,0 +1,54 @@
+import uuid
+from enum import Enum
+
+from sqlalchemy import (Column, String, Text, Integer, DateTime, ForeignKey, Index, UniqueConstraint, Enum as SQLEnum)
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+from app.database import Base
+
+class VideoProcessingStatus(str, Enum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+class VideoProcessingStage(str, Enum):
+    """Pipeline stages of a video, in order; a row records the last one completed."""
+    DOWNLOADED = "downloaded"
+    TRANSCRIBED = "transcribed"
+    EXTRACTED = "extracted"
+    VALIDATED = "validated"
+    STORED = "stored"
+
+class VideoProcessingJob(Base):
+    __tablename__ = "video_processing_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    video_id = Column(UUID(as_uuid=True), ForeignKey("videos.id", ondelete="CASCADE"), nullable=False, index=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="SET NULL"), nullable=True, index=True)
+    status = Column(SQLEnum(VideoProcessingStatus), default=VideoProcessingStatus.PENDING, nullable=False)
+    stage = Column(SQLEnum(VideoProcessingStage), nullable=True) # Last completed stage
+    audio_path = Column(Text, nullable=True) # Downloaded audio kept until transcription succeeds
+    entities = Column(JSONB, nullable=True) # Extracted entities
+    resolved_entities = Column(JSONB, nullable=True) # [{"entity", "validated"}] after restaurant validation
+    attempts = Column(Integer, default=0, nullable=False) # Deliveries to a worker (or in-process runs)
+    worker_id = Column(String(255), nullable=True) # Worker holding the claim while processing
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True) # Claim is redelivered after this unless renewed
+    token_usage = Column(JSONB, nullable=True) # OpenAI usage of the worker run (TokenUsage.to_dict())
+    pipeline_metrics = Column(JSONB, nullable=True) # OpenAI governor, Places cache and local match counters of the worker run
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    video = relationship("Video")
+    job = relationship("Job")
+
+    __table_args__ = (
+        UniqueConstraint('video_id', 'job_id', name='uix_video_processing_job_video_job'),
+        Index('ix_video_processing_jobs_status_created_at', 'status', 'created_at'), # Queue claims
+    )
@@ -9,6 +9,7 @@ from app.api_schema.cuisines import CuisineCreate, CuisineUpdate, CuisineRespons
 from app.database import get_async_db
 from app.dependencies import get_current_admin
 from app.models.cuisine import Cuisine
+from app.utils.vocabulary_cache import publish_invalidation
 
 admin_cuisines_router = APIRouter()
 
@@ -82,6 +83,8 @@ async def update_cuisine(
 
         await db.commit()
         await db.refresh(existing_cuisine)
+        # Names are cached by every process; drop the stale name -> id entries
+        await publish_invalidation("cuisines")
         return existing_cuisine
     except HTTPException:
         raise
@@ -111,6 +114,7 @@ async def delete_cuisine(
 
         await db.execute(delete(Cuisine).filter(Cuisine.id == cuisine_id))
         await db.commit()
+        await publish_invalidation("cuisines")
         
         return {"message": "Cuisine deleted successfully"}
     except HTTPException:
@@ -3,13 +3,20 @@ from uuid import UUID
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.job import JobStatus, JobType
 from app.database import get_async_db, get_db
-from app.dependencies import get_current_admin
+from app.config import JOB_EVENTS_TOKEN_TTL, SUPABASE_JWT_SECRET
+from app.dependencies import get_current_admin, get_event_stream_admin
 from app.services.jobs import JobService
+from app.services.job_queue import release_job_lock
+from app.utils.job_analytics import job_analytics, jobs_summary, performance_analytics
+from app.utils.job_events import (JOB_EVENTS_CHANNEL, create_events_token, is_terminal_event, job_event,
+                                  job_events_channel, stream_job_events, subscribe_job_events)
+from app.utils.redis_utils import get_redis_client
 from app.api_schema.jobs import (
     JobResponse,
     JobListResponse,
@@ -19,11 +26,15 @@ from app.api_schema.jobs import (
     TrackingStatsRequest,
     JobAnalyticsResponse,
     ActiveJobsResponse,
-    CleanupStaleJobsResponse
+    CleanupStaleJobsResponse,
+    EventsTokenResponse
 )
 
 router = APIRouter()
 
+# Keep proxies (e.g. nginx) from buffering event streams
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 @router.get("/", response_model=List[JobListResponse])
 async def get_jobs(
     skip: int = Query(0, ge=0),
@@ -125,17 +136,57 @@ async def get_jobs(
     
     return jobs
 
-@router.get("/{job_id}/", response_model=JobResponse)
-async def get_job(
+@router.post("/events/token/", response_model=EventsTokenResponse)
+async def create_job_events_token(admin_user = Depends(get_current_admin)):
+    """
+    Issue a short-lived token for the event streams below. EventSource cannot send the
+    Authorization header, so connect with ``new EventSource(`.../events/?token=${token}`)``
+    and request a new token before reconnecting.
+    """
+    if not SUPABASE_JWT_SECRET:
+        raise HTTPException(status_code=500, detail="Supabase JWT secret not configured")
+    token = create_events_token(admin_user, SUPABASE_JWT_SECRET, JOB_EVENTS_TOKEN_TTL)
+    return EventsTokenResponse(token=token, expires_in=JOB_EVENTS_TOKEN_TTL)
+
+@router.get("/events/")
+async def stream_jobs_events(admin_user = Depends(get_event_stream_admin)):
+    """
+    Stream the events of every job as server-sent events (instead of polling the job list).
+    Authenticated with the ``token`` query parameter from POST /events/token/.
+
+    Events: "progress" (status, progress, counts, processing_rate and estimated_completion_time
+    of a job, published as its progress is written) and "video" (a video of a transcription job
+    completed a pipeline stage or finished).
+    """
+    client = await get_redis_client()
+    if client is None:
+        raise HTTPException(status_code=503, detail="Job events are unavailable (Redis is unreachable)")
+    pubsub = await subscribe_job_events(client, [JOB_EVENTS_CHANNEL])
+    return StreamingResponse(stream_job_events(pubsub), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.get("/{job_id}/events/")
+async def stream_job_events_of_job(
     job_id: UUID,
     db: AsyncSession = Depends(get_async_db),
-    admin_user = Depends(get_current_admin)
+    admin_user = Depends(get_event_stream_admin)
 ):
-    """Get a specific job by ID."""
+    """
+    Stream the events of a job as server-sent events (see /events/), starting with its current
+    state; the stream ends when the job finishes.
+    """
+    client = await get_redis_client()
+    if client is None:
+        raise HTTPException(status_code=503, detail="Job events are unavailable (Redis is unreachable)")
+    pubsub = await subscribe_job_events(client, [job_events_channel(job_id)])
     job = await JobService.get_job(db, job_id)
     if not job:
+        await pubsub.aclose()
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return StreamingResponse(
+        stream_job_events(pubsub, first=job_event(job), until=is_terminal_event),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
 
 @router.post("/", response_model=JobResponse)
 async def create_job(
@@ -227,6 +278,7 @@ async def cancel_job(
     job = await JobService.cancel_job(db, job_id, cancelled_by)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    await release_job_lock(job)
     return job
 
 @router.post("/{job_id}/request-cancellation/", response_model=JobResponse)
@@ -284,85 +336,12 @@ async def get_job_analytics(
 ):
     """Get comprehensive job analytics including completion rates, processing times, and success ratios."""
     try:
-        # Get all jobs from the specified period
+        # Aggregate the jobs of the period in the database, by type and status
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        all_jobs = await JobService.get_jobs(db, limit=10000)
-        recent_jobs = [job for job in all_jobs if job.created_at >= cutoff_date]
-        
-        # Completion rates by type
-        completion_rates_by_type = {}
-        for job_type in JobType:
-            type_jobs = [job for job in recent_jobs if job.job_type == job_type]
-            completed = len([job for job in type_jobs if job.status == JobStatus.COMPLETED])
-            total = len(type_jobs)
-            completion_rates_by_type[job_type.value] = {
-                "completed": completed,
-                "total": total,
-                "rate": (completed / total * 100) if total > 0 else 0
-            }
-        
-        # Average processing times
-        average_processing_times = {}
-        for job_type in JobType:
-            type_jobs = [job for job in recent_jobs if job.job_type == job_type and job.started_at and job.completed_at]
-            if type_jobs:
-                durations = [(job.completed_at - job.started_at).total_seconds() / 60 for job in type_jobs]
-                average_processing_times[job_type.value] = {
-                    "average_minutes": sum(durations) / len(durations),
-                    "min_minutes": min(durations),
-                    "max_minutes": max(durations),
-                    "sample_size": len(durations)
-                }
-            else:
-                average_processing_times[job_type.value] = {
-                    "average_minutes": 0,
-                    "min_minutes": 0,
-                    "max_minutes": 0,
-                    "sample_size": 0
-                }
-        
-        # Success/failure ratios
-        success_failure_ratios = {}
-        for job_type in JobType:
-            type_jobs = [job for job in recent_jobs if job.job_type == job_type]
-            completed = len([job for job in type_jobs if job.status == JobStatus.COMPLETED])
-            failed = len([job for job in type_jobs if job.status == JobStatus.FAILED])
-            cancelled = len([job for job in type_jobs if job.status == JobStatus.CANCELLED])
-            total_finished = completed + failed + cancelled
-            
-            success_failure_ratios[job_type.value] = {
-                "success_count": completed,
-                "failure_count": failed,
-                "cancelled_count": cancelled,
-                "success_rate": (completed / total_finished * 100) if total_finished > 0 else 0,
-                "failure_rate": (failed / total_finished * 100) if total_finished > 0 else 0
-            }
-        
-        # Processing rate statistics
-        processing_rates = [job.processing_rate for job in recent_jobs if job.processing_rate and job.processing_rate > 0]
-        processing_rate_statistics = {
-            "average_rate": sum(processing_rates) / len(processing_rates) if processing_rates else 0,
-            "min_rate": min(processing_rates) if processing_rates else 0,
-            "max_rate": max(processing_rates) if processing_rates else 0,
-            "sample_size": len(processing_rates)
-        }
-        
-        # Queue metrics
-        active_jobs = [job for job in recent_jobs if job.status in [JobStatus.RUNNING, JobStatus.PENDING]]
-        queue_metrics = {
-            "total_queue_size": sum([job.queue_size or 0 for job in active_jobs]),
-            "total_items_in_progress": sum([job.items_in_progress or 0 for job in active_jobs]),
-            "total_failed_items": sum([job.failed_items or 0 for job in recent_jobs]),
-            "active_jobs_count": len(active_jobs)
-        }
-    
+        groups = await JobService.get_job_group_stats(db, created_after=cutoff_date)
+
         return JobAnalyticsResponse(
-            completion_rates_by_type=completion_rates_by_type,
-            average_processing_times=average_processing_times,
-            success_failure_ratios=success_failure_ratios,
-            processing_rate_statistics=processing_rate_statistics,
-            queue_metrics=queue_metrics,
-            total_jobs=len(recent_jobs),
+            **job_analytics(groups, [job_type.value for job_type in JobType]),
             period_analyzed=f"{days} days"
         )
     except Exception as e:
@@ -422,47 +401,22 @@ async def get_jobs_summary(
     admin_user = Depends(get_current_admin)
 ):
     """Get an enhanced summary of job statuses and statistics."""
-    # Get counts for each status
-    summary = {}
-    total_failed_items = 0
-    total_processed_items = 0
-    total_queue_size = 0
-    active_jobs_with_cancellation = 0
-    
-    for status in JobStatus:
-        jobs = await JobService.get_jobs(db, status=status, limit=1000)
-        summary[status.value] = len(jobs)
-        
-        # Aggregate statistics
-        for job in jobs:
-            if job.failed_items:
-                total_failed_items += job.failed_items
-            if job.processed_items:
-                total_processed_items += job.processed_items
-            if job.queue_size:
-                total_queue_size += job.queue_size
-            if job.status in [JobStatus.RUNNING, JobStatus.PENDING] and job.cancellation_requested:
-                active_jobs_with_cancellation += 1
+    # Counts and item totals by status, aggregated in the database
+    groups = await JobService.get_job_group_stats(db)
+    summary = jobs_summary(groups, [status.value for status in JobStatus])
     
     # Get running jobs with enhanced data
     running_jobs = await JobService.get_jobs(db, status=JobStatus.RUNNING, limit=10)
     
-    # Get jobs with cancellation requests
-    all_jobs = await JobService.get_jobs(db, limit=1000)
-    cancellation_requested_jobs = [job for job in all_jobs if job.cancellation_requested]
+    # Get the latest jobs with cancellation requests
+    cancellation_requested_jobs = await JobService.get_jobs(db, limit=5, cancellation_requested=True)
     
     return {
-        "status_counts": summary,
+        "status_counts": summary["status_counts"],
         "running_jobs": running_jobs,
-        "total_jobs": sum(summary.values()),
-        "statistics": {
-            "total_failed_items": total_failed_items,
-            "total_processed_items": total_processed_items,
-            "total_queue_size": total_queue_size,
-            "active_jobs_with_cancellation": active_jobs_with_cancellation,
-            "total_cancellation_requests": len(cancellation_requested_jobs)
-        },
-        "cancellation_requested_jobs": cancellation_requested_jobs[:5]  # Show first 5
+        "total_jobs": summary["total_jobs"],
+        "statistics": summary["statistics"],
+        "cancellation_requested_jobs": cancellation_requested_jobs
     }
 
 @router.get("/analytics/performance/")
@@ -472,39 +426,22 @@ async def get_performance_analytics(
     admin_user = Depends(get_current_admin)
 ):
     """Get job performance analytics."""
-    all_jobs = await JobService.get_jobs(db, limit=1000)
-    
-    # Filter jobs from the last N days
-    from datetime import timedelta
+    # Aggregate the jobs of the last N days in the database, by type and status
     cutoff_date = datetime.utcnow() - timedelta(days=days)
-    recent_jobs = [job for job in all_jobs if job.created_at >= cutoff_date]
-    
-    # Calculate analytics
-    completed_jobs = [job for job in recent_jobs if job.status == JobStatus.COMPLETED]
-    failed_jobs = [job for job in recent_jobs if job.status == JobStatus.FAILED]
-    cancelled_jobs = [job for job in recent_jobs if job.status == JobStatus.CANCELLED]
-    
-    # Calculate average processing rates
-    avg_processing_rate = 0
-    if completed_jobs:
-        rates = [job.processing_rate for job in completed_jobs if job.processing_rate]
-        if rates:
-            avg_processing_rate = sum(rates) / len(rates)
-    
-    # Calculate success rate
-    total_finished = len(completed_jobs) + len(failed_jobs) + len(cancelled_jobs)
-    success_rate = (len(completed_jobs) / total_finished * 100) if total_finished > 0 else 0
-    
-    return {
-        "period_days": days,
-        "total_jobs": len(recent_jobs),
-        "completed_jobs": len(completed_jobs),
-        "failed_jobs": len(failed_jobs),
-        "cancelled_jobs": len(cancelled_jobs),
-        "success_rate": round(success_rate, 2),
-        "average_processing_rate": round(avg_processing_rate, 2),
-        "job_types_breakdown": {
-            job_type.value: len([job for job in recent_jobs if job.job_type == job_type])
-            for job_type in JobType
-        }
-    }
+    groups = await JobService.get_job_group_stats(db, created_after=cutoff_date)
+
+    return performance_analytics(groups, [job_type.value for job_type in JobType], days)
+
+# Registered after the static GET routes (/analytics/, /active/, /status/summary/, ...), which
+# would otherwise be taken for job ids
+@router.get("/{job_id}/", response_model=JobResponse)
+async def get_job(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    admin_user = Depends(get_current_admin)
+):
+    """Get a specific job by ID."""
+    job = await JobService.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
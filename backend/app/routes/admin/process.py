@@ -1,142 +1,121 @@
-import redis
-import asyncio
 import json
-import time
 from typing import Optional, List
+from uuid import UUID, uuid4
 
-from fastapi import (APIRouter, Depends, BackgroundTasks, HTTPException, status)
-from pydantic import BaseModel
+from fastapi import (APIRouter, Depends, HTTPException, status)
+from pydantic import BaseModel, Field
 
-from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import (REDIS_URL, SCRAPE_YOUTUBE_LOCK, TRANSCRIPTION_NLP_LOCK, INFLUENCER_CHANNELS)
-from app.database import (AsyncSessionLocal, get_db, get_async_db)
-from app.services import (scrape_youtube, transcription_nlp_pipeline, JobService)
+from app.config import (SCRAPE_YOUTUBE_LOCK, TRANSCRIPTION_NLP_LOCK, BATCH_EXTRACTION_LOCK, JOB_LOCK_TTL, INFLUENCER_CHANNELS)
+from app.database import get_async_db
+from app.services import JobService
+from app.services.transcription_nlp import select_videos_for_processing
+from app.services.video_processing_jobs import VideoProcessingJobService
 from app.models.job import JobType, LockType
 from app.dependencies import get_current_admin
 from app.api_schema.jobs import JobCreateRequest
+from app.utils.redis_lock import acquire_lock, release_lock
+from app.utils.redis_utils import get_redis_client
+from app.utils.task_queue import BacklogPriority
 
 router = APIRouter()
 
-# Initialize Redis client
-redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
-
 class ScrapeRequest(BaseModel):
     video_ids: Optional[List[str]] = None
     trigger_type: Optional[LockType] = LockType.AUTOMATIC
 
+class TranscriptionRequest(ScrapeRequest):
+    backlog: bool = Field(False, description="Queue every eligible video instead of one recent video per influencer")
+    priority: BacklogPriority = Field(BacklogPriority.RECENCY, description="Order in which backlog videos are queued")
+    max_videos: Optional[int] = Field(None, ge=1, description="Stop queueing backlog videos after this many")
+    max_minutes: Optional[float] = Field(None, gt=0, description="Stop the backlog after this many minutes")
+    max_spend: Optional[float] = Field(None, gt=0, description="Stop the backlog once estimated OpenAI spend reaches this (USD)")
+
+async def lock_new_job(lock_key: str, busy_detail: str) -> UUID:
+    """
+    Take a job lock for a job about to be created, owned by the new job's id.
+
+    The lock is taken atomically (SET NX PX), kept alive by the worker running the
+    job and released when the job ends.
+
+    Returns:
+        The id to create the job with
+
+    Raises:
+        HTTPException: 429 if another job holds the lock, 503 if Redis is unreachable
+    """
+    client = await get_redis_client()
+    if client is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Redis is unavailable")
+    job_id = uuid4()
+    if not await acquire_lock(client, lock_key, str(job_id), JOB_LOCK_TTL):
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=busy_detail)
+    return job_id
+
+
+async def unlock_new_job(lock_key: str, job_id: UUID) -> None:
+    """Release the lock taken by lock_new_job when the job could not be queued."""
+    client = await get_redis_client()
+    if client is not None:
+        await release_lock(client, lock_key, str(job_id))
+
+
 @router.post("/scrape-youtube/")
-async def trigger_scrape(background_tasks: BackgroundTasks = None, db: Session = Depends(get_db), admin_user = Depends(get_current_admin)):
-    """Trigger YouTube scraping in the background with Redis lock and job tracking."""
+async def trigger_scrape(db: AsyncSession = Depends(get_async_db), admin_user = Depends(get_current_admin)):
+    """Queue YouTube scraping for a worker (python -m app.worker) with Redis lock and job tracking."""
     # Try to acquire the lock (non-blocking)
-    if redis_client.get(SCRAPE_YOUTUBE_LOCK):
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="YouTube scraping is already running. Please wait until the current task completes."
-        )
+    job_id = await lock_new_job(
+        SCRAPE_YOUTUBE_LOCK, "YouTube scraping is already running. Please wait until the current task completes."
+    )
     
-    # Create a job to track this process
+    # Create a job to track this process; a worker claims it from the queue
     job_description = "Scraping videos from YouTube channels"
 
     job_data = JobCreateRequest(
         job_type=JobType.SCRAPE_YOUTUBE,
         title="YouTube Video Scraping",
         description=job_description,
+        total_items=len(INFLUENCER_CHANNELS),
         redis_lock_key=SCRAPE_YOUTUBE_LOCK,
         started_by="system",
         trigger_type=LockType.AUTOMATIC
     )
     
-    job = JobService.create_job_sync(db, job_data)
-    
-    # Set the lock with a 1-hour TTL (adjust as needed)
-    redis_client.setex(SCRAPE_YOUTUBE_LOCK, 3600, "locked")
-    
-    async def scrape_with_job_tracking():
-        start_time = time.time()
-        last_heartbeat = start_time
-        
-        try:
-            # Start the job
-            JobService.start_job_sync(db, job.id)
-            
-            # Initialize progress tracking
-            JobService.update_progress_sync(db, job.id, 0, 0)
-            JobService.update_queue_metrics_sync(db, job.id, len(INFLUENCER_CHANNELS), 0)
-            
-            # Run the scraping with monitoring
-            async def monitored_scrape():
-                nonlocal last_heartbeat
-                
-                # Check for cancellation
-                current_job = JobService.get_job_sync(db, job.id)
-                if current_job and current_job.cancellation_requested:
-                    JobService.cancel_job_sync(db, job.id, "Job cancelled by user request")
-                    redis_client.delete(SCRAPE_YOUTUBE_LOCK)
-                    return {"cancelled": True}
-                
-                # Heartbeat update
-                JobService.update_heartbeat_sync(db, job.id)
-                
-                # Run the actual pipeline with video_ids
-                return scrape_youtube(db, job.id)
-            
-            result = await monitored_scrape()
-            
-            if result and result.get("cancelled"):
-                return
-            
-            # Complete the job
-            elapsed_time = time.time() - start_time
-            result_data = json.dumps({
-                "message": "YouTube scraping completed successfully",
-                "elapsed_time": elapsed_time,
-            })
-            JobService.complete_job_sync(db, job.id, result_data)
-            
-        except Exception as e:
-            # Check if it's a cancellation
-            if "cancelled" in str(e).lower():
-                JobService.cancel_job_sync(db, job.id, str(e))
-            else:
-                JobService.fail_job_sync(db, job.id, str(e))
-            redis_client.delete(SCRAPE_YOUTUBE_LOCK)  # Release lock on error
-            raise
-    
     try:
-        background_tasks.add_task(scrape_with_job_tracking)
-        return {
-            "message": "YouTube scraping started in the background",
-            "job_id": str(job.id),
-            "influencer_count": len(INFLUENCER_CHANNELS)
-        }
-    except Exception as e:
-        redis_client.delete(SCRAPE_YOUTUBE_LOCK)  # Release lock on error
-        JobService.fail_job_sync(db, job.id, str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to start scraping: {str(e)}"
-        )
+        job = await JobService.create_job(db, job_data, job_id=job_id)
+    except Exception:
+        await unlock_new_job(SCRAPE_YOUTUBE_LOCK, job_id)
+        raise
+
+    return {
+        "message": "YouTube scraping queued",
+        "job_id": str(job.id),
+        "influencer_count": len(INFLUENCER_CHANNELS)
+    }
 
 @router.post("/transcription-nlp/")
 async def trigger_transcription_nlp(
-    request: ScrapeRequest = ScrapeRequest(),
-    release_lock: bool = False,
+    request: TranscriptionRequest = TranscriptionRequest(),
     db: AsyncSession = Depends(get_async_db),
     admin_user = Depends(get_current_admin)
 ):
-    """Trigger asynchronous video transcription and NLP processing with Redis lock and job tracking."""
-    if release_lock:
-        redis_client.delete(TRANSCRIPTION_NLP_LOCK)  # Release lock if requested
-        # return {"message": "Redis lock released successfully"}
+    """Queue video transcription and NLP processing, one task per video, with job tracking.
 
-    # Try to acquire the lock (non-blocking)
-    if redis_client.get(TRANSCRIPTION_NLP_LOCK):
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Video transcription and NLP processing is already running. Please wait until the current task completes."
-        )
+    Workers (python -m app.worker) claim the videos; the job completes when the last one is done.
+    Jobs over different videos run side by side: videos already queued in another job are left
+    out, and each video is locked while it is processed. Only one backlog job runs at a time;
+    in backlog mode, the workers keep queueing eligible videos page by page until the backlog
+    or one of the budgets (max_videos, max_minutes, max_spend) runs out.
+    """
+    if request.backlog and not request.video_ids:
+        return await queue_transcription_backlog(request, db)
+
+    # Select the videos, leaving out those already queued or processing in another job
+    videos = await select_videos_for_processing(db, request.video_ids)
+    video_ids, active_video_ids = await VideoProcessingJobService.filter_processable_videos(
+        db, [str(video.id) for video in videos]
+    )
 
     # Create a job to track this process
     job_description = (
@@ -149,87 +128,130 @@ async def trigger_transcription_nlp(
         job_type=JobType.TRANSCRIPTION_NLP,
         title="Video Transcription & NLP Processing",
         description=job_description,
-        redis_lock_key=TRANSCRIPTION_NLP_LOCK,
+        total_items=len(video_ids),
         started_by="system",
         trigger_type=request.trigger_type
     )
     
-    # Create job and get the ID - use the session only for this
     job = await JobService.create_job(db, job_data)
-    job_id = job.id  # Store the job ID
-
-    # Set the lock with a 1-hour TTL (adjust as needed)
-    redis_client.setex(TRANSCRIPTION_NLP_LOCK, 3600, "locked")
-
-    async def run_pipeline():
-        start_time = time.time()
-        last_heartbeat = start_time
-        
-        # Create a new session for the background task
-        async with AsyncSessionLocal() as task_session:
-            try:
-                # Start the job
-                await JobService.start_job(task_session, job_id)
-                
-                # Initialize progress tracking
-                await JobService.update_progress(task_session, job_id, 0, 0)
-                
-                async def monitored_pipeline():
-                    nonlocal last_heartbeat
-                    
-                    # Use the task_session for all operations
-                    # Check for cancellation before starting
-                    current_job = await JobService.get_job(task_session, job_id)
-                    if current_job and current_job.cancellation_requested:
-                        await JobService.cancel_job(task_session, job_id, "Job cancelled by user request")
-                        redis_client.delete(TRANSCRIPTION_NLP_LOCK)
-                        return {"cancelled": True}
-                    
-                    # Heartbeat update
-                    await JobService.update_heartbeat(task_session, job_id)
-                    
-                    # Run pipeline with job tracking and video_ids
-                    result = await transcription_nlp_pipeline(task_session, video_ids=request.video_ids or [], job_id=job_id)
-                    return result
-                
-                result = await monitored_pipeline()
-                
-                if result and result.get("cancelled"):
-                    return
-                
-                if result and result.get("failed_videos") == result.get("total_videos"):
-                    raise Exception(f"Transcription and NLP pipeline completed with {result.get('failed_videos')} failures.")
-                
-                # Complete the job
-                elapsed_time = time.time() - start_time
-                result_data = json.dumps({
-                    "message": "Video transcription and NLP processing completed successfully",
-                    "elapsed_time": elapsed_time,
-                    "videos_processed": result.get("videos_processed", 0) if result else 0
-                })
-                await JobService.complete_job(task_session, job_id, result_data)
-                
-            except Exception as e:
-                # Check if it's a cancellation
-                if "cancelled" in str(e).lower():
-                    await JobService.cancel_job(task_session, job_id, str(e))
-                else:
-                    await JobService.fail_job(task_session, job_id, str(e))
-                raise
-            finally:
-                redis_client.delete(TRANSCRIPTION_NLP_LOCK)  # Release lock when done
-
-    task = asyncio.create_task(run_pipeline())
-    
+    job_id = job.id
+
+    if not video_ids:
+        result_data = json.dumps({
+            "message": "No videos to process",
+            "total_videos": 0,
+            "already_processing": len(active_video_ids)
+        })
+        await JobService.complete_job(db, job_id, result_data)
+        return {
+            "message": "No videos to process",
+            "job_id": str(job_id),
+            "video_count": 0,
+            "already_processing": len(active_video_ids)
+        }
+
+    try:
+        # Tasks become claimable once the job is running
+        await VideoProcessingJobService.enqueue_videos(db, video_ids, job_id)
+        await JobService.start_job(db, job_id)
+        await JobService.update_tracking_stats(db, job_id,
+            queue_size=len(video_ids),
+            items_in_progress=0,
+            failed_items=0
+        )
+    except Exception as e:
+        await JobService.fail_job(db, job_id, str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue videos: {str(e)}"
+        )
+
     response_message = (
-        f"Video transcription and NLP processing started for {len(request.video_ids)} specific videos"
+        f"Video transcription and NLP processing queued for {len(video_ids)} specific videos"
         if request.video_ids
-        else "Video transcription and NLP processing started in the background"
+        else f"Video transcription and NLP processing queued for {len(video_ids)} videos"
     )
     
     return {
         "message": response_message, 
-        "task_id": id(task),
         "job_id": str(job_id),
+        "video_count": len(video_ids),
+        "already_processing": len(active_video_ids)
+    }
+
+
+async def queue_transcription_backlog(request: TranscriptionRequest, db: AsyncSession):
+    """Start a backlog job; its videos are queued by the workers as they work through it."""
+    job_id = await lock_new_job(
+        TRANSCRIPTION_NLP_LOCK, "A video backlog is already being processed. Please wait until it completes."
+    )
+    budget = {
+        "max_videos": request.max_videos,
+        "max_minutes": request.max_minutes,
+        "max_spend": request.max_spend,
+    }
+    job_data = JobCreateRequest(
+        job_type=JobType.TRANSCRIPTION_NLP,
+        title="Video Transcription & NLP Backlog",
+        description=f"Processing the video backlog by {request.priority.value}",
+        redis_lock_key=TRANSCRIPTION_NLP_LOCK,
+        started_by="system",
+        trigger_type=request.trigger_type,
+        payload={"mode": "backlog", "priority": request.priority.value, **budget, "enqueued": 0, "cursor": None}
+    )
+
+    # A backlog may run for hours; the workers feeding it keep the lock alive until it finishes
+    try:
+        job = await JobService.create_job(db, job_data, job_id=job_id)
+        await JobService.start_job(db, job.id)
+    except Exception:
+        await unlock_new_job(TRANSCRIPTION_NLP_LOCK, job_id)
+        raise
+
+    return {
+        "message": f"Video transcription and NLP backlog queued by {request.priority.value}",
+        "job_id": str(job.id),
+        "budget": budget
+    }
+
+
+@router.post("/batch-extraction/")
+async def trigger_batch_extraction(
+    request: ScrapeRequest = ScrapeRequest(),
+    db: AsyncSession = Depends(get_async_db),
+    admin_user = Depends(get_current_admin)
+):
+    """Queue Batch API entity extraction of transcribed videos for a worker, with Redis lock and job tracking."""
+    job_id = await lock_new_job(
+        BATCH_EXTRACTION_LOCK, "Batch entity extraction is already running. Please wait until the current batch completes."
+    )
+
+    job_description = (
+        f"Batch entity extraction for {len(request.video_ids)} specific videos"
+        if request.video_ids
+        else "Batch entity extraction for transcribed videos without listings"
+    )
+
+    job_data = JobCreateRequest(
+        job_type=JobType.BATCH_EXTRACTION,
+        title="Batch Entity Extraction",
+        description=job_description,
+        redis_lock_key=BATCH_EXTRACTION_LOCK,
+        started_by="system",
+        trigger_type=request.trigger_type,
+        payload={"video_ids": request.video_ids or []}
+    )
+
+    # Batches may take up to the 24h completion window, plus ingestion; the worker's
+    # heartbeat keeps the lock alive meanwhile
+    try:
+        job = await JobService.create_job(db, job_data, job_id=job_id)
+    except Exception:
+        await unlock_new_job(BATCH_EXTRACTION_LOCK, job_id)
+        raise
+
+    return {
+        "message": "Batch entity extraction queued",
+        "job_id": str(job.id),
         "video_count": len(request.video_ids) if request.video_ids else None
     }
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from app.models import Restaurant, RestaurantTag, RestaurantCuisine, Tag, Cuisine, Listing
 from app.database import get_db, get_async_db
@@ -18,6 +18,9 @@ from app.api_schema.admin_restaurants import (
     RestaurantResponse as AdminRestaurantResponse
 )
 from app.services.google_places_service import fetch_restaurant_details_from_google
+from app.services.taxonomy import find_missing_ids
+from app.utils.photo_store import build_photo_url
+from app.utils.vocabulary_cache import tag_cache, cuisine_cache
 from app.utils.logging import setup_logger
 
 # Setup logging
@@ -67,7 +70,10 @@ async def create_restaurant(
             )
         
         # Create new restaurant with Google API data
+        restaurant_id = uuid4()
+        photo_reference = google_details["photo_reference"]
         new_restaurant = Restaurant(
+            id=restaurant_id,
             name=google_details["name"],
             address=google_details["address"],
             latitude=google_details["latitude"],
@@ -77,7 +83,8 @@ async def create_restaurant(
             google_place_id=google_details["google_place_id"],
             google_rating=google_details["google_rating"],
             business_status=google_details["business_status"],
-            photo_url=google_details["photo_url"],
+            photo_reference=photo_reference,
+            photo_url=build_photo_url(restaurant_id, photo_reference) if photo_reference else None,
             is_active=True
         )
         
@@ -309,16 +316,13 @@ async def update_restaurant_tags(
                 detail="Restaurant not found"
             )
         
-        # Verify all tags exist
-        for tag_id in tag_update.tag_ids:
-            tag_query = select(Tag).filter(Tag.id == tag_id)
-            tag_result = await db.execute(tag_query)
-            tag = tag_result.scalars().first()
-            if not tag:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Tag with ID {tag_id} not found"
-                )
+        # Verify all tags exist (checked against the tag vocabulary cache)
+        missing_tag_ids = await find_missing_ids(db, Tag, tag_update.tag_ids, tag_cache)
+        if missing_tag_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Tag with ID {missing_tag_ids[0]} not found"
+            )
         
         # Remove existing tags
         delete_stmt = delete(RestaurantTag).where(RestaurantTag.restaurant_id == restaurant_id)
@@ -365,16 +369,13 @@ async def update_restaurant_cuisines(
                 detail="Restaurant not found"
             )
         
-        # Verify all cuisines exist
-        for cuisine_id in cuisine_update.cuisine_ids:
-            cuisine_query = select(Cuisine).filter(Cuisine.id == cuisine_id)
-            cuisine_result = await db.execute(cuisine_query)
-            cuisine = cuisine_result.scalars().first()
-            if not cuisine:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Cuisine with ID {cuisine_id} not found"
-                )
+        # Verify all cuisines exist (checked against the cuisine vocabulary cache)
+        missing_cuisine_ids = await find_missing_ids(db, Cuisine, cuisine_update.cuisine_ids, cuisine_cache)
+        if missing_cuisine_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Cuisine with ID {missing_cuisine_ids[0]} not found"
+            )
         
         # Remove existing cuisines
         delete_stmt = delete(RestaurantCuisine).where(RestaurantCuisine.restaurant_id == restaurant_id)
@@ -9,6 +9,7 @@ from app.api_schema.tags import TagCreate, TagUpdate, TagResponse
 from app.database import get_async_db
 from app.dependencies import get_current_admin
 from app.models.tag import Tag
+from app.utils.vocabulary_cache import publish_invalidation
 
 admin_tags_router = APIRouter()
 
@@ -82,6 +83,8 @@ async def update_tag(
 
         await db.commit()
         await db.refresh(existing_tag)
+        # Names are cached by every process; drop the stale name -> id entries
+        await publish_invalidation("tags")
         return existing_tag
     except HTTPException:
         raise
@@ -111,6 +114,7 @@ async def delete_tag(
 
         await db.execute(delete(Tag).filter(Tag.id == tag_id))
         await db.commit()
+        await publish_invalidation("tags")
         
         return {"message": "Tag deleted successfully"}
     except HTTPException:
@@ -15,6 +15,7 @@ from app.api_schema.tags import TagResponse
 from app.api_schema.listings import ListingLightResponse
 from app.api_schema.influencers import InfluencerResponse
 from app.utils.logging import setup_logger
+from app.utils.vocabulary_cache import publish_invalidation
 
 logger = setup_logger(__name__)
 
@@ -71,6 +72,7 @@ async def update_cuisine(cuisine_id: UUID, cuisine: CuisineUpdate, db: AsyncSess
         db_cuisine.name = cuisine.name
         await db.commit()
         await db.refresh(db_cuisine)
+        await publish_invalidation("cuisines")
         return db_cuisine
     except HTTPException:
         raise
@@ -89,6 +91,7 @@ async def delete_cuisine(cuisine_id: UUID, db: AsyncSession = Depends(get_async_
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cuisine not found")
         await db.delete(db_cuisine)
         await db.commit()
+        await publish_invalidation("cuisines")
         return
     except HTTPException:
         raise
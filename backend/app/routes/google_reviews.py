@@ -2,20 +2,65 @@ from typing import Dict, Any
 
 from fastapi import APIRouter, HTTPException, Query
 
-from googlemaps import Client as GoogleMapsClient
-from googlemaps.exceptions import ApiError
-
-from app.config import GOOGLE_MAPS_API_KEY
+from app.config import GOOGLE_MAPS_API_KEY, GOOGLE_REVIEWS_FRESH_TTL, GOOGLE_REVIEWS_MAX_AGE
 from app.utils.logging import setup_logger
+from app.utils.google_maps_client import GoogleMapsError, get_google_maps_client
+from app.utils.swr_cache import StaleWhileRevalidateCache
 
 # Setup logging
 logger = setup_logger(__name__)
 
-# Initialize Google Maps client
-gmaps = GoogleMapsClient(key=GOOGLE_MAPS_API_KEY)
-
 router = APIRouter()
 
+# Reviews are served from Redis and refreshed in the background once older than the fresh TTL
+reviews_cache = StaleWhileRevalidateCache("google_reviews", GOOGLE_REVIEWS_FRESH_TTL, GOOGLE_REVIEWS_MAX_AGE)
+
+
+async def fetch_google_reviews(place_id: str) -> Dict[str, Any]:
+    """Fetch rating, rating count and the 3 most recent reviews of a place from Places Details."""
+    place_details = await get_google_maps_client().place(
+        place_id,
+        fields=["reviews", "rating", "user_ratings_total"],
+        language="en"
+    )
+    if place_details.get("status") in ("NOT_FOUND", "ZERO_RESULTS"):
+        raise GoogleMapsError("NOT_FOUND")
+
+    # Extract reviews and rating data from the response
+    result = place_details.get("result", {})
+    reviews = result.get("reviews", [])
+
+    # Sort reviews by time (most recent first) and limit to 3
+    sorted_reviews = sorted(
+        reviews, 
+        key=lambda x: x.get("time", 0), 
+        reverse=True
+    )[:3]
+
+    # Clean and format the response
+    formatted_reviews = []
+    for review in sorted_reviews:
+        formatted_review = {
+            "author_name": review.get("author_name", "Anonymous"),
+            "author_url": review.get("author_url"),
+            "language": review.get("language", "en"),
+            "profile_photo_url": review.get("profile_photo_url", ""),
+            "rating": review.get("rating", 0),
+            "relative_time_description": review.get("relative_time_description", ""),
+            "text": review.get("text", ""),
+            "time": review.get("time", 0)
+        }
+        formatted_reviews.append(formatted_review)
+
+    logger.info(f"Fetched {len(formatted_reviews)} reviews for place ID {place_id}")
+
+    return {
+        "reviews": formatted_reviews,
+        "rating": result.get("rating", 0),
+        "user_ratings_total": result.get("user_ratings_total", 0)
+    }
+
+
 @router.get("/")
 async def get_google_reviews(
     place_id: str = Query(..., description="Google Place ID for the restaurant")
@@ -23,6 +68,7 @@ async def get_google_reviews(
     """
     Fetch Google Maps reviews for a restaurant using Google Places API.
     Returns the 3 most recent reviews with proper error handling.
+    Reviews are cached per place ID with stale-while-revalidate refreshes.
     """
     
     if not GOOGLE_MAPS_API_KEY:
@@ -39,53 +85,16 @@ async def get_google_reviews(
         )
     
     try:
-        # Use Google Maps client to get place details with reviews
-        place_details = gmaps.place(
-            place_id=place_id,
-            fields=["reviews", "rating", "user_ratings_total"],
-            language="en"
-        )
-        
-        # Extract reviews and rating data from the response
-        result = place_details.get("result", {})
-        reviews = result.get("reviews", [])
-        rating = result.get("rating", 0)
-        user_ratings_total = result.get("user_ratings_total", 0)
-        
-        # Sort reviews by time (most recent first) and limit to 3
-        sorted_reviews = sorted(
-            reviews, 
-            key=lambda x: x.get("time", 0), 
-            reverse=True
-        )[:3]
-        
-        # Clean and format the response
-        formatted_reviews = []
-        for review in sorted_reviews:
-            formatted_review = {
-                "author_name": review.get("author_name", "Anonymous"),
-                "author_url": review.get("author_url"),
-                "language": review.get("language", "en"),
-                "profile_photo_url": review.get("profile_photo_url", ""),
-                "rating": review.get("rating", 0),
-                "relative_time_description": review.get("relative_time_description", ""),
-                "text": review.get("text", ""),
-                "time": review.get("time", 0)
-            }
-            formatted_reviews.append(formatted_review)
-        
-        logger.info(f"Fetched {len(formatted_reviews)} reviews for place ID {place_id}")
-        
+        # Served from the cache; stale entries are refreshed in the background
+        result, cache_info = await reviews_cache.get(place_id, lambda: fetch_google_reviews(place_id))
+        logger.info(f"Served reviews for place ID {place_id} (cached={cache_info['cached']}, age={cache_info['age']}s)")
+
         return {
             "status": "OK",
-            "result": {
-                "reviews": formatted_reviews,
-                "rating": rating,
-                "user_ratings_total": user_ratings_total
-            }
+            "result": result
         }
         
-    except ApiError as e:
+    except GoogleMapsError as e:
         logger.error(f"Google Maps API error: {str(e)}")
         
         # Handle specific Google API errors based on status
@@ -0,0 +1,59 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import PHOTO_STORAGE_DIR
+from app.models import Restaurant
+from app.database import get_async_db
+from app.utils.logging import setup_logger
+from app.utils.google_maps_client import GoogleMapsError
+from app.utils.photo_store import (
+    DEFAULT_VARIANT,
+    PHOTO_CACHE_CONTROL,
+    PHOTO_VARIANTS,
+    PhotoStore,
+    photo_etag,
+)
+
+logger = setup_logger(__name__)
+
+router = APIRouter()
+
+# Photos are downloaded from Google once per photo reference and served from disk afterwards
+photo_store = PhotoStore(PHOTO_STORAGE_DIR)
+
+
+@router.get("/{restaurant_id}")
+async def get_restaurant_photo(
+    restaurant_id: UUID,
+    request: Request,
+    variant: str = Query(DEFAULT_VARIANT, description=f"One of: {', '.join(PHOTO_VARIANTS)}"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Serve a restaurant's Google photo as a resized WebP variant.
+    Responses are cacheable for a year and revalidated with ETags.
+    """
+    if variant not in PHOTO_VARIANTS:
+        raise HTTPException(status_code=400, detail=f"Unknown photo variant '{variant}'")
+
+    result = await db.execute(select(Restaurant.photo_reference).where(Restaurant.id == restaurant_id))
+    photo_reference = result.scalar_one_or_none()
+    if not photo_reference:
+        raise HTTPException(status_code=404, detail="Restaurant photo not found")
+
+    etag = photo_etag(photo_reference, variant)
+    headers = {"Cache-Control": PHOTO_CACHE_CONTROL, "ETag": etag}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        content = await photo_store.get(photo_reference, variant)
+    except GoogleMapsError as e:
+        logger.error(f"Failed to download photo for restaurant {restaurant_id}: {e}")
+        raise HTTPException(status_code=502, detail="Could not load restaurant photo from Google")
+
+    return Response(content=content, media_type="image/webp", headers=headers)
@@ -14,6 +14,7 @@ from app.api_schema.cuisines import CuisineResponse
 from app.api_schema.listings import ListingLightResponse
 from app.api_schema.influencers import InfluencerResponse
 from app.utils.logging import setup_logger
+from app.utils.vocabulary_cache import publish_invalidation
 
 logger = setup_logger(__name__)
 
@@ -92,6 +93,7 @@ async def update_tag(tag_id: UUID, tag: TagUpdate, db: AsyncSession = Depends(ge
         setattr(db_tag, key, value)
     await db.commit()
     await db.refresh(db_tag)
+    await publish_invalidation("tags")
     return db_tag
 
 
@@ -103,6 +105,7 @@ async def delete_tag(tag_id: UUID, db: AsyncSession = Depends(get_async_db)):
         raise HTTPException(status_code=404, detail="Tag not found")
     await db.delete(tag)
     await db.commit()
+    await publish_invalidation("tags")
     return {"message": "Tag deleted successfully"}
 
 
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import (APIRouter, Depends, HTTPException)
+from fastapi import (APIRouter, Depends, HTTPException, Query)
 from pydantic import BaseModel
 
 from sqlalchemy.orm import Session, joinedload
@@ -8,8 +8,9 @@ from sqlalchemy import func
 
 from app.models import (Video, Influencer, Listing)
 from app.database import get_db
-from app.api_schema.videos import VideoResponse, VideosResponse
+from app.api_schema.videos import VideoResponse, VideosResponse, TranscriptSegmentsResponse
 from app.api_schema.influencers import InfluencerLightResponse
+from app.utils.transcript_utils import filter_segments
 
 router = APIRouter()
 
@@ -177,3 +178,27 @@ def get_video(video_id: str, db: Session = Depends(get_db)):
     except Exception as e:
         print(f"Error fetching video {video_id}: {e}")
         raise HTTPException(status_code=500, detail="Internal server error while fetching video")
+
+
+@router.get("/{video_id}/segments/", response_model=TranscriptSegmentsResponse)
+def get_video_segments(
+    video_id: str,
+    start: Optional[float] = Query(None, ge=0, description="Only segments ending after this time (seconds)"),
+    end: Optional[float] = Query(None, ge=0, description="Only segments starting before this time (seconds)"),
+    q: Optional[str] = Query(None, description="Only segments containing this phrase"),
+    db: Session = Depends(get_db)
+):
+    """Get the timestamped transcript segments of a video, optionally narrowed to a time range or phrase."""
+    try:
+        row = db.query(Video.id, Video.transcript_segments).filter(Video.id == video_id).first()
+
+        if not row:
+            raise HTTPException(status_code=404, detail="Video not found")
+
+        segments = filter_segments(row.transcript_segments, start=start, end=end, query=q)
+        return TranscriptSegmentsResponse(video_id=row.id, segments=segments, total=len(segments))
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error fetching segments for video {video_id}: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error while fetching video segments")
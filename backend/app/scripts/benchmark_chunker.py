@@ -0,0 +1,98 @@
+"""
+Report how transcripts are split into GPT extraction chunks.
+
+Compares the token-aware chunker against the previous fixed 4000-character split,
+printing chunks and tokens per video.
+
+Usage:
+    python -m app.scripts.benchmark_chunker --limit 20
+    python -m app.scripts.benchmark_chunker --file transcript.txt --budget 2500 --overlap 150
+"""
+import argparse
+import textwrap
+from typing import List, Tuple
+
+from app.config import CHUNK_TOKEN_BUDGET, CHUNK_OVERLAP_TOKENS, GPT_MODEL
+from app.utils.text_chunker import chunk_text, get_token_counter
+
+LEGACY_CHUNK_CHARS = 4000
+
+
+def benchmark_transcript(transcription: str, budget: int, overlap: int) -> dict:
+    """Chunk one transcript both ways and collect chunk/token statistics."""
+    count_tokens = get_token_counter(GPT_MODEL)
+
+    legacy_chunks = textwrap.wrap(
+        transcription, LEGACY_CHUNK_CHARS, break_long_words=False, break_on_hyphens=False
+    )
+    chunks = chunk_text(transcription, budget, overlap, count_tokens=count_tokens)
+    chunk_tokens = [count_tokens(chunk) for chunk in chunks]
+
+    return {
+        "transcript_tokens": count_tokens(transcription),
+        "legacy_chunks": len(legacy_chunks),
+        "chunks": len(chunks),
+        "avg_chunk_tokens": round(sum(chunk_tokens) / len(chunks), 1) if chunks else 0,
+        "max_chunk_tokens": max(chunk_tokens) if chunk_tokens else 0,
+        "fill_ratio": round(sum(chunk_tokens) / (len(chunks) * budget), 3) if chunks else 0,
+    }
+
+
+def load_transcripts(limit: int) -> List[Tuple[str, str]]:
+    """Load (youtube_video_id, transcription) pairs of transcribed videos from the database."""
+    from app.database import SyncSessionLocal
+    from app.models import Video
+
+    db = SyncSessionLocal()
+    try:
+        rows = (
+            db.query(Video.youtube_video_id, Video.transcription)
+            .filter(Video.transcription.isnot(None))
+            .order_by(Video.published_at.desc())
+            .limit(limit)
+            .all()
+        )
+        return [(row.youtube_video_id, row.transcription) for row in rows]
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=20, help="Number of transcribed videos to load")
+    parser.add_argument("--file", help="Benchmark a local transcript file instead of the database")
+    parser.add_argument("--budget", type=int, default=CHUNK_TOKEN_BUDGET, help="Token budget per chunk")
+    parser.add_argument("--overlap", type=int, default=CHUNK_OVERLAP_TOKENS, help="Overlap tokens between chunks")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            transcripts = [(args.file, f.read())]
+    else:
+        transcripts = load_transcripts(args.limit)
+
+    print(f"Model: {GPT_MODEL} | budget: {args.budget} tokens | overlap: {args.overlap} tokens\n")
+    print(f"{'video':<20} {'tokens':>8} {'legacy':>7} {'chunks':>7} {'avg tok':>8} {'max tok':>8} {'fill':>6}")
+
+    totals = {"transcript_tokens": 0, "legacy_chunks": 0, "chunks": 0}
+    for video_id, transcription in transcripts:
+        stats = benchmark_transcript(transcription, args.budget, args.overlap)
+        for key in totals:
+            totals[key] += stats[key]
+        print(
+            f"{video_id[:20]:<20} {stats['transcript_tokens']:>8} {stats['legacy_chunks']:>7} "
+            f"{stats['chunks']:>7} {stats['avg_chunk_tokens']:>8} {stats['max_chunk_tokens']:>8} {stats['fill_ratio']:>6}"
+        )
+
+    if transcripts:
+        print(
+            f"\nTotal: {len(transcripts)} videos, {totals['transcript_tokens']} tokens, "
+            f"{totals['legacy_chunks']} legacy chunks -> {totals['chunks']} chunks "
+            f"({totals['chunks'] / len(transcripts):.2f} GPT calls per video)"
+        )
+    else:
+        print("No transcripts found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Report precision/recall of the chunk pre-filter against labeled transcript chunks.
+
+Each sample is {"text", "has_place", "description"}; a chunk counts as selected when its
+score reaches the threshold (neighbor expansion is not applied here). Samples should be
+whole transcript chunks of about CHUNK_TOKEN_BUDGET tokens, the size the pipeline scores:
+results on short snippets do not carry over.
+
+Usage:
+    python -m app.scripts.evaluate_chunk_filter
+    python -m app.scripts.evaluate_chunk_filter --fixtures labeled.json --threshold 1.5 2 2.5 3
+"""
+import argparse
+import json
+from pathlib import Path
+
+from app.config import CHUNK_FILTER_THRESHOLD, CHUNK_TOKEN_BUDGET
+from app.utils.chunk_filter import evaluate_filter
+from app.utils.text_chunker import count_tokens_locally
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parents[2] / "tests" / "fixtures" / "chunk_filter_samples.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="JSON file of labeled chunks")
+    parser.add_argument("--threshold", type=float, nargs="+", default=[CHUNK_FILTER_THRESHOLD], help="Score thresholds to evaluate")
+    args = parser.parse_args()
+
+    with open(args.fixtures, encoding="utf-8") as f:
+        samples = json.load(f)
+
+    average_tokens = sum(count_tokens_locally(s["text"]) for s in samples) / len(samples) if samples else 0
+    print(f"Samples: {len(samples)} ({sum(1 for s in samples if s['has_place'])} with a place), "
+          f"~{average_tokens:.0f} tokens on average (pipeline chunks: {CHUNK_TOKEN_BUDGET})")
+    if average_tokens < CHUNK_TOKEN_BUDGET / 2:
+        print("Warning: samples are much shorter than pipeline chunks, results may not carry over")
+    print()
+    print(f"{'threshold':>9} {'precision':>10} {'recall':>7} {'selected':>9}")
+    for threshold in args.threshold:
+        stats = evaluate_filter(samples, threshold)
+        print(f"{threshold:>9} {stats['precision']:>10} {stats['recall']:>7} {stats['selected_rate']:>9}")
+
+
+if __name__ == "__main__":
+    main()
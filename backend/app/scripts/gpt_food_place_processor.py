@@ -3,34 +3,35 @@ import json
 import textwrap
 import librosa
 import soundfile as sf
-from openai import OpenAI
 from pathlib import Path
-
-from app.config import CHUNK_SIZE, TOKEN_SIZE, OPENAI_API_KEY
+from typing import Any, Iterable, List, Optional, Tuple
+
+from app.config import (
+    CHUNK_FILTER_ENABLED,
+    CHUNK_FILTER_NEIGHBORS,
+    CHUNK_FILTER_THRESHOLD,
+    CHUNK_OVERLAP_TOKENS,
+    CHUNK_TOKEN_BUDGET,
+    GPT_MODEL,
+    PROMPT_VERSION,
+    TOKEN_SIZE,
+)
 from app.utils.logging import setup_logger
 from app.utils.audio_analyzer import cleanup_temp_files
+from app.utils.transcript_utils import compact_segments
+from app.utils.text_chunker import chunk_text, get_token_counter
+from app.utils.openai_client import TokenUsage, get_openai_governor
+from app.utils.extraction_cache import extraction_cache_key, get_cached_entities, set_cached_entities
+from app.utils.chunk_filter import select_candidate_chunks
+from app.utils.entity_merger import merge_entities
+from app.utils.entity_parser import FOOD_PLACES_RESPONSE_FORMAT, PARSE_DROPPED, PARSE_SALVAGED, parse_entities
 
 logger = setup_logger(__name__)
 
 
-class GPTFoodPlaceProcessor:
-    """A class to transcribe audio and extract food-related entities from transcriptions using GPT-4.1."""
-
-    def __init__(self, chunk_size=CHUNK_SIZE):
-        """
-        Initialize the GPTFoodPlaceProcessor.
-
-        Args:
-            openai_client: The OpenAI client instance for API calls
-            chunk_size: Maximum size of each transcript chunk (default: 1000)
-        """
-        # Initialize clients with custom HTTP settings
-        openai_client = OpenAI(api_key=OPENAI_API_KEY)
-        self.openai_client = openai_client
-        self.token_size = TOKEN_SIZE
-
-        self.chunk_size = chunk_size
-        self.system_prompt = """
+# Static extraction instructions. Kept byte-identical across requests and sent first so the
+# provider can serve it from its prompt cache; bump PROMPT_VERSION whenever it changes.
+SYSTEM_PROMPT = textwrap.dedent("""
         You are a food data extraction assistant. Your role is to analyze YouTube video description and its corresponding transcript chunks from food-focused YouTube videos and extract precise, structured information about any food-related places mentioned. This includes any restaurant, food stall, farm, food producer, or culinary establishment clearly referenced in the transcript.
 
         # Your objectives:
@@ -87,6 +88,7 @@ class GPTFoodPlaceProcessor:
         - Always preserve quotation marks for any direct quotes captured in the "quotes" field.
         - Do not include any non-JSON content, explanations, or commentary.
         - Strictly adhere to valid JSON syntax and all schema conventions below.
+        - When a response schema is enforced, return the array as the "places" field of a JSON object: {"places": [...]}.
 
         # Examples
         **Example 1**
@@ -247,7 +249,102 @@ class GPTFoodPlaceProcessor:
                 ~ “Eggs and mushrooms are longtime friends in gastronomy. But this one is on another level. Very sophisticated with intense and delicate flavors. I love it. The wine is hand in hand with the dish. My favorite pairing so far.”
                 ~ “Hearing back on tour, suckling pig is an old timer thing. I don't even bother with the fork and knife. I wanted to bite in it like a sandwich... I think this is one of my favorite main courses in my life.”
                 ~ “Chef José did an incredible job showcasing amazing Portuguese ingredients. You could feel the DNA of Portuguese tradition running through the entire menu.”
+        """).strip()
+
+
+class GPTFoodPlaceProcessor:
+    """A class to transcribe audio and extract food-related entities from transcriptions using GPT-4.1."""
+
+    def __init__(
+        self,
+        chunk_tokens=CHUNK_TOKEN_BUDGET,
+        overlap_tokens=CHUNK_OVERLAP_TOKENS,
+        usage: Optional[TokenUsage] = None,
+        use_cache: bool = True,
+        use_filter: bool = CHUNK_FILTER_ENABLED,
+    ):
+        """
+        Initialize the GPTFoodPlaceProcessor.
+
+        Args:
+            chunk_tokens: Token budget for each transcript chunk (default: CHUNK_TOKEN_BUDGET)
+            overlap_tokens: Tokens shared between consecutive chunks (default: CHUNK_OVERLAP_TOKENS)
+            usage: Token usage accumulator shared by the calling job (default: a new one)
+            use_cache: Reuse stored extraction results for unchanged chunks (default: True)
+            use_filter: Only send chunks the pre-filter flags as likely place mentions (default: CHUNK_FILTER_ENABLED)
         """
+        # All processors share one AsyncOpenAI client, concurrency limit and rate-limit budget
+        self.openai = get_openai_governor()
+        self.usage = usage if usage is not None else TokenUsage()
+        self.token_size = TOKEN_SIZE
+
+        self.model = GPT_MODEL
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.system_prompt = SYSTEM_PROMPT
+        self.use_cache = use_cache
+        self.use_filter = use_filter
+
+    def build_messages(self, description: str, chunk: str, index: int, total_chunks: int) -> list:
+        """
+        Build the chat messages for one chunk, ordered from most to least stable.
+
+        The static system prompt comes first (shared by every request), then the video
+        description (shared by every chunk of the same video), and only then the chunk
+        itself, so the longest possible prefix can be served from the prompt cache.
+        """
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": f"Description: {description or ''}"},
+            {"role": "user", "content": f"Transcription Chunk {index+1}/{total_chunks}:\n{chunk}"},
+        ]
+
+    def build_request(self, description: str, chunk: str, index: int, total_chunks: int) -> dict:
+        """Build the chat completion parameters for one chunk (live calls and batch files alike)."""
+        return {
+            "model": self.model,
+            "temperature": 0.25,
+            "max_tokens": self.token_size,
+            "top_p": 0.85,
+            "messages": self.build_messages(description, chunk, index, total_chunks),
+            "response_format": FOOD_PLACES_RESPONSE_FORMAT,
+            "prompt_cache_key": f"food-place-extraction-{PROMPT_VERSION}",
+        }
+
+    def parse_response(self, response: Any, index: int) -> Tuple[list, bool]:
+        """
+        Parse a chat completion for one chunk and record its outcome on the usage counters.
+
+        Args:
+            response: ChatCompletion returned by the API (or rebuilt from a batch output line)
+            index: The index of the chunk
+
+        Returns:
+            Tuple of (entities, cacheable); salvaged or failed answers are not cacheable
+        """
+        self.usage.add(response.usage)
+        choice = response.choices[0]
+        if getattr(choice.message, "refusal", None):
+            logger.warning(f"Chunk {index+1} refused: {choice.message.refusal}")
+            self.usage.dropped_chunks += 1
+            return [], False
+
+        content = choice.message.content or ""
+        entities, status = parse_entities(content)
+        if status == PARSE_DROPPED:
+            logger.error(
+                f"Unparseable response for chunk {index+1} (finish_reason={choice.finish_reason}) | Content: {content}"
+            )
+            self.usage.dropped_chunks += 1
+            return [], False
+        if status == PARSE_SALVAGED:
+            # Truncated answers are not cached, so a later run with more room can do better
+            logger.warning(
+                f"Salvaged {len(entities)} entities from chunk {index+1} (finish_reason={choice.finish_reason})"
+            )
+            self.usage.salvaged_chunks += 1
+            return entities, False
+        return entities, True
 
     async def process_chunk(
         self, description: str, chunk: str, index: int, total_chunks: int
@@ -261,75 +358,111 @@ class GPTFoodPlaceProcessor:
             total_chunks: Total number of chunks
 
         Returns:
-            List of extracted entities for this chunk
+            List of extracted entities for this chunk, validated against the entity schema
         """
-        user_prompt = f"""
-        Description: {description}
+        cache_key = extraction_cache_key(self.model, PROMPT_VERSION, description, chunk)
+        if self.use_cache:
+            cached = await get_cached_entities(cache_key)
+            if cached is not None:
+                logger.info(f"Extraction cache hit for chunk {index+1}/{total_chunks}")
+                self.usage.cached_chunks += 1
+                return cached
 
-        Transcription Chunk {index+1}/{total_chunks}:
-        {chunk}
-        """
-
-        logger.info(f"Processing chunk {index+1}/{total_chunks}: {user_prompt}")
+        logger.info(f"Processing chunk {index+1}/{total_chunks}: {chunk[:255]}...")
 
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.openai_client.chat.completions.create(
-                    model="gpt-4.1",
-                    temperature=0.25,
-                    max_tokens=self.token_size,
-                    top_p=0.85,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                ),
+            response = await self.openai.chat_completion(
+                **self.build_request(description, chunk, index, total_chunks)
             )
-            content = response.choices[0].message.content.strip()
-            try:
-                parsed = json.loads(content)
-                if isinstance(parsed, list):
-                    return parsed
-                elif isinstance(parsed, dict):
-                    return [parsed]
-                else:
-                    logger.warning(f"Unexpected format in chunk {index+1}: {content}")
-                    return []
-            except json.JSONDecodeError as je:
-                logger.error(
-                    f"JSON decode failed for chunk {index+1}: {je} | Content: {content}"
-                )
-                return []
         except Exception as e:
             logger.error(f"Chunk {index+1} processing failed: {e}")
+            self.usage.dropped_chunks += 1
             return []
 
-    async def extract_entities(self, description: str, transcription: str) -> list:
+        entities, cacheable = self.parse_response(response, index)
+        if cacheable:
+            await set_cached_entities(cache_key, entities)
+        return entities
+
+    def chunk_transcription(self, transcription: str) -> list:
         """
-        Extract food-related entities from a transcription.
+        Split a transcription into sentence-aligned chunks close to the token budget.
 
         Args:
-            transcription: The full transcription text to process
+            transcription: The full transcription text
 
         Returns:
-            List of extracted entities in JSON format
+            List of chunk strings, consecutive chunks overlapping by up to overlap_tokens
         """
-        # Split into manageable chunks
-        chunks = textwrap.wrap(
+        return chunk_text(
             transcription,
-            self.chunk_size,
-            break_long_words=False,
-            break_on_hyphens=False,
+            self.chunk_tokens,
+            self.overlap_tokens,
+            count_tokens=get_token_counter(self.model),
         )
 
-        # Process chunks concurrently
-        tasks = [
-            self.process_chunk(description, chunk, idx, len(chunks))
-            for idx, chunk in enumerate(chunks)
-        ]
-        results = await asyncio.gather(*tasks)
+    def select_chunks(self, description: str, chunks: List[str], known_names: Iterable[str] = ()) -> List[int]:
+        """
+        Indices of the chunks to send to the extractor.
+
+        With the pre-filter enabled, only chunks scoring as likely place mentions (and
+        their neighbors) are kept; the rest are counted as skipped. ``known_names``
+        (restaurants already in the database) count as place names in the scoring.
+        """
+        if not self.use_filter:
+            return list(range(len(chunks)))
+        selected = select_candidate_chunks(
+            chunks, description, threshold=CHUNK_FILTER_THRESHOLD, neighbors=CHUNK_FILTER_NEIGHBORS,
+            known_names=known_names,
+        )
+        self.usage.skipped_chunks += len(chunks) - len(selected)
+        logger.info(f"Pre-filter kept {len(selected)}/{len(chunks)} chunks")
+        return selected
+
+    async def extract_entities(self, description: str, transcription: str, known_names: Iterable[str] = ()) -> list:
+        """
+        Extract food-related entities from a transcription.
+
+        When the pre-filter skipped chunks and the ones sent yield no place, the skipped
+        chunks are sent too, so "no places" is always the extractor's answer for the
+        whole transcript.
+
+        Args:
+            transcription: The full transcription text to process
+            known_names: Restaurant names for the pre-filter (see select_chunks)
+
+        Returns:
+            List of extracted entities in JSON format, one per distinct place
+        """
+        chunks = self.chunk_transcription(transcription)
+        selected = self.select_chunks(description, chunks, known_names)
+
+        # Process candidate chunks concurrently
+        results = await asyncio.gather(*[
+            self.process_chunk(description, chunks[idx], idx, len(chunks)) for idx in selected
+        ])
+        entities = self.combine_chunk_results(results)
+
+        skipped = sorted(set(range(len(chunks))) - set(selected))
+        if not entities and skipped:
+            logger.info(f"No places in the {len(selected)} pre-filtered chunks, sending the other {len(skipped)}")
+            self.usage.skipped_chunks -= len(skipped)
+            results = await asyncio.gather(*[
+                self.process_chunk(description, chunks[idx], idx, len(chunks)) for idx in skipped
+            ])
+            entities = self.combine_chunk_results(results)
+        return entities
+
+    def combine_chunk_results(self, results: List[list]) -> list:
+        """
+        Flatten per-chunk entity lists of one video into one entity per distinct place.
+
+        Args:
+            results: Entity lists, one per chunk in transcript order
 
+        Returns:
+            List of merged entities
+        """
         # Flatten results and filter valid entities
         flat_results = [
             entity
@@ -338,20 +471,45 @@ class GPTFoodPlaceProcessor:
             if entity and entity.get("restaurant_name") is not None
         ]
 
+        # The same place is often mentioned in several (overlapping) chunks
+        merged_results = merge_entities(flat_results)
+
         logger.info(
-            f"Processed {len(flat_results)} entities: {json.dumps(flat_results, indent=2)}"
+            f"Processed {len(merged_results)} entities: {json.dumps(merged_results, indent=2)}"
         )
 
-        return flat_results
+        return merged_results
 
-    async def transcribe_audio(self, audio_path: str) -> str:
+    async def _transcribe_file(self, file_path: Path, offset: float = 0.0) -> Tuple[str, List[dict]]:
+        """Transcribe a single audio file (<= 25MB) with segment-level timestamps.
+
+        Args:
+            file_path: Path to the audio file.
+            offset: Seconds to add to segment times (position of this file in the full audio).
+
+        Returns:
+            Tuple of (transcribed text, compact segments).
+        """
+        with open(file_path, "rb") as audio_file:
+            response = await self.openai.transcription(
+                model="whisper-1",
+                file=audio_file,
+                response_format="verbose_json",
+                timestamp_granularities=["segment"],
+            )
+        self.usage.audio_seconds += getattr(response, "duration", None) or 0
+        return response.text.strip(), compact_segments(response.segments, offset=offset)
+
+    async def transcribe_audio(self, audio_path: str, keep_audio_on_error: bool = False) -> Tuple[str, List[dict]]:
         """Transcribe audio using OpenAI's Whisper API, splitting if over 25MB.
 
         Args:
             audio_path: Path to the audio file to transcribe.
+            keep_audio_on_error: Leave the audio file in place when transcription fails,
+                so a retry does not need to download it again.
 
         Returns:
-            The transcribed text as a string.
+            Tuple of (transcribed text, list of {"start", "end", "text"} segments).
 
         Raises:
             Exception: If transcription fails.
@@ -359,6 +517,7 @@ class GPTFoodPlaceProcessor:
         loop = asyncio.get_event_loop()
         audio_file_path = Path(audio_path)
         temp_dir = audio_file_path.parent
+        succeeded = False
 
         try:
             logger.info(f"Transcribing audio {audio_path}")
@@ -372,12 +531,11 @@ class GPTFoodPlaceProcessor:
 
                 # Load audio with librosa
                 audio, sr = librosa.load(audio_path, sr=None)
-                duration_s = len(audio) / sr
                 chunk_length_s = 600  # 10-minute chunks
                 samples_per_chunk = int(chunk_length_s * sr)
                 chunks = []
 
-                # Split audio into chunks
+                # Split audio into chunks, remembering where each one starts
                 for i in range(0, len(audio), samples_per_chunk):
                     chunk = audio[i : i + samples_per_chunk]
                     chunk_path = (
@@ -386,46 +544,39 @@ class GPTFoodPlaceProcessor:
                     )
                     sf.write(chunk_path, chunk, sr, format="mp3")
                     if chunk_path.stat().st_size / (1024 * 1024) <= 25:
-                        chunks.append(chunk_path)
+                        chunks.append((chunk_path, i / sr))
                     else:
                         logger.warning(f"Chunk {chunk_path} still too large, skipping")
 
                 # Transcribe each chunk
                 transcription = ""
-                for chunk_path in chunks:
-                    with open(chunk_path, "rb") as chunk_file:
-                        chunk_transcription = await loop.run_in_executor(
-                            None,
-                            lambda: self.openai_client.audio.transcriptions.create(
-                                model="whisper-1",
-                                file=chunk_file,
-                                response_format="text",
-                            ),
-                        )
-                        transcription += chunk_transcription + " "
+                segments = []
+                for chunk_path, chunk_offset in chunks:
+                    chunk_transcription, chunk_segments = await self._transcribe_file(
+                        chunk_path, offset=chunk_offset
+                    )
+                    transcription += chunk_transcription + " "
+                    segments.extend(chunk_segments)
 
                     # Clean up chunk file
                     chunk_path.unlink()
 
                 logger.info(f"Transcription completed for {audio_path}")
-                return transcription.strip()
+                succeeded = True
+                return transcription.strip(), segments
 
             # Original transcription for files under 25MB
-            with open(audio_file_path, "rb") as audio_file:
-                transcription = await loop.run_in_executor(
-                    None,
-                    lambda: self.openai_client.audio.transcriptions.create(
-                        model="whisper-1", file=audio_file, response_format="text"
-                    ),
-                )
+            transcription, segments = await self._transcribe_file(audio_file_path)
             logger.info(f"Transcription completed for {audio_path}: {transcription}")
-            return transcription
+            succeeded = True
+            return transcription, segments
 
         except Exception as e:
             logger.error(f"Error transcribing audio {audio_path}: {e}")
             raise
         finally:
             # Clean up both file and directory
-            await loop.run_in_executor(
-                None, cleanup_temp_files, audio_file_path, temp_dir
-            )
+            if succeeded or not keep_audio_on_error:
+                await loop.run_in_executor(
+                    None, cleanup_temp_files, audio_file_path, temp_dir
+                )
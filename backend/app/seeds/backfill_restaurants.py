@@ -0,0 +1,142 @@
+"""
+Backfill Google Places data (photo, rating, business_status) for restaurants missing it.
+
+Restaurants are walked in id order, in chunks. Each chunk's Place Details lookups run
+concurrently (bounded by --concurrency, and spaced by the Google Maps client's
+GOOGLE_MAPS_QPS limit), then the chunk is committed and its last id saved to Redis.
+A rerun resumes after the last committed chunk; pass --restart to start over.
+
+Usage:
+    python -m app.seeds.backfill_restaurants --fields photo rating business_status
+    GOOGLE_MAPS_QPS=5 python -m app.seeds.backfill_restaurants --fields photo --chunk-size 200
+"""
+import argparse
+import asyncio
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, or_, select
+
+from app.database import AsyncSessionLocal
+from app.models.restaurant import BusinessStatus, Restaurant
+from app.services.google_places_service import get_place_details
+from app.utils.logging import setup_logger
+from app.utils.redis_utils import get_redis_client
+from app.utils.google_maps_client import GoogleMapsError, close_google_maps_client
+from app.utils.restaurant_enrichment import (
+    ENRICHMENT_FIELDS,
+    BackfillProgress,
+    apply_place_details,
+    details_fields,
+)
+
+logger = setup_logger(__name__)
+
+# Condition selecting restaurants that still need each enrichment field
+MISSING_CONDITIONS = {
+    "photo": Restaurant.photo_reference.is_(None) & Restaurant.photo_url.is_(None),
+    "rating": Restaurant.google_rating.is_(None),
+    "business_status": Restaurant.business_status == BusinessStatus.BUSINESS_STATUS_UNSPECIFIED.value,
+}
+
+
+async def backfill_restaurants(
+    fields: List[str],
+    chunk_size: int = 100,
+    concurrency: int = 8,
+    restart: bool = False,
+) -> BackfillProgress:
+    """
+    Fill the given enrichment fields from Place Details for restaurants missing any of them.
+
+    Args:
+        fields: Enrichment fields (keys of ENRICHMENT_FIELDS)
+        chunk_size: Restaurants looked up and committed together
+        concurrency: Simultaneous Place Details lookups
+        restart: Ignore the saved resume position
+
+    Returns:
+        Progress counters of this run
+    """
+    fields = sorted(set(fields))
+    lookup_fields = details_fields(fields)
+    cursor_key = f"restaurant_backfill:{'+'.join(fields)}:cursor"
+    redis = await get_redis_client()
+    if redis is None:
+        logger.warning("Redis unavailable: progress is committed but the backfill cannot be resumed")
+
+    cursor: Optional[str] = None
+    if redis is not None and not restart:
+        cursor = await redis.get(cursor_key)
+        if cursor:
+            logger.info(f"Resuming backfill after restaurant {cursor}")
+
+    conditions = [
+        Restaurant.google_place_id.isnot(None),
+        or_(*[MISSING_CONDITIONS[field] for field in fields]),
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def lookup(place_id: str):
+        async with semaphore:
+            try:
+                # Refreshes need current data, not a details response cached up to PLACES_CACHE_TTL ago
+                details = await get_place_details(place_id, lookup_fields, use_cache=False)
+            except GoogleMapsError as e:
+                logger.warning(f"Place Details failed for {place_id}: {e}")
+                return "failed", None
+            if details.get("status") != "OK":
+                return "not_found", None
+            return None, details.get("result", {})
+
+    try:
+        async with AsyncSessionLocal() as db:
+            count_query = select(func.count(Restaurant.id)).where(*conditions)
+            if cursor:
+                count_query = count_query.where(Restaurant.id > UUID(cursor))
+            progress = BackfillProgress(await db.scalar(count_query))
+            logger.info(f"Backfilling {', '.join(fields)} for {progress.total} restaurants")
+
+            while True:
+                query = select(Restaurant).where(*conditions)
+                if cursor:
+                    query = query.where(Restaurant.id > UUID(cursor))
+                result = await db.execute(query.order_by(Restaurant.id).limit(chunk_size))
+                restaurants = result.scalars().all()
+                if not restaurants:
+                    break
+
+                lookups = await asyncio.gather(*[lookup(r.google_place_id) for r in restaurants])
+                for restaurant, (outcome, place) in zip(restaurants, lookups):
+                    if outcome is None:
+                        outcome = "updated" if apply_place_details(restaurant, place, fields) else "unchanged"
+                    progress.record(outcome)
+
+                # Commit per chunk, then move the resume position past it
+                await db.commit()
+                cursor = str(restaurants[-1].id)
+                if redis is not None:
+                    await redis.set(cursor_key, cursor)
+                logger.info(f"Backfill progress: {progress.summary()}")
+
+        if redis is not None:
+            await redis.delete(cursor_key)
+        logger.info(f"Backfill completed: {progress.summary()}")
+        return progress
+    finally:
+        await close_google_maps_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", nargs="+", choices=sorted(ENRICHMENT_FIELDS), default=["photo"], help="Fields to backfill")
+    parser.add_argument("--chunk-size", type=int, default=100, help="Restaurants per committed chunk")
+    parser.add_argument("--concurrency", type=int, default=8, help="Simultaneous Place Details lookups")
+    parser.add_argument("--restart", action="store_true", help="Ignore the saved resume position")
+    args = parser.parse_args()
+
+    asyncio.run(backfill_restaurants(args.fields, args.chunk_size, args.concurrency, args.restart))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-from .transcription_nlp import transcription_nlp_pipeline
 from .youtube_scraper import scrape_youtube
-from .jobs import JobService
\ No newline at end of file
+from .jobs import JobService
+from .batch_extraction import batch_extraction_pipeline
\ No newline at end of file
@@ -0,0 +1,376 @@
+import json
+import time
+import uuid
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api_schema.jobs import JobUpdateRequest
+from app.config import BATCH_MAX_VIDEOS, BATCH_POLL_INTERVAL, PROMPT_VERSION
+from app.models import Video, VideoProcessingStage, VideoProcessingStatus
+from app.scripts.gpt_food_place_processor import GPTFoodPlaceProcessor
+from app.services.job_queue import backlog_eligibility
+from app.services.jobs import JobService
+from app.services.restaurant_resolver import get_known_restaurant_names
+from app.services.transcription_nlp import resolve_restaurants, store_video_listings
+from app.services.video_processing_jobs import VideoProcessingJobService
+from app.utils.extraction_cache import extraction_cache_key, get_cached_entities, set_cached_entities
+from app.utils.logging import setup_logger
+from app.utils.openai_batch import (
+    OpenAIBatchBackend,
+    TERMINAL_BATCH_STATUSES,
+    build_batch_line,
+    parse_batch_output,
+    split_batch_lines,
+)
+from app.utils.openai_client import TokenUsage
+from app.utils.pipeline_stages import encode_resolved
+
+logger = setup_logger(__name__)
+
+
+def batch_custom_id(video_id: uuid.UUID, index: int) -> str:
+    return f"{video_id}:{index}"
+
+
+def split_custom_id(custom_id: str) -> Tuple[str, int]:
+    video_id, index = custom_id.rsplit(":", 1)
+    return video_id, int(index)
+
+
+async def select_backlog_videos(db: AsyncSession, video_ids: Optional[list] = None, limit: int = BATCH_MAX_VIDEOS) -> List[Video]:
+    """Transcribed videos of the unprocessed backlog (see backlog_eligibility), or the given videos if transcribed."""
+    query = select(Video).where(Video.transcription.is_not(None), Video.transcription != "")
+    if video_ids:
+        query = query.where(Video.id.in_(video_ids))
+    else:
+        query = query.where(*backlog_eligibility())
+    result = await db.execute(query.order_by(Video.published_at.desc()).limit(limit))
+    return result.scalars().all()
+
+
+async def build_extraction_batch(
+    videos: List[Video],
+    processor: GPTFoodPlaceProcessor,
+    known_names: Iterable[str] = (),
+    chunk_indices: Optional[Dict[str, List[int]]] = None,
+) -> Tuple[List[dict], Dict[str, list], Dict[str, str], Dict[str, List[int]]]:
+    """
+    Build the batch request lines for the chunks of the given videos.
+
+    Chunks already in the extraction cache are answered immediately instead of being
+    added to the batch.
+
+    Args:
+        videos: Videos to extract
+        processor: Extractor whose pre-filter picks the chunks (see select_chunks)
+        known_names: Restaurant names for the pre-filter
+        chunk_indices: Send exactly these chunks per video ID (string) instead of the pre-filter's choice
+
+    Returns:
+        Tuple of (request lines, cached entities by custom_id, cache key by custom_id,
+        chunks skipped by the pre-filter by video ID)
+    """
+    lines = []
+    cached_results = {}
+    cache_keys = {}
+    skipped_by_video = {}
+    for video in videos:
+        chunks = processor.chunk_transcription(video.transcription)
+        if chunk_indices is None:
+            selected = processor.select_chunks(video.description, chunks, known_names)
+        else:
+            selected = chunk_indices.get(str(video.id), [])
+        skipped = sorted(set(range(len(chunks))) - set(selected))
+        if skipped:
+            skipped_by_video[str(video.id)] = skipped
+        for index in selected:
+            chunk = chunks[index]
+            custom_id = batch_custom_id(video.id, index)
+            cache_key = extraction_cache_key(processor.model, PROMPT_VERSION, video.description, chunk)
+            cache_keys[custom_id] = cache_key
+            cached = await get_cached_entities(cache_key) if processor.use_cache else None
+            if cached is not None:
+                processor.usage.cached_chunks += 1
+                cached_results[custom_id] = cached
+                continue
+            lines.append(build_batch_line(custom_id, processor.build_request(video.description, chunk, index, len(chunks))))
+    return lines, cached_results, cache_keys, skipped_by_video
+
+
+async def run_batch_requests(
+    db: AsyncSession,
+    backend: Any,
+    lines: List[dict],
+    batch_ids: List[str],
+    job_id: Optional[uuid.UUID] = None,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> Optional[str]:
+    """
+    Submit request lines (split to the Batch API's per-file limits) and poll until every batch is done.
+
+    New batch IDs are appended to ``batch_ids`` and recorded on the job right away, so an
+    interrupted run can be followed up on the provider side.
+
+    Returns:
+        The joined output of the batches, or None if the job was cancelled meanwhile
+
+    Raises:
+        Exception: If every batch ended without results
+    """
+    if not lines:
+        return ""
+    groups = split_batch_lines(lines)
+    metadata = {"job_id": str(job_id)} if job_id else None
+    new_batch_ids = []
+    for group in groups:
+        new_batch_ids.append(await backend.submit(group, metadata=metadata))
+    batch_ids.extend(new_batch_ids)
+    if job_id:
+        job_data = JobUpdateRequest(result_data=json.dumps({"batch_ids": batch_ids, "requests": len(lines)}))
+        await JobService.update_job(db, job_id, job_data)
+
+    outputs = []
+    pending = dict(zip(new_batch_ids, groups))
+    completed_by_batch = {batch_id: 0 for batch_id in new_batch_ids}
+    failed_batches = []
+    while True:
+        for batch_id in list(pending):
+            status, counts, batch_output = await backend.retrieve(batch_id)
+            completed_by_batch[batch_id] = counts.get("completed") or 0
+            if status not in TERMINAL_BATCH_STATUSES:
+                continue
+            logger.info(f"Batch {batch_id} finished with status {status}: {counts}")
+            del pending[batch_id]
+            if status != "completed" and not batch_output:
+                logger.error(f"Batch {batch_id} ended with status {status} and no results")
+                failed_batches.append(batch_id)
+                continue
+            outputs.append(batch_output or "")
+        if not pending:
+            break
+        if job_id:
+            if await JobService.is_cancellation_requested(db, job_id):
+                logger.info(f"Job {job_id} cancellation requested, cancelling batches {list(pending)}")
+                for batch_id in pending:
+                    await backend.cancel(batch_id)
+                await JobService.cancel_job(db, job_id, "Batch extraction cancelled by user request")
+                return None
+            # Provider-side progress fills the first half of the job, ingestion the second
+            await JobService.update_progress(db, job_id, int(50 * sum(completed_by_batch.values()) / len(lines)))
+            await JobService.update_heartbeat(db, job_id)
+        await asyncio.sleep(poll_interval)
+
+    if len(failed_batches) == len(new_batch_ids):
+        raise Exception(f"Batches {', '.join(failed_batches)} ended with no results")
+    return "\n".join(outputs)
+
+
+async def collect_batch_entities(
+    output: str,
+    processor: GPTFoodPlaceProcessor,
+    lines: List[dict],
+    cached_results: Dict[str, list],
+    cache_keys: Dict[str, str],
+) -> Tuple[Dict[str, list], Set[str]]:
+    """
+    Turn a batch output file into merged entities per video.
+
+    Returns:
+        Tuple of (mapping of video ID (string) to its merged entity list, IDs of the videos
+        with a chunk request that failed or has no answer in the output)
+    """
+    chunk_results: Dict[str, Dict[int, list]] = {}
+    for custom_id, entities in cached_results.items():
+        video_id, index = split_custom_id(custom_id)
+        chunk_results.setdefault(video_id, {})[index] = entities
+
+    responses = parse_batch_output(output)
+    incomplete = set()
+    for line in lines:
+        custom_id = line["custom_id"]
+        video_id, index = split_custom_id(custom_id)
+        response = responses.get(custom_id)
+        if response is None:
+            processor.usage.dropped_chunks += 1
+            incomplete.add(video_id)
+            entities = []
+        else:
+            entities, cacheable = processor.parse_response(response, index)
+            if cacheable and custom_id in cache_keys:
+                await set_cached_entities(cache_keys[custom_id], entities)
+        chunk_results.setdefault(video_id, {})[index] = entities
+
+    entities_by_video = {
+        video_id: processor.combine_chunk_results([results[index] for index in sorted(results)])
+        for video_id, results in chunk_results.items()
+    }
+    return entities_by_video, incomplete
+
+
+async def ingest_video_entities(db: AsyncSession, video: Video, entities: List[dict], job_id: Optional[uuid.UUID]) -> int:
+    """
+    Validate and store the entities of one video, recording the outcome like a worker run would.
+
+    The record is finished at the last stage reached: skipped after extraction (no places)
+    or validation (no valid restaurant), completed once stored. A failure is recorded
+    with the results so far, so a rerun resumes from there.
+
+    Returns:
+        Number of listings stored
+    """
+    stage = VideoProcessingStage.EXTRACTED
+    results = {"entities": entities}
+    stored = 0
+    try:
+        if not entities:
+            status = VideoProcessingStatus.SKIPPED
+        else:
+            resolved = await resolve_restaurants(entities)
+            stage = VideoProcessingStage.VALIDATED
+            results["resolved_entities"] = encode_resolved(resolved)
+            stored = await store_video_listings(video.id, resolved)
+            if stored:
+                stage = VideoProcessingStage.STORED
+                status = VideoProcessingStatus.COMPLETED
+            else:
+                status = VideoProcessingStatus.SKIPPED
+    except Exception as e:
+        await VideoProcessingJobService.record_finished_video(
+            db, video.id, job_id, VideoProcessingStatus.FAILED, stage, error_message=str(e), **results
+        )
+        raise
+    await VideoProcessingJobService.record_finished_video(db, video.id, job_id, status, stage, **results)
+    return stored
+
+
+async def ingest_batch_results(
+    db: AsyncSession,
+    videos: List[Video],
+    entities_by_video: Dict[str, list],
+    incomplete: Set[str],
+    job_id: Optional[uuid.UUID] = None,
+) -> Tuple[int, int, int]:
+    """
+    Store the batch results of every video and record each as a finished processing record,
+    so the worker path and later batches agree on what is done.
+
+    A video with chunks missing from the batch output is recorded as failed without a
+    stage (its extraction is incomplete), so it is extracted again later.
+
+    Returns:
+        Tuple of (processed videos, failed videos, stored listings)
+    """
+    processed_videos = 0
+    failed_videos = 0
+    stored_listings = 0
+    for position, video in enumerate(videos, start=1):
+        try:
+            if str(video.id) in incomplete:
+                failed_videos += 1
+                await VideoProcessingJobService.record_finished_video(
+                    db, video.id, job_id, VideoProcessingStatus.FAILED, None,
+                    error_message="Batch output is missing some chunks of the video",
+                )
+            else:
+                stored_listings += await ingest_video_entities(db, video, entities_by_video.get(str(video.id), []), job_id)
+                processed_videos += 1
+        except Exception as e:
+            failed_videos += 1
+            logger.error(f"Error storing batch results for video {video.id}: {e}")
+        if job_id:
+            await JobService.update_progress(db, job_id, 50 + int(50 * position / len(videos)), position)
+    return processed_videos, failed_videos, stored_listings
+
+
+async def batch_extraction_pipeline(
+    db: AsyncSession,
+    video_ids: Optional[list] = None,
+    job_id: Optional[uuid.UUID] = None,
+    backend: Any = None,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> dict:
+    """
+    Extract entities for a backlog of transcribed videos through the Batch API.
+
+    Chunk requests are split into batches that fit the Batch API's per-file limits,
+    submitted, and polled until every batch is done. Videos whose pre-filtered chunks
+    yield no place get a follow-up batch with the chunks the filter skipped. Results then go through the same
+    validation and storage path as the live pipeline (resolve_restaurants /
+    store_video_listings), and each video's outcome is recorded in video_processing_jobs.
+
+    Args:
+        db: Session used for video selection and job tracking
+        video_ids: Restrict the batch to these videos (default: transcribed videos without listings)
+        job_id: Job tracking this run
+        backend: Batch backend (default: OpenAIBatchBackend; LocalBatchBackend for tests)
+        poll_interval: Seconds between batch status checks
+
+    Returns:
+        Result summary stored on the job
+    """
+    start_time = time.time()
+    backend = backend or OpenAIBatchBackend()
+    token_usage = TokenUsage()
+    processor = GPTFoodPlaceProcessor(usage=token_usage)
+
+    videos = await select_backlog_videos(db, video_ids)
+    if not videos:
+        logger.info("No transcribed videos to extract in batch")
+        return {"message": "No videos to process", "total_videos": 0}
+
+    known_names = await get_known_restaurant_names(db) if processor.use_filter else ()
+    lines, cached_results, cache_keys, skipped_by_video = await build_extraction_batch(videos, processor, known_names)
+    logger.info(f"Built batch of {len(lines)} chunk requests for {len(videos)} videos ({len(cached_results)} chunks cached)")
+
+    if job_id:
+        await JobService.update_tracking_stats(db, job_id, queue_size=len(videos), items_in_progress=len(videos), failed_items=0)
+
+    batch_ids = []
+    output = await run_batch_requests(db, backend, lines, batch_ids, job_id, poll_interval)
+    if output is None:
+        return {"cancelled": True, "batch_ids": batch_ids}
+    entities_by_video, incomplete = await collect_batch_entities(output, processor, lines, cached_results, cache_keys)
+    requests = len(lines)
+
+    # No places in the pre-filtered chunks is not a final answer: send the chunks the filter skipped
+    followup = {
+        video_id: skipped for video_id, skipped in skipped_by_video.items()
+        if not entities_by_video.get(video_id) and video_id not in incomplete
+    }
+    if followup:
+        followup_videos = [video for video in videos if str(video.id) in followup]
+        processor.usage.skipped_chunks -= sum(len(skipped) for skipped in followup.values())
+        lines, cached_results, cache_keys, _ = await build_extraction_batch(
+            followup_videos, processor, chunk_indices=followup
+        )
+        logger.info(f"Sending {len(lines)} pre-filter-skipped chunk requests of {len(followup_videos)} videos without places")
+        output = await run_batch_requests(db, backend, lines, batch_ids, job_id, poll_interval)
+        if output is None:
+            return {"cancelled": True, "batch_ids": batch_ids}
+        followup_entities, followup_incomplete = await collect_batch_entities(
+            output, processor, lines, cached_results, cache_keys
+        )
+        entities_by_video.update(followup_entities)
+        incomplete |= followup_incomplete
+        requests += len(lines)
+
+    processed_videos, failed_videos, stored_listings = await ingest_batch_results(
+        db, videos, entities_by_video, incomplete, job_id
+    )
+
+    result_data = {
+        "batch_ids": batch_ids,
+        "videos_processed": processed_videos,
+        "total_videos": len(videos),
+        "failed_videos": failed_videos,
+        "listings_stored": stored_listings,
+        "requests": requests,
+        "processing_time_minutes": (time.time() - start_time) / 60,
+        "token_usage": token_usage.to_dict(),
+    }
+    if job_id:
+        await JobService.update_tracking_stats(db, job_id, items_in_progress=0, failed_items=failed_videos)
+    return result_data
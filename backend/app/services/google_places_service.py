@@ -1,18 +1,47 @@
-import asyncio
 from typing import Optional
 from fastapi import HTTPException, status
-from googlemaps import Client as GoogleMapsClient
-from googlemaps.exceptions import ApiError
 
-from app.config import GOOGLE_MAPS_API_KEY
 from app.models.restaurant import BusinessStatus
 from app.utils.logging import setup_logger
+from app.utils.google_maps_client import GoogleMapsError, get_google_maps_client
+from app.utils.places_cache import cached_lookup, classify_geocode_results, classify_places_status
 
 # Setup logging
 logger = setup_logger(__name__)
 
-# Initialize Google Maps client
-gmaps = GoogleMapsClient(key=GOOGLE_MAPS_API_KEY)
+
+
+async def search_places(query: str) -> dict:
+    """Places Text Search, served from the shared lookup cache when the query was seen before."""
+    return await cached_lookup(
+        "textsearch",
+        query,
+        lambda: get_google_maps_client().places(query),
+        classify_places_status,
+    )
+
+
+async def geocode(address: str) -> list:
+    """Geocoding API lookup, served from the shared lookup cache when the address was seen before."""
+    return await cached_lookup(
+        "geocode",
+        address,
+        lambda: get_google_maps_client().geocode(address),
+        classify_geocode_results,
+    )
+
+
+async def get_place_details(place_id: str, fields: list, use_cache: bool = True) -> dict:
+    """Place Details lookup for the given fields, cached by place ID (``use_cache=False`` always asks Google)."""
+    if not use_cache:
+        return await get_google_maps_client().place(place_id, fields=fields)
+    return await cached_lookup(
+        "details",
+        f"{place_id}|{','.join(sorted(fields))}",
+        lambda: get_google_maps_client().place(place_id, fields=fields),
+        classify_places_status,
+        normalize=False,
+    )
 
 
 async def fetch_restaurant_details_from_google(restaurant_name: str, city: Optional[str] = None, country: str = "USA") -> dict:
@@ -35,13 +64,9 @@ async def fetch_restaurant_details_from_google(restaurant_name: str, city: Optio
     query = " ".join(query_parts)
     logger.info(f"Google Places search query: {query}")
 
-    loop = asyncio.get_event_loop()
     try:
         # Search for the restaurant using Google Places Text Search
-        result = await loop.run_in_executor(
-            None, 
-            lambda: gmaps.places(query=query)
-        )
+        result = await search_places(query)
         
         if result["status"] != "OK" or not result["results"]:
             raise HTTPException(
@@ -52,16 +77,9 @@ async def fetch_restaurant_details_from_google(restaurant_name: str, city: Optio
         place = result["results"][0]
         logger.info(f"Found restaurant: {place['name']} ({place['place_id']})")
         
-        # Extract photo URL if available
-        photo_url = None
-        try:
-            photos = place.get("photos")
-            if photos and len(photos) > 0:
-                photo_reference = photos[0]["photo_reference"]
-                photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_reference}&key={GOOGLE_MAPS_API_KEY}"
-                logger.info(f"Found photo for {place['name']}: {photo_url}")
-        except Exception as photo_error:
-            logger.warning(f"Could not extract photo for {place['name']}: {photo_error}")
+        # Keep only the photo reference; photos are served through the /photos proxy
+        photos = place.get("photos") or []
+        photo_reference = photos[0].get("photo_reference") if photos else None
         
         logger.info(f"Restaurant details: {place}")
 
@@ -85,10 +103,10 @@ async def fetch_restaurant_details_from_google(restaurant_name: str, city: Optio
             "google_place_id": place["place_id"],
             "google_rating": place.get("rating"),
             "business_status": place.get("business_status", BusinessStatus.BUSINESS_STATUS_UNSPECIFIED.value),
-            "photo_url": photo_url,
+            "photo_reference": photo_reference,
         }
         
-    except ApiError as e:
+    except GoogleMapsError as e:
         logger.error(f"Google Places API error: {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -115,13 +133,9 @@ async def geocode_address(address: str, city: str, country: str) -> dict:
     # Construct full address string
     full_address = f"{address.strip()}, {city.strip()}, {country.strip()}"
     
-    loop = asyncio.get_event_loop()
     try:
         # Use Google Maps Geocoding API
-        result = await loop.run_in_executor(
-            None, 
-            lambda: gmaps.geocode(full_address)
-        )
+        result = await geocode(full_address)
         
         if not result:
             raise HTTPException(
@@ -141,7 +155,7 @@ async def geocode_address(address: str, city: str, country: str) -> dict:
             "address_components": result[0].get("address_components", [])
         }
         
-    except ApiError as e:
+    except GoogleMapsError as e:
         logger.error(f"Google Geocoding API error: {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
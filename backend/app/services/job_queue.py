@@ -0,0 +1,638 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import select, update, and_, or_, case, exists, func, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import TASK_LEASE_SECONDS, TASK_MAX_ATTEMPTS, JOB_HEARTBEAT_TIMEOUT, JOB_LOCK_TTL, BACKLOG_PAGE_SIZE
+from app.models import Influencer, Job, Listing, Video, VideoProcessingJob, VideoProcessingStatus
+from app.models.job import JobStatus, JobType
+from app.services.video_processing_jobs import VideoProcessingJobService
+from app.utils.logging import setup_logger
+from app.utils.openai_client import TokenUsage
+from app.utils.job_events import job_event, publish_job_event
+from app.utils.job_progress import progress_values
+from app.utils.pipeline_metrics import combine_pipeline_metrics
+from app.utils.redis_lock import acquire_lock, release_lock
+from app.utils.redis_utils import get_redis_client
+from app.utils.task_queue import (
+    BacklogPriority,
+    backlog_page_limit,
+    backlog_stop_reason,
+    decode_backlog_cursor,
+    encode_backlog_cursor,
+    summarize_video_tasks,
+)
+
+logger = setup_logger(__name__)
+
+# Job types run as a whole by one worker; transcription jobs are split into per-video tasks
+WHOLE_JOB_TYPES = (JobType.SCRAPE_YOUTUBE, JobType.BATCH_EXTRACTION)
+
+# Sort position of videos without a publish date (last, newest first)
+NO_PUBLISH_DATE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def is_backlog_job(job: Job) -> bool:
+    return (job.payload or {}).get("mode") == "backlog"
+
+
+def job_elapsed_time(job: Job, now: datetime) -> float:
+    """Seconds since the job started (0 if it has not)."""
+    started_at = job.started_at
+    if started_at is None:
+        return 0
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    return (now - started_at).total_seconds()
+
+
+async def get_job_token_usage(db: AsyncSession, job_id: uuid.UUID) -> TokenUsage:
+    """OpenAI usage recorded by the workers for the acknowledged videos of a job."""
+    result = await db.execute(
+        select(VideoProcessingJob.token_usage)
+        .where(VideoProcessingJob.job_id == job_id, VideoProcessingJob.token_usage.isnot(None))
+    )
+    return TokenUsage.from_dicts(result.scalars().all())
+
+
+async def get_job_pipeline_metrics(db: AsyncSession, job_id: uuid.UUID) -> dict:
+    """Pipeline counters recorded by the workers for the acknowledged videos of a job."""
+    result = await db.execute(
+        select(VideoProcessingJob.pipeline_metrics)
+        .where(VideoProcessingJob.job_id == job_id, VideoProcessingJob.pipeline_metrics.isnot(None))
+    )
+    return combine_pipeline_metrics(result.scalars().all())
+
+
+async def claim_video_task(db: AsyncSession, worker_id: str) -> Optional[VideoProcessingJob]:
+    """
+    Claim the oldest claimable video task of a running transcription job.
+
+    A task is claimable when it is pending, or when the worker processing it stopped
+    renewing its lease (redelivery after worker death). Rows are locked with
+    FOR UPDATE SKIP LOCKED, so concurrent workers never claim the same task.
+
+    Returns:
+        The claimed task (status processing, leased to ``worker_id``), or None if the queue is empty
+    """
+    candidate = (
+        select(VideoProcessingJob.id)
+        .join(Job, Job.id == VideoProcessingJob.job_id)
+        .where(
+            Job.status == JobStatus.RUNNING,
+            Job.cancellation_requested.is_(False),
+            VideoProcessingJob.attempts < TASK_MAX_ATTEMPTS,
+            or_(
+                VideoProcessingJob.status == VideoProcessingStatus.PENDING,
+                and_(
+                    VideoProcessingJob.status == VideoProcessingStatus.PROCESSING,
+                    VideoProcessingJob.lease_expires_at < func.now()
+                )
+            )
+        )
+        .order_by(VideoProcessingJob.created_at)
+        .limit(1)
+        .with_for_update(of=VideoProcessingJob, skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(VideoProcessingJob)
+        .where(VideoProcessingJob.id == candidate)
+        .values(
+            status=VideoProcessingStatus.PROCESSING,
+            worker_id=worker_id,
+            lease_expires_at=func.now() + timedelta(seconds=TASK_LEASE_SECONDS),
+            attempts=VideoProcessingJob.attempts + 1,
+            started_at=func.now(),
+            error_message=None,
+        )
+        .returning(VideoProcessingJob)
+    )
+    task = result.scalar_one_or_none()
+    await db.commit()
+    return task
+
+
+async def renew_video_task_lease(db: AsyncSession, task_id: uuid.UUID, worker_id: str) -> bool:
+    """Extend the lease of a claimed task; False if the worker no longer holds the claim."""
+    result = await db.execute(
+        update(VideoProcessingJob)
+        .where(
+            VideoProcessingJob.id == task_id,
+            VideoProcessingJob.worker_id == worker_id,
+            VideoProcessingJob.status == VideoProcessingStatus.PROCESSING
+        )
+        .values(lease_expires_at=func.now() + timedelta(seconds=TASK_LEASE_SECONDS))
+        .returning(VideoProcessingJob.id)
+    )
+    renewed = result.scalar_one_or_none() is not None
+    await db.commit()
+    return renewed
+
+
+async def release_video_task(db: AsyncSession, task_id: uuid.UUID, worker_id: str) -> None:
+    """Hand an unfinished task back to the queue (worker shutdown); the delivery is not counted as an attempt."""
+    await db.execute(
+        update(VideoProcessingJob)
+        .where(
+            VideoProcessingJob.id == task_id,
+            VideoProcessingJob.worker_id == worker_id,
+            VideoProcessingJob.status == VideoProcessingStatus.PROCESSING
+        )
+        .values(
+            status=VideoProcessingStatus.PENDING,
+            worker_id=None,
+            lease_expires_at=None,
+            attempts=VideoProcessingJob.attempts - 1,
+        )
+    )
+    await db.commit()
+
+
+async def ack_video_task(db: AsyncSession, task: VideoProcessingJob, worker_id: str,
+                         token_usage: Optional[dict] = None, error_message: Optional[str] = None,
+                         pipeline_metrics: Optional[dict] = None) -> Optional[Job]:
+    """
+    Acknowledge a processed task and finish its job if it was the last one.
+
+    process_video records the outcome of the video; a task it could not start is
+    failed here with ``error_message``. Nothing is changed if the claim was lost
+    (the task has been redelivered to another worker).
+
+    Returns:
+        The job, if this acknowledgement finished it
+    """
+    result = await db.execute(
+        update(VideoProcessingJob)
+        .where(VideoProcessingJob.id == task.id, VideoProcessingJob.worker_id == worker_id)
+        .values(
+            status=case(
+                (
+                    VideoProcessingJob.status == VideoProcessingStatus.PROCESSING,
+                    literal(VideoProcessingStatus.FAILED, VideoProcessingJob.status.type)
+                ),
+                else_=VideoProcessingJob.status
+            ),
+            error_message=func.coalesce(VideoProcessingJob.error_message, error_message),
+            completed_at=func.coalesce(VideoProcessingJob.completed_at, func.now()),
+            worker_id=None,
+            lease_expires_at=None,
+            token_usage=token_usage,
+            pipeline_metrics=pipeline_metrics,
+        )
+        .returning(VideoProcessingJob.id)
+    )
+    acknowledged = result.scalar_one_or_none() is not None
+    # Committed before looking for unfinished tasks, so that of concurrent last
+    # acknowledgements at least the one committed last sees every task finished
+    await db.commit()
+    if not acknowledged:
+        logger.warning(f"Task {task.id} was redelivered before worker {worker_id} acknowledged it")
+        return None
+    if await has_unfinished_tasks(db, task.job_id):
+        return None  # Progress is written by the worker's JobProgressReporter
+    return await finalize_job_if_done(db, task.job_id)
+
+
+async def has_unfinished_tasks(db: AsyncSession, job_id: uuid.UUID) -> bool:
+    """Whether a job has video tasks pending or processing."""
+    result = await db.execute(
+        select(
+            exists().where(
+                VideoProcessingJob.job_id == job_id,
+                VideoProcessingJob.status.in_([VideoProcessingStatus.PENDING, VideoProcessingStatus.PROCESSING])
+            )
+        )
+    )
+    return result.scalar()
+
+
+async def get_task_summary(db: AsyncSession, job_id: uuid.UUID) -> dict:
+    """Progress of a transcription job from its video tasks (see summarize_video_tasks)."""
+    result = await db.execute(
+        select(VideoProcessingJob.status, func.count())
+        .where(VideoProcessingJob.job_id == job_id)
+        .group_by(VideoProcessingJob.status)
+    )
+    return summarize_video_tasks({status.value: count for status, count in result.all()})
+
+
+async def refresh_job_progress(db: AsyncSession, job_id: uuid.UUID) -> Optional[Job]:
+    """
+    Write the progress, ETA and heartbeat of a running transcription job from its tasks.
+
+    A single UPDATE without locking the job row: completing the job is left to
+    finalize_job_if_done.
+
+    Returns:
+        The job, if it is running
+    """
+    job = await db.get(Job, job_id)
+    if job is None or job.status != JobStatus.RUNNING:
+        await db.commit()
+        return None
+    summary = await get_task_summary(db, job_id)
+
+    now = datetime.now(timezone.utc)
+    values = progress_values(
+        summary["total"], summary["completed"] + summary["skipped"], summary["failed"], summary["processing"],
+        job_elapsed_time(job, now), now=now
+    )
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+        .values(**values, last_heartbeat=now)
+        .returning(Job)
+    )
+    job = result.scalar_one_or_none()
+    await db.commit()
+    if job:
+        await publish_job_event(job_event(job))
+    return job
+
+
+async def finalize_job_if_done(db: AsyncSession, job_id: uuid.UUID) -> Optional[Job]:
+    """
+    Refresh the progress of a running transcription job from its tasks, and complete it
+    once none is pending or processing.
+
+    The job row is locked so concurrent acknowledgements finish the job exactly once.
+    The job fails if every video failed and is cancelled if cancellation was requested.
+
+    Returns:
+        The job, if it was finished here
+    """
+    result = await db.execute(select(Job).where(Job.id == job_id).with_for_update())
+    job = result.scalar_one_or_none()
+    if job is None or job.status != JobStatus.RUNNING:
+        await db.commit()
+        return None
+
+    summary = await get_task_summary(db, job_id)
+
+    now = datetime.now(timezone.utc)
+    elapsed_time = job_elapsed_time(job, now)
+    job.processed_items = summary["done"]
+    job.progress = summary["progress"]
+    job.failed_items = summary["failed"]
+    job.items_in_progress = summary["processing"]
+    job.queue_size = summary["pending"]
+    job.last_heartbeat = now
+    if elapsed_time > 0:
+        job.processing_rate = summary["done"] / (elapsed_time / 60)
+
+    # A backlog job is not done while its feeder may still queue videos
+    feeding = is_backlog_job(job) and not job.payload.get("exhausted") and not job.cancellation_requested
+    if summary["remaining"] or feeding:
+        if job.processing_rate and summary["remaining"]:
+            job.estimated_completion_time = now + timedelta(minutes=summary["remaining"] / job.processing_rate)
+        await db.commit()
+        await publish_job_event(job_event(job))
+        return None
+
+    token_usage = await get_job_token_usage(db, job_id)
+    pipeline_metrics = await get_job_pipeline_metrics(db, job_id)
+
+    job.items_in_progress = 0
+    job.completed_at = now
+    if job.cancellation_requested:
+        job.status = JobStatus.CANCELLED
+    elif summary["total"] and summary["failed"] == summary["total"]:
+        job.status = JobStatus.FAILED
+        job.error_message = f"Transcription and NLP pipeline completed with {summary['failed']} failures."
+    else:
+        job.status = JobStatus.COMPLETED
+        job.progress = 100
+    job.result_data = json.dumps({
+        "message": "Video transcription and NLP processing completed successfully",
+        "elapsed_time": elapsed_time,
+        "videos_processed": summary["completed"] + summary["skipped"],
+        "total_videos": summary["total"],
+        "failed_videos": summary["failed"],
+        "skipped_videos": summary["skipped"],
+        "token_usage": token_usage.to_dict(),
+        "pipeline_metrics": pipeline_metrics,
+        **({"stop_reason": job.payload.get("stop_reason")} if is_backlog_job(job) else {}),
+    })
+    await db.commit()
+    logger.info(f"Job {job_id} finished with status {job.status.value}: {summary}")
+    await publish_job_event(job_event(job))
+
+    await release_job_lock(job)
+    return job
+
+
+def backlog_sort_key(priority: BacklogPriority) -> list:
+    """Columns ordering backlog videos (all descending; the video id breaks ties)."""
+    published_at = func.coalesce(Video.published_at, NO_PUBLISH_DATE)
+    if priority == BacklogPriority.SUBSCRIBERS:
+        return [func.coalesce(Influencer.subscriber_count, -1), published_at, Video.id]
+    return [published_at, Video.id]
+
+
+def backlog_eligibility() -> list:
+    """
+    Conditions on Video for being unprocessed backlog, shared by backlog jobs and batch extraction.
+
+    The video has no listings, is not queued, processing, completed or skipped in any job
+    (a video whose extraction found no places is settled as skipped), and has failed
+    fewer than TASK_MAX_ATTEMPTS times.
+    """
+    settled = (
+        select(VideoProcessingJob.id)
+        .where(
+            VideoProcessingJob.video_id == Video.id,
+            VideoProcessingJob.status.in_([
+                VideoProcessingStatus.PENDING,
+                VideoProcessingStatus.PROCESSING,
+                VideoProcessingStatus.COMPLETED,
+                VideoProcessingStatus.SKIPPED,
+            ])
+        )
+    )
+    failures = (
+        select(func.count())
+        .where(VideoProcessingJob.video_id == Video.id, VideoProcessingJob.status == VideoProcessingStatus.FAILED)
+        .scalar_subquery()
+    )
+    return [
+        ~exists().where(Listing.video_id == Video.id),
+        ~settled.exists(),
+        failures < TASK_MAX_ATTEMPTS,
+    ]
+
+
+async def select_backlog_page(db: AsyncSession, priority: BacklogPriority, cursor: Optional[list], limit: int) -> list:
+    """
+    Next page of videos eligible for a backlog job, after ``cursor`` in ``priority`` order.
+
+    Eligible videos are unprocessed backlog (see backlog_eligibility). Pages are read by
+    keyset, so the backlog is never loaded at once.
+
+    Returns:
+        Sort key rows (the video id last)
+    """
+    sort_key = backlog_sort_key(priority)
+    query = (
+        select(*sort_key)
+        .select_from(Video)
+        .outerjoin(Influencer, Influencer.id == Video.influencer_id)
+        .where(*backlog_eligibility())
+    )
+    if cursor:
+        query = query.where(tuple_(*sort_key) < tuple_(*decode_backlog_cursor(cursor)))
+    result = await db.execute(query.order_by(*[column.desc() for column in sort_key]).limit(limit))
+    return result.all()
+
+
+async def feed_backlog_job(db: AsyncSession, job_id: uuid.UUID) -> Optional[Job]:
+    """
+    Queue the next page of a backlog job's videos once fewer than BACKLOG_PAGE_SIZE are pending,
+    and renew the job's lock.
+
+    The job's budgets (payload max_videos, max_minutes, max_spend) are checked before
+    each page. When the backlog or a budget runs out, the feeder stops; running out of
+    time or money also skips the videos still pending. The job row is locked with SKIP
+    LOCKED, so one worker feeds a job at a time.
+
+    Returns:
+        The job, if it finished once the feeder stopped
+    """
+    result = await db.execute(
+        select(Job).where(Job.id == job_id, Job.status == JobStatus.RUNNING).with_for_update(skip_locked=True)
+    )
+    job = result.scalar_one_or_none()
+    if job is None or not is_backlog_job(job) or job.payload.get("exhausted"):
+        await db.commit()
+        return None
+
+    lock_held = await acquire_job_lock(job)
+    result = await db.execute(
+        select(func.count())
+        .where(VideoProcessingJob.job_id == job_id, VideoProcessingJob.status == VideoProcessingStatus.PENDING)
+    )
+    if result.scalar_one() >= BACKLOG_PAGE_SIZE and lock_held and not job.cancellation_requested:
+        await db.commit()
+        return None
+
+    payload = dict(job.payload)
+    elapsed_minutes = job_elapsed_time(job, datetime.now(timezone.utc)) / 60
+    spend = (await get_job_token_usage(db, job_id)).estimated_cost()
+    if job.cancellation_requested:
+        stop_reason = "cancelled"
+    elif not lock_held:
+        # The lock expired and another backlog job took it over
+        stop_reason = "lock_lost"
+    else:
+        stop_reason = backlog_stop_reason(payload, elapsed_minutes, spend)
+
+    if stop_reason is None:
+        limit = backlog_page_limit(payload, BACKLOG_PAGE_SIZE)
+        rows = await select_backlog_page(db, BacklogPriority(payload.get("priority", "recency")), payload.get("cursor"), limit)
+        if rows:
+            await VideoProcessingJobService.add_pending_videos(db, [row[-1] for row in rows], job_id)
+            payload["cursor"] = encode_backlog_cursor(rows[-1])
+            payload["enqueued"] = payload.get("enqueued", 0) + len(rows)
+            job.total_items = payload["enqueued"]
+            logger.info(f"Queued {len(rows)} backlog videos for job {job_id} ({payload['enqueued']} so far)")
+        if len(rows) < limit:
+            stop_reason = "backlog_empty"
+        elif backlog_page_limit(payload, BACKLOG_PAGE_SIZE) == 0:
+            stop_reason = "max_videos"
+
+    if stop_reason in ("max_minutes", "max_spend"):
+        await db.execute(
+            update(VideoProcessingJob)
+            .where(VideoProcessingJob.job_id == job_id, VideoProcessingJob.status == VideoProcessingStatus.PENDING)
+            .values(status=VideoProcessingStatus.SKIPPED, error_message=f"Backlog budget {stop_reason} reached", completed_at=func.now())
+        )
+    if stop_reason:
+        payload["exhausted"] = True
+        payload["stop_reason"] = stop_reason
+        logger.info(f"Backlog job {job_id} stopped queueing videos: {stop_reason} (spend ${spend:.2f}, {elapsed_minutes:.0f} min)")
+    job.payload = payload
+    await db.commit()
+
+    return await finalize_job_if_done(db, job_id) if stop_reason else None
+
+
+async def feed_backlog_jobs(db: AsyncSession) -> List[Job]:
+    """Feed every running backlog job; returns the jobs that finished."""
+    result = await db.execute(
+        select(Job.id).where(
+            Job.job_type == JobType.TRANSCRIPTION_NLP,
+            Job.status == JobStatus.RUNNING,
+            Job.payload["mode"].astext == "backlog"
+        )
+    )
+    finished = []
+    for job_id in result.scalars().all():
+        job = await feed_backlog_job(db, job_id)
+        if job:
+            finished.append(job)
+    return finished
+
+
+async def claim_job(db: AsyncSession, worker_id: str) -> Optional[Job]:
+    """
+    Claim the oldest queued scrape or batch extraction job.
+
+    A job is claimable when it is pending, or running with a heartbeat older than
+    JOB_HEARTBEAT_TIMEOUT (its worker died) and retries left; a redelivery counts as a retry.
+
+    Returns:
+        The claimed job (status running), or None if there is none
+    """
+    stale = and_(
+        Job.status == JobStatus.RUNNING,
+        Job.last_heartbeat < func.now() - timedelta(seconds=JOB_HEARTBEAT_TIMEOUT),
+        func.coalesce(Job.retry_count, 0) < func.coalesce(Job.max_retries, 3)
+    )
+    candidate = (
+        select(Job.id)
+        .where(
+            Job.job_type.in_(WHOLE_JOB_TYPES),
+            Job.cancellation_requested.is_(False),
+            or_(Job.status == JobStatus.PENDING, stale)
+        )
+        .order_by(Job.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == candidate)
+        .values(
+            status=JobStatus.RUNNING,
+            started_at=func.coalesce(Job.started_at, func.now()),
+            last_heartbeat=func.now(),
+            retry_count=case(
+                (Job.status == JobStatus.RUNNING, func.coalesce(Job.retry_count, 0) + 1),
+                else_=func.coalesce(Job.retry_count, 0)
+            ),
+        )
+        .returning(Job)
+    )
+    job = result.scalar_one_or_none()
+    await db.commit()
+    if job:
+        logger.info(f"Worker {worker_id} claimed {job.job_type.value} job {job.id} (retry {job.retry_count})")
+    return job
+
+
+async def sweep_queue(db: AsyncSession) -> List[Job]:
+    """
+    Settle tasks and jobs that no worker will finish, and feed backlog jobs.
+
+    - Video tasks whose lease expired after TASK_MAX_ATTEMPTS deliveries are failed.
+    - Pending video tasks of cancelled jobs are skipped.
+    - Scrape and batch jobs without a heartbeat and without retries left are failed.
+
+    Transcription jobs affected by the first two are then finalized, and backlog jobs
+    are fed their next videos (see feed_backlog_job).
+
+    Returns:
+        The jobs finished by the sweep
+    """
+    exhausted = await db.execute(
+        update(VideoProcessingJob)
+        .where(
+            VideoProcessingJob.status == VideoProcessingStatus.PROCESSING,
+            VideoProcessingJob.lease_expires_at < func.now(),
+            VideoProcessingJob.attempts >= TASK_MAX_ATTEMPTS
+        )
+        .values(
+            status=VideoProcessingStatus.FAILED,
+            error_message=f"Worker lost the video {TASK_MAX_ATTEMPTS} times",
+            completed_at=func.now(),
+            worker_id=None,
+            lease_expires_at=None,
+        )
+        .returning(VideoProcessingJob.job_id)
+    )
+    job_ids = set(exhausted.scalars().all())
+
+    cancelled_jobs = select(Job.id).where(
+        or_(Job.status == JobStatus.CANCELLED, Job.cancellation_requested.is_(True))
+    )
+    skipped = await db.execute(
+        update(VideoProcessingJob)
+        .where(
+            VideoProcessingJob.status == VideoProcessingStatus.PENDING,
+            VideoProcessingJob.job_id.in_(cancelled_jobs)
+        )
+        .values(
+            status=VideoProcessingStatus.SKIPPED,
+            error_message="Job cancelled",
+            completed_at=func.now(),
+        )
+        .returning(VideoProcessingJob.job_id)
+    )
+    job_ids.update(skipped.scalars().all())
+
+    dead = await db.execute(
+        update(Job)
+        .where(
+            Job.job_type.in_(WHOLE_JOB_TYPES),
+            Job.status == JobStatus.RUNNING,
+            Job.last_heartbeat < func.now() - timedelta(seconds=JOB_HEARTBEAT_TIMEOUT),
+            func.coalesce(Job.retry_count, 0) >= func.coalesce(Job.max_retries, 3)
+        )
+        .values(
+            status=JobStatus.FAILED,
+            error_message="Worker lost the job and no retries are left",
+            completed_at=func.now(),
+        )
+        .returning(Job)
+    )
+    finished = list(dead.scalars().all())
+    await db.commit()
+
+    for job in finished:
+        logger.warning(f"Failed {job.job_type.value} job {job.id}: no heartbeat and no retries left")
+        await release_job_lock(job)
+    for job_id in job_ids:
+        if job_id is None:
+            continue
+        job = await finalize_job_if_done(db, job_id)
+        if job:
+            finished.append(job)
+    finished.extend(await feed_backlog_jobs(db))
+    return finished
+
+
+async def acquire_job_lock(job: Job) -> bool:
+    """
+    Take or extend the Redis lock of a job, owned by the job id.
+
+    Called when a worker starts the job and on each of its heartbeats, so the lock
+    (JOB_LOCK_TTL) lasts as long as the job is alive. True for jobs without a lock,
+    or when Redis is unreachable.
+    """
+    if not job.redis_lock_key:
+        return True
+    client = await get_redis_client()
+    if client is None:
+        return True
+    try:
+        return await acquire_lock(client, job.redis_lock_key, str(job.id), JOB_LOCK_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to renew lock {job.redis_lock_key} of job {job.id}: {e}")
+        return True
+
+
+async def release_job_lock(job: Job) -> None:
+    """Release the Redis lock of a finished job so the next run can be triggered (only if the job still owns it)."""
+    if not job.redis_lock_key:
+        return
+    client = await get_redis_client()
+    if client is None:
+        return
+    try:
+        await release_lock(client, job.redis_lock_key, str(job.id))
+    except Exception as e:
+        logger.warning(f"Failed to release lock {job.redis_lock_key} of job {job.id}: {e}")
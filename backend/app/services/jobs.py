@@ -1,20 +1,22 @@
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timedelta
 from typing import Optional, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update, desc
+from sqlalchemy import select, update, desc, func
 
 from app.models.job import Job, JobStatus, JobType
 from app.api_schema.jobs import JobCreateRequest, JobUpdateRequest
+from app.utils.job_events import job_event, publish_job_event
 
 class JobService:
     @staticmethod
-    async def create_job(db: AsyncSession, job_data: JobCreateRequest) -> Job:
-        """Create a new job."""
+    async def create_job(db: AsyncSession, job_data: JobCreateRequest, job_id: Optional[UUID] = None) -> Job:
+        """Create a new job (with ``job_id``, e.g. the owner token of a lock taken for it)."""
         job = Job(
+            id=job_id or uuid4(),
             job_type=job_data.job_type,
             title=job_data.title,
             description=job_data.description,
@@ -22,6 +24,7 @@ class JobService:
             started_by=job_data.started_by,
             redis_lock_key=job_data.redis_lock_key,
             trigger_type=job_data.trigger_type,
+            payload=job_data.payload,
             status=JobStatus.PENDING
         )
         db.add(job)
@@ -40,6 +43,7 @@ class JobService:
             started_by=job_data.started_by,
             redis_lock_key=job_data.redis_lock_key,
             trigger_type=job_data.trigger_type,
+            payload=job_data.payload,
             status=JobStatus.PENDING
         )
         db.add(job)
@@ -64,7 +68,8 @@ class JobService:
         skip: int = 0,
         limit: int = 100,
         status: Optional[JobStatus] = None,
-        job_type: Optional[JobType] = None
+        job_type: Optional[JobType] = None,
+        cancellation_requested: Optional[bool] = None
     ) -> List[Job]:
         """Get jobs with optional filtering."""
         query = select(Job).order_by(desc(Job.created_at))
@@ -73,6 +78,8 @@ class JobService:
             query = query.where(Job.status == status)
         if job_type:
             query = query.where(Job.job_type == job_type)
+        if cancellation_requested is not None:
+            query = query.where(Job.cancellation_requested == cancellation_requested)
             
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
@@ -107,7 +114,10 @@ class JobService:
             )
             await db.commit()
             
-        return await JobService.get_job(db, job_id)
+        job = await JobService.get_job(db, job_id)
+        if job and "status" in update_data:
+            await publish_job_event(job_event(job))
+        return job
 
     @staticmethod
     def update_job_sync(db: Session, job_id: UUID, job_data: JobUpdateRequest) -> Optional[Job]:
@@ -413,6 +423,47 @@ class JobService:
                 return JobService.update_job_sync(db, job_id, update_data)
         return job
 
+    @staticmethod
+    async def get_job_group_stats(db: AsyncSession, created_after: Optional[datetime] = None) -> List[dict]:
+        """
+        Aggregates of jobs by (job_type, status), computed in one grouped query.
+
+        Durations (minutes from start to completion) cover jobs with both timestamps,
+        processing rates the jobs with a positive rate. See app.utils.job_analytics for
+        the reports built from these.
+
+        Args:
+            created_after: Only jobs created from this time on (uses ix_jobs_created_at)
+        """
+        duration = func.extract("epoch", Job.completed_at - Job.started_at) / 60
+        rate = Job.processing_rate
+        query = select(
+            Job.job_type,
+            Job.status,
+            func.count().label("jobs"),
+            func.count().filter(Job.cancellation_requested).label("cancellation_requests"),
+            func.sum(Job.failed_items).label("failed_items"),
+            func.sum(Job.processed_items).label("processed_items"),
+            func.sum(Job.queue_size).label("queue_size"),
+            func.sum(Job.items_in_progress).label("items_in_progress"),
+            func.count(duration).label("duration_count"),
+            func.sum(duration).label("duration_sum"),
+            func.min(duration).label("duration_min"),
+            func.max(duration).label("duration_max"),
+            func.count(rate).filter(rate > 0).label("rate_count"),
+            func.sum(rate).filter(rate > 0).label("rate_sum"),
+            func.min(rate).filter(rate > 0).label("rate_min"),
+            func.max(rate).filter(rate > 0).label("rate_max"),
+        ).group_by(Job.job_type, Job.status)
+        if created_after is not None:
+            query = query.where(Job.created_at >= created_after)
+
+        result = await db.execute(query)
+        return [
+            {**row._asdict(), "job_type": row.job_type.value, "status": row.status.value}
+            for row in result.all()
+        ]
+
     @staticmethod
     async def get_job_analytics(db: AsyncSession, job_id: UUID) -> Optional[dict]:
         """Get comprehensive job statistics and analytics."""
@@ -0,0 +1,100 @@
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.sql import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Restaurant
+from app.utils.logging import setup_logger
+from app.utils.pipeline_metrics import count_metric
+from app.utils.restaurant_matching import local_match_score
+
+logger = setup_logger(__name__)
+
+# Trigram candidates fetched per entity before scoring in Python
+CANDIDATE_LIMIT = 5
+
+# Seconds before the restaurant names given to the chunk pre-filter are reloaded
+KNOWN_NAMES_TTL = 600
+
+resolver_metrics = {"lookups": 0, "local_matches": 0}
+_known_names = {"names": frozenset(), "loaded_at": None}
+
+
+def _count(name: str) -> None:
+    resolver_metrics[name] += 1
+    count_metric(f"resolver_{name}")
+
+
+def get_resolver_metrics() -> dict:
+    """Local match counters of this process."""
+    lookups = resolver_metrics["lookups"]
+    return dict(resolver_metrics, match_rate=round(resolver_metrics["local_matches"] / lookups, 3) if lookups else 0.0)
+
+
+async def get_known_restaurant_names(db: AsyncSession) -> frozenset:
+    """Names of the active restaurants (the chunk pre-filter's gazetteer), reloaded every KNOWN_NAMES_TTL seconds."""
+    loaded_at = _known_names["loaded_at"]
+    if loaded_at is None or time.monotonic() - loaded_at > KNOWN_NAMES_TTL:
+        result = await db.execute(select(Restaurant.name).where(Restaurant.is_active.is_(True)))
+        _known_names.update(names=frozenset(result.scalars().all()), loaded_at=time.monotonic())
+    return _known_names["names"]
+
+
+async def resolve_local_restaurant(db: AsyncSession, entity: dict) -> Optional[dict]:
+    """
+    Match an extracted entity against existing restaurants before calling Google Places.
+
+    Candidates come from the pg_trgm index on lower(name) (``%`` operator, ordered by
+    similarity) and are confirmed with local_match_score (normalized name, city,
+    coordinates when available).
+
+    Args:
+        db: Database session
+        entity: Extracted entity
+
+    Returns:
+        A validated-restaurant dict in the same shape as validate_restaurant, with
+        "restaurant_id" set, or None when no confident local match exists
+    """
+    name = (entity.get("restaurant_name") or "").strip()
+    if not name:
+        return None
+    _count("lookups")
+
+    name_lower = func.lower(name)
+    result = await db.execute(
+        select(Restaurant)
+        .where(Restaurant.is_active.is_(True), func.lower(Restaurant.name).op("%")(name_lower))
+        .order_by(func.similarity(func.lower(Restaurant.name), name_lower).desc())
+        .limit(CANDIDATE_LIMIT)
+    )
+
+    best, best_score = None, None
+    for restaurant in result.scalars().all():
+        score = local_match_score(entity, restaurant)
+        if score is not None and (best_score is None or score > best_score):
+            best, best_score = restaurant, score
+    if best is None:
+        return None
+
+    _count("local_matches")
+    logger.info(f"Matched '{name}' to existing restaurant {best.name} ({best.id}) with score {best_score:.2f}")
+    return {
+        "valid": True,
+        "restaurant_id": best.id,
+        "name": best.name,
+        "address": best.address,
+        "latitude": best.latitude,
+        "longitude": best.longitude,
+        "city": best.city,
+        "country": best.country,
+        "google_place_id": best.google_place_id,
+        "google_rating": best.google_rating,
+        "business_status": best.business_status,
+        "photo_reference": best.photo_reference,
+        "confidence_score": entity.get("confidence_score", 0.8),
+        "tags": entity.get("tags", []),
+        "cuisines": entity.get("cuisines", []),
+    }
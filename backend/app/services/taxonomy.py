@@ -0,0 +1,110 @@
+import uuid
+from typing import Dict, Iterable, List
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Tag, Cuisine, RestaurantTag, RestaurantCuisine
+from app.utils.logging import setup_logger
+from app.utils.vocabulary_cache import VocabularyCache, tag_cache, cuisine_cache
+
+logger = setup_logger(__name__)
+
+
+def normalize_names(names: Iterable[str]) -> List[str]:
+    """Lowercased, stripped, de-duplicated and sorted names (sorted so concurrent upserts lock rows in the same order)."""
+    return sorted({name.lower().strip() for name in names or [] if name and name.strip()})
+
+
+async def ensure_vocabulary_loaded(db: AsyncSession, model, cache: VocabularyCache) -> None:
+    """Load the whole vocabulary into the cache if it is not loaded (first use or after an invalidation)."""
+    if not cache.loaded:
+        result = await db.execute(select(model.name, model.id))
+        cache.load(result.all())
+
+
+async def warm_vocabulary_caches(db: AsyncSession) -> None:
+    """Load the tag and cuisine caches (on application startup)."""
+    await ensure_vocabulary_loaded(db, Tag, tag_cache)
+    await ensure_vocabulary_loaded(db, Cuisine, cuisine_cache)
+    logger.info("Warmed tag and cuisine vocabulary caches")
+
+
+async def upsert_names(db: AsyncSession, model, names: List[str], cache: VocabularyCache) -> Dict[str, uuid.UUID]:
+    """
+    Return ids for names of a name-unique table (tags or cuisines), inserting missing ones.
+
+    Names in the vocabulary cache need no query. The rest are created with one
+    INSERT ... ON CONFLICT (name) DO NOTHING RETURNING; names inserted concurrently by
+    another transaction are then fetched with a single SELECT.
+
+    Args:
+        db: Database session
+        model: Tag or Cuisine
+        names: Normalized names
+        cache: Vocabulary cache of ``model``
+
+    Returns:
+        Mapping of name to id
+    """
+    if not names:
+        return {}
+
+    await ensure_vocabulary_loaded(db, model, cache)
+    ids, missing = cache.lookup(names)
+    if not missing:
+        return ids
+
+    result = await db.execute(
+        insert(model)
+        .values([{"id": uuid.uuid4(), "name": name} for name in missing])
+        .on_conflict_do_nothing(index_elements=[model.name])
+        .returning(model.name, model.id)
+    )
+    ids.update(result.all())
+
+    existing = [name for name in missing if name not in ids]
+    if existing:
+        result = await db.execute(select(model.name, model.id).where(model.name.in_(existing)))
+        committed = dict(result.all())
+        # Only committed rows are cached: names inserted above could still be rolled back
+        cache.add(committed)
+        ids.update(committed)
+    return ids
+
+
+async def find_missing_ids(db: AsyncSession, model, ids: Iterable[uuid.UUID], cache: VocabularyCache) -> List[uuid.UUID]:
+    """Ids that do not exist in a tag or cuisine table, checked against the cache before the database."""
+    await ensure_vocabulary_loaded(db, model, cache)
+    unknown = cache.missing_ids(ids)
+    if not unknown:
+        return []
+    # Created by another process since the cache was loaded?
+    result = await db.execute(select(model.id).where(model.id.in_(unknown)))
+    found = set(result.scalars().all())
+    return [id_ for id_ in unknown if id_ not in found]
+
+
+async def store_restaurant_tags(db: AsyncSession, restaurant_id: uuid.UUID, tag_names: Iterable[str]) -> Dict[str, uuid.UUID]:
+    """Create missing tags and link all of them to the restaurant in a constant number of statements."""
+    tag_ids = await upsert_names(db, Tag, normalize_names(tag_names), tag_cache)
+    if tag_ids:
+        await db.execute(
+            insert(RestaurantTag)
+            .values([{"restaurant_id": restaurant_id, "tag_id": tag_id} for tag_id in tag_ids.values()])
+            .on_conflict_do_nothing()
+        )
+    return tag_ids
+
+
+async def store_restaurant_cuisines(db: AsyncSession, restaurant_id: uuid.UUID, cuisine_names: Iterable[str]) -> Dict[str, uuid.UUID]:
+    """Create missing cuisines and link all of them to the restaurant in a constant number of statements."""
+    cuisine_ids = await upsert_names(db, Cuisine, normalize_names(cuisine_names), cuisine_cache)
+    if cuisine_ids:
+        await db.execute(
+            insert(RestaurantCuisine)
+            .values([{"restaurant_id": restaurant_id, "cuisine_id": cuisine_id} for cuisine_id in cuisine_ids.values()])
+            .on_conflict_do_nothing()
+        )
+    return cuisine_ids
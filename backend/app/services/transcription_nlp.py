@@ -1,13 +1,9 @@
 import os
 import uuid
-import redis
 import yt_dlp
 import asyncio
 import tempfile
 import subprocess
-from datetime import datetime, timedelta
-import json
-import time
 import re
 from typing import Optional, Dict, Any, Tuple
 
@@ -18,22 +14,28 @@ from sqlalchemy.sql import func, case
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from googlemaps import Client as GoogleMapsClient
-from app.api_schema.jobs import JobUpdateRequest
-from googlemaps.exceptions import ApiError
-
-from app.models import Video, Restaurant, Listing, Influencer, Tag, RestaurantTag, Cuisine, RestaurantCuisine, BusinessStatus
+from app.models import (Video, Restaurant, Listing, Influencer, BusinessStatus, VideoProcessingJob, VideoProcessingStage,
+                        VideoProcessingStatus)
 from app.config import (
-    GOOGLE_MAPS_API_KEY,
-    REDIS_URL,
-    TRANSCRIPTION_NLP_LOCK,
     AUDIO_BASE_DIR,
+    CHANNEL_LOCK_TTL,
+    TASK_LEASE_SECONDS,
     YOUTUBE_API_KEY,
 )
 from app.database import AsyncSessionLocal
 from app.utils.logging import setup_logger
+from app.utils.transcript_utils import find_listing_timestamp
 from app.scripts.gpt_food_place_processor import GPTFoodPlaceProcessor
-from app.services.jobs import JobService
+from app.utils.openai_client import TokenUsage
+from app.services.video_processing_jobs import VideoProcessingJobService
+from app.services.google_places_service import search_places
+from app.utils.google_maps_client import GoogleMapsError
+from app.services.restaurant_resolver import get_known_restaurant_names, resolve_local_restaurant
+from app.services.taxonomy import store_restaurant_tags, store_restaurant_cuisines
+from app.utils.photo_store import build_photo_url
+from app.utils.redis_lock import hold_lock, resource_lock_key
+from app.utils.job_events import publish_job_event, video_event
+from app.utils.pipeline_stages import decode_resolved, encode_resolved, stage_completed
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import HttpRequest
@@ -41,11 +43,6 @@ from googleapiclient.http import HttpRequest
 # Setup logging
 logger = setup_logger(__name__)
 
-# Initialize Redis client
-redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
-
-gmaps = GoogleMapsClient(key=GOOGLE_MAPS_API_KEY)
-
 # Custom HTTP client to add referer header for YouTube API
 class CustomHttpRequest(HttpRequest):
     def __init__(self, *args, **kwargs):
@@ -128,34 +125,18 @@ async def get_channel_from_video_url(video_url: str) -> Optional[Dict[str, Any]]
         logger.error(f"Unexpected error fetching channel data for video URL {video_url}: {e}")
         return None
 
-async def store_influencer_from_video(db: AsyncSession, video: Video) -> Tuple[Influencer, bool]:
-    """Store or update influencer from video data if not already linked.
+async def store_influencer(db: AsyncSession, video: Video, channel_data: Dict[str, Any]) -> Tuple[Influencer, bool]:
+    """Create or update the influencer of a video's channel and link the video to it.
     
     Args:
         db: Database session
-        video: Video object
+        video: Video object (attached to ``db``)
+        channel_data: Channel data from get_channel_from_video_url (fetched outside the transaction)
         
     Returns:
         Tuple of (Influencer object, bool indicating if it's newly created)
     """
     try:
-        # Check if video already has an influencer
-        if video.influencer_id is not None:
-            # Get the existing influencer
-            result = await db.execute(
-                select(Influencer).filter(Influencer.id == video.influencer_id)
-            )
-            influencer = result.scalars().first()
-            if influencer:
-                logger.info(f"Video {video.youtube_video_id} already linked to influencer {influencer.name}")
-                return influencer, False
-        
-        # Get channel data from video URL
-        channel_data = await get_channel_from_video_url(video.video_url)
-        if not channel_data:
-            logger.error(f"Could not retrieve channel data for video {video.youtube_video_id}")
-            return None, False  # type: ignore
-            
         # Check if influencer already exists by channel ID
         result = await db.execute(
             select(Influencer).filter(Influencer.youtube_channel_id == channel_data["id"])
@@ -411,30 +392,23 @@ async def validate_restaurant(entities: dict) -> dict:
         logger.warning("No restaurant name or location found")
         return {"valid": False}
 
-    loop = asyncio.get_event_loop()
     try:
         query = f"{entities['restaurant_name']} {entities['location'].get('city', '')} {entities['location'].get('country', '')}".strip()
-        result = await loop.run_in_executor(None, lambda: gmaps.places(query=query))
+        # Cached lookup: the same place is usually mentioned by many videos
+        result = await search_places(query)
         if result["status"] == "OK" and result["results"]:
             place = result["results"][0]
             logger.info(
                 f"Validated restaurant with Google Maps: {place['name']} ({place['place_id']})"
             )
             
-            # Extract photo URL from Text Search response (no additional API call needed)
-            photo_url = None
-            try:
-                photos = place.get("photos")
-                if photos and len(photos) > 0:
-                    photo_reference = photos[0]["photo_reference"]
-                    # Construct photo URL using legacy Google Places API format
-                    photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_reference}&key={GOOGLE_MAPS_API_KEY}"
-                    logger.info(f"Found photo for {place['name']}: {photo_url}")
-                else:
-                    logger.info(f"No photos found for {place['name']}")
-            except Exception as photo_error:
-                logger.warning(f"Could not extract photo for {place['name']}: {photo_error}")
-            
+            # Keep the photo reference from the Text Search response; the photo itself is
+            # served through the /photos proxy, so no keyed Google URL is stored
+            photos = place.get("photos") or []
+            photo_reference = photos[0].get("photo_reference") if photos else None
+            if not photo_reference:
+                logger.info(f"No photos found for {place['name']}")
+
             return {
                 "valid": True,
                 "name": place["name"],
@@ -446,17 +420,52 @@ async def validate_restaurant(entities: dict) -> dict:
                 "google_place_id": place["place_id"],
                 "google_rating": place.get("rating"),
                 "business_status": place.get("business_status", BusinessStatus.BUSINESS_STATUS_UNSPECIFIED.value),
-                "photo_url": photo_url,
+                "photo_reference": photo_reference,
                 "confidence_score": entities.get("confidence_score", 0.8),
                 "tags": entities.get("tags", []),
                 "cuisines": entities.get("cuisines", []),
             }
         return {"valid": False}
-    except ApiError as e:
+    except GoogleMapsError as e:
         logger.error(f"Error validating restaurant with Google Maps: {e}")
         return {"valid": False}
 
 
+async def resolve_restaurants(entities_list: list) -> list:
+    """
+    Resolve extracted entities to restaurants without holding a transaction open during API calls.
+
+    Existing restaurants are matched first in one short read-only session; entities without
+    a confident local match are then validated with Google Maps after that session is closed.
+
+    Returns:
+        List of (entity, validated) tuples in the order of ``entities_list``
+    """
+    async with AsyncSessionLocal() as db:
+        local_matches = [await resolve_local_restaurant(db, entity) for entity in entities_list]
+
+    resolved = []
+    for entity, validated in zip(entities_list, local_matches):
+        if validated is None:
+            validated = await validate_restaurant(entity)
+        resolved.append((entity, validated))
+    return resolved
+
+
+async def store_video_listings(video_id: uuid.UUID, resolved: list) -> int:
+    """Store restaurants, tags and listings of one video in a single short transaction; returns the stored count."""
+    stored = 0
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            video = await db.get(Video, video_id)
+            for entity, validated in resolved:
+                if not validated["valid"]:
+                    continue
+                await store_restaurant_and_listing(db, video, entity, validated)
+                stored += 1
+    return stored
+
+
 async def store_restaurant_and_listing(
     db: AsyncSession, video: Video, entities: dict, validated: dict
 ):
@@ -464,15 +473,21 @@ async def store_restaurant_and_listing(
     try:
         logger.info(f"Storing restaurant and listing for video {video.youtube_video_id}")
         if validated["valid"]:
-            # Check for existing restaurant
-            result = await db.execute(
-                select(Restaurant).filter(
-                    Restaurant.google_place_id == validated["google_place_id"]
+            # Check for existing restaurant (already known when resolved locally)
+            if validated.get("restaurant_id"):
+                restaurant = await db.get(Restaurant, validated["restaurant_id"])
+            else:
+                result = await db.execute(
+                    select(Restaurant).filter(
+                        Restaurant.google_place_id == validated["google_place_id"]
+                    )
                 )
-            )
-            restaurant = result.scalars().first()
+                restaurant = result.scalars().first()
+            photo_reference = validated.get("photo_reference")
             if not restaurant:
+                restaurant_id = uuid.uuid4()
                 restaurant = Restaurant(
+                    id=restaurant_id,
                     name=validated["name"],
                     address=validated["address"],
                     latitude=validated["latitude"],
@@ -482,7 +497,8 @@ async def store_restaurant_and_listing(
                     google_place_id=validated["google_place_id"],
                     google_rating=validated["google_rating"],
                     business_status=validated["business_status"],
-                    photo_url=validated["photo_url"],
+                    photo_reference=photo_reference,
+                    photo_url=build_photo_url(restaurant_id, photo_reference) if photo_reference else None,
                     is_active=True,
                 )
                 db.add(restaurant)
@@ -490,62 +506,24 @@ async def store_restaurant_and_listing(
                 await db.refresh(restaurant)
             else:
                 restaurant.business_status = validated["business_status"]
+                if photo_reference and not restaurant.photo_url:
+                    restaurant.photo_reference = photo_reference
+                    restaurant.photo_url = build_photo_url(restaurant.id, photo_reference)
                 await db.flush()
 
-            # Store tags
-            for tag_name in validated.get("tags", []):
-                tag_name = tag_name.lower().strip()
-                result = await db.execute(select(Tag).filter(Tag.name == tag_name))
-                tag = result.scalars().first()
-                if not tag:
-                    tag = Tag(id=uuid.uuid4(), name=tag_name)
-                    db.add(tag)
-                    await db.flush()
-                    await db.refresh(tag)
-
-                # Check for existing restaurant_tag
-                result = await db.execute(
-                    select(RestaurantTag).filter(
-                        RestaurantTag.restaurant_id == restaurant.id,
-                        RestaurantTag.tag_id == tag.id,
-                    )
-                )
-                if not result.scalars().first():
-                    restaurant_tag = RestaurantTag(
-                        restaurant_id=restaurant.id, tag_id=tag.id
-                    )
-                    db.add(restaurant_tag)
-                    await db.flush()
-
-            # Store cuisines
-            for cuisine_name in validated.get("cuisines", []):
-                cuisine_name = cuisine_name.lower().strip()
-                result = await db.execute(select(Cuisine).filter(Cuisine.name == cuisine_name))
-                cuisine = result.scalars().first()
-                if not cuisine:
-                    cuisine = Cuisine(id=uuid.uuid4(), name=cuisine_name)
-                    db.add(cuisine)
-                    await db.flush()
-                    await db.refresh(cuisine)
-
-                # Check for existing restaurant_cuisine
-                result = await db.execute(
-                    select(RestaurantCuisine).filter(
-                        RestaurantCuisine.restaurant_id == restaurant.id,
-                        RestaurantCuisine.cuisine_id == cuisine.id,
-                    )
-                )
-                if not result.scalars().first():
-                    restaurant_cuisine = RestaurantCuisine(
-                        restaurant_id=restaurant.id, cuisine_id=cuisine.id
-                    )
-                    db.add(restaurant_cuisine)
-                    await db.flush()
+            # Store tags and cuisines (set-based: a fixed number of statements per restaurant)
+            await store_restaurant_tags(db, restaurant.id, validated.get("tags", []))
+            await store_restaurant_cuisines(db, restaurant.id, validated.get("cuisines", []))
 
             # Store listing
             if not isinstance(db, AsyncSession):
                 raise ValueError("db is not an AsyncSession instance")
 
+            # Map the quotes back onto the transcript to find when the place is shown
+            timestamp = find_listing_timestamp(
+                entities.get("quotes"), video.transcript_segments
+            )
+
             result = await db.execute(
                 select(Listing)
                 .filter(Listing.restaurant_id == restaurant.id)
@@ -562,6 +540,8 @@ async def store_restaurant_and_listing(
                 existing_listing.quotes = entities.get("quotes", [])
                 existing_listing.context = entities.get("context", [])
                 existing_listing.confidence_score = validated["confidence_score"]
+                if timestamp is not None:
+                    existing_listing.timestamp = timestamp
                 await db.flush()
                 return
 
@@ -573,6 +553,7 @@ async def store_restaurant_and_listing(
                 quotes=entities.get("quotes", []),
                 context=entities.get("context", []),
                 confidence_score=validated["confidence_score"],
+                timestamp=timestamp,
                 approved=False,  # Requires admin approval
             )
             db.add(listing)
@@ -596,226 +577,181 @@ async def store_restaurant_and_listing(
         raise # Let the outer transaction handle the rollback
 
 
-async def process_video(video: Video):
-    """Process a single video: transcribe, extract entities, validate, and store."""
-    async with AsyncSessionLocal() as db:  # Create a new session for each video
-        async with db.begin():  # Start a transaction for the entire process
-            try:
-                logger.info(f"Processing video {video.youtube_video_id}")
+async def publish_video_event(video_job: VideoProcessingJob, **details) -> None:
+    """Publish the progress of a video to the subscribers of its job (see app.utils.job_events)."""
+    if video_job.job_id:
+        await publish_job_event(video_event(video_job.job_id, video_job.video_id, **details))
 
-                # Merge the video object into the new session
-                video = await db.merge(video)
-                
-                # Retrieve influencer data if not already linked
-                if not video.influencer_id:
-                    logger.info(f"No influencer linked to video {video.youtube_video_id}, retrieving channel data...")
-                    influencer, is_new = await store_influencer_from_video(db, video)
-                    if influencer:
-                        logger.info(f"{'Created new' if is_new else 'Linked existing'} influencer {influencer.name} for video {video.youtube_video_id}")
-                    else:
-                        logger.warning(f"Could not retrieve influencer data for video {video.youtube_video_id}")
-
-                transcription = video.transcription or ""
-
-                gpt_processor = GPTFoodPlaceProcessor()
-
-                # If no transcription, download and transcribe
-                if not transcription:
-                    logger.info(
-                        f"No transcription found for video {video.youtube_video_id}, downloading and transcribing..."
-                    )
-                    audio_path = await download_audio(video.video_url, video)
-                    transcription = await gpt_processor.transcribe_audio(audio_path)
 
-                    logger.info(
-                        f"Transcription completed for video {video.youtube_video_id}: {transcription[:255]}..."
-                    )
+async def complete_stage(video_job: VideoProcessingJob, stage: VideoProcessingStage, **results) -> None:
+    """Persist a completed pipeline stage of a video in its own short transaction."""
+    async with AsyncSessionLocal() as db:
+        await VideoProcessingJobService.complete_stage(db, video_job.id, stage, **results)
+    await publish_video_event(video_job, stage=stage.value)
 
-                    # Update video with transcription
-                    video.transcription = transcription
-                    db.add(video)
-                    await db.flush()
 
-                # Extract entities
-                entities_list = await gpt_processor.extract_entities(video.description, transcription)
-                if not entities_list:
-                    logger.info(
-                        f"No restaurant entities found for video {video.youtube_video_id}"
-                    )
-                    return
-                logger.info(
-                    f"Entities extracted for video {video.youtube_video_id}: {entities_list}"
-                )
+async def finish_video(video_job: VideoProcessingJob, status: VideoProcessingStatus, error_message: Optional[str] = None) -> None:
+    """Record how the processing of a video ended."""
+    async with AsyncSessionLocal() as db:
+        await VideoProcessingJobService.finish_video_processing(db, video_job.id, status, error_message)
+    await publish_video_event(video_job, status=status.value, error=error_message)
 
-                for entity in entities_list:
-                    # Validate with Google Maps
-                    validated = await validate_restaurant(entity)
-                    if not validated["valid"]:
-                        logger.info(
-                            f"No valid restaurant found for video {video.youtube_video_id}"
-                        )
-                        continue
-                    logger.info(
-                        f"Validated restaurant for video {video.youtube_video_id}: {validated}"
-                    )
 
-                    # Store restaurant, tags, and listing
-                    await store_restaurant_and_listing(db, video, entity, validated)
+async def run_video_stages(video: Video, video_job: VideoProcessingJob, usage: Optional[TokenUsage] = None):
+    """Run the stages of a video not yet completed by its processing record (see process_video)."""
+    last_stage = video_job.stage.value if video_job.stage else None
+    logger.info(f"Processing video {video.youtube_video_id}")
 
-                logger.info(
-                    f"Stored restaurant, tags, and listing for video {video.youtube_video_id}"
-                )
-                return True  # Return success value
-            except Exception as e:
-                logger.error(f"Error processing video {video.youtube_video_id}: {e}")
-                raise  # Let the transaction rollback automatically
+    # Retrieve influencer data if not already linked
+    if not video.influencer_id:
+        logger.info(f"No influencer linked to video {video.youtube_video_id}, retrieving channel data...")
+        channel_data = await get_channel_from_video_url(video.video_url)
+        if channel_data:
+            # Serialize influencer creation per channel (other videos of the channel, or the scraper)
+            async with hold_lock(resource_lock_key("channel", channel_data["id"]), str(video_job.id), CHANNEL_LOCK_TTL,
+                                 wait=CHANNEL_LOCK_TTL):
+                async with AsyncSessionLocal() as db:
+                    async with db.begin():
+                        influencer, is_new = await store_influencer(db, await db.get(Video, video.id), channel_data)
+            logger.info(f"{'Created new' if is_new else 'Linked existing'} influencer {influencer.name} for video {video.youtube_video_id}")
+        else:
+            logger.warning(f"Could not retrieve influencer data for video {video.youtube_video_id}")
 
+    transcription = video.transcription or ""
 
-async def transcription_nlp_pipeline(db: AsyncSession, video_ids: Optional[list] = None, job_id: Optional[uuid.UUID] = None):
-    """Main pipeline to process videos with job tracking."""
-    start_time = time.time()
-    processed_videos = 0
-    failed_videos = 0
-    
-    try:
-        # Limit to 4-5 concurrent downloads to avoid rate limits
-        semaphore = asyncio.Semaphore(5)  # Only 5 concurrent downloads
+    gpt_processor = GPTFoodPlaceProcessor(usage=usage)
 
-        # Select videos to process
-        if video_ids:
-            result = await db.execute(
-                select(Video)
-                .filter(Video.id.in_(video_ids))
-                .options(selectinload(Video.influencer))
-            )
-        else:
-            # Select one video per influencer
-            result = await db.execute(
-                select(Video)
-                .join(Influencer)
-                .distinct(Influencer.id)
-                .order_by(
-                    Influencer.id,
-                    case(
-                        (Video.transcription.is_(None), 1),
-                        else_=0
-                    ).asc(),  # Videos with transcriptions (non-null) come first
-                    func.length(Video.transcription).asc(),  # Sort by transcription length (smallest to largest)
-                    Video.published_at.desc()
-                )
-                .limit(10)
-                .options(selectinload(Video.influencer))
+    # If no transcription, download (unless a previous attempt kept the audio) and transcribe
+    if not transcription:
+        audio_path = video_job.audio_path
+        if not (stage_completed(last_stage, "downloaded") and audio_path and os.path.exists(audio_path)):
+            logger.info(
+                f"No transcription found for video {video.youtube_video_id}, downloading and transcribing..."
             )
-        
-        videos = result.scalars().all()
-        total_videos = len(videos)
-
-        if not videos:
-            logger.info("No videos to process")
-            if job_id:
-                result_data = {"message": "No videos to process", "total_videos": 0}
-                job_data = JobUpdateRequest(result_data=json.dumps(result_data))
-                await JobService.update_job(db, job_id, job_data)
-            return {"message": "No videos to process", "total_videos": 0}
-
-        logger.info(f"Selected {total_videos} videos for processing")
-        
-        # Initialize job tracking
-        if job_id:
-            await JobService.update_tracking_stats(db, job_id,
-                queue_size=total_videos,
-                items_in_progress=0,
-                failed_items=0
+            audio_path = await download_audio(video.video_url, video)
+            await complete_stage(video_job, VideoProcessingStage.DOWNLOADED, audio_path=audio_path)
+
+        transcription, segments = await gpt_processor.transcribe_audio(audio_path, keep_audio_on_error=True)
+
+        logger.info(
+            f"Transcription completed for video {video.youtube_video_id}: {transcription[:255]}..."
+        )
+
+        # Persist the transcription and its timestamped segments right away, so a
+        # failure in a later stage does not throw the Whisper work away
+        async with AsyncSessionLocal() as db:
+            db_video = await db.get(Video, video.id)
+            db_video.transcription = transcription
+            db_video.transcript_segments = segments
+            await VideoProcessingJobService.complete_stage(
+                db, video_job.id, VideoProcessingStage.TRANSCRIBED, audio_path=None
             )
-            await JobService.update_progress(db, job_id, 0, total_videos)
+        await publish_video_event(video_job, stage=VideoProcessingStage.TRANSCRIBED.value)
+
+    # Extract entities
+    if stage_completed(last_stage, "extracted"):
+        entities_list = video_job.entities or []
+    else:
+        known_names = ()
+        if gpt_processor.use_filter:
+            async with AsyncSessionLocal() as db:
+                known_names = await get_known_restaurant_names(db)
+        entities_list = await gpt_processor.extract_entities(video.description, transcription, known_names)
+        await complete_stage(video_job, VideoProcessingStage.EXTRACTED, entities=entities_list)
+    if not entities_list:
+        logger.info(
+            f"No restaurant entities found for video {video.youtube_video_id}"
+        )
+        await finish_video(video_job, VideoProcessingStatus.SKIPPED)
+        return
+    logger.info(
+        f"Entities extracted for video {video.youtube_video_id}: {entities_list}"
+    )
 
-        async def process_with_semaphore(video):
-            nonlocal processed_videos, failed_videos
-            
-            async with semaphore:
-                try:
-                    # Update heartbeat and check for cancellation
-                    if job_id:
-                        await JobService.update_heartbeat(db, job_id)
-                        
-                        # Check for cancellation
-                        current_job = await JobService.get_job(db, job_id)
-                        if current_job and current_job.cancellation_requested:
-                            logger.info(f"Job {job_id} cancellation requested, stopping pipeline")
-                            await JobService.cancel_job(db, job_id, "Pipeline cancelled by user request")
-                            return None
-                        
-                        # Update items in progress
-                        await JobService.update_progress(db, job_id, min(5, total_videos - processed_videos - failed_videos))
-                    
-                    await asyncio.sleep(1)  # Add 1-second delay between downloads
-                    result = await process_video(video)
-                    processed_videos += 1
-                    
-                    # Update progress and processing rate
-                    if job_id:
-                        elapsed_time = time.time() - start_time
-                        processing_rate = processed_videos / (elapsed_time / 60) if elapsed_time > 0 else 0
-                        
-                        await JobService.update_progress(db, job_id, processed_videos + failed_videos, total_videos)
-                        await JobService.update_tracking_stats(db, job_id,
-                            processing_rate=processing_rate
-                        )
-                        
-                        # Estimate completion time
-                        if processing_rate > 0:
-                            remaining_items = total_videos - processed_videos - failed_videos
-                            estimated_minutes = remaining_items / processing_rate
-                            estimated_completion = datetime.now() + timedelta(minutes=estimated_minutes)
-                            job_data = JobUpdateRequest(estimated_completion_time=estimated_completion)
-                            await JobService.update_job(db, job_id, job_data)
-                    
-                    # Return True for successful processing
-                    return True
-                    
-                except Exception as e:
-                    failed_videos += 1
-                    if job_id:
-                        await JobService.update_tracking_stats(db, job_id, failed_items=failed_videos)
-                    logger.error(f"Error processing video {video.id}: {e}")
-                    return e
-
-        # Process videos concurrently
-        tasks = [process_with_semaphore(video) for video in videos]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Log results
-        successful = sum(1 for r in results if r is not None and not isinstance(r, Exception))
-        failed = len(results) - successful
+    # Match existing restaurants first, then validate with Google Maps
+    if stage_completed(last_stage, "validated"):
+        resolved = decode_resolved(video_job.resolved_entities or [])
+    else:
+        resolved = await resolve_restaurants(entities_list)
+        await complete_stage(video_job, VideoProcessingStage.VALIDATED, resolved_entities=encode_resolved(resolved))
+    if not any(validated["valid"] for _, validated in resolved):
+        logger.info(
+            f"No valid restaurant found for video {video.youtube_video_id}"
+        )
+        await finish_video(video_job, VideoProcessingStatus.SKIPPED)
+        return
 
-        logger.info(f"Transcription and NLP pipeline completed: {successful} successful, {failed} failed")
-        
-        # Final job update
-        result_data = {
-            "videos_processed": successful,
-            "total_videos": total_videos,
-            "failed_videos": failed,
-            "processing_time_minutes": (time.time() - start_time) / 60,
-            "concurrency_limit": 5
-        }
-        
-        if job_id:
-            job_data = JobUpdateRequest(result_data=json.dumps(result_data))
-            await JobService.update_job(db, job_id, job_data)
-            await JobService.update_tracking_stats(db, job_id, items_in_progress=0)
-            
-        return result_data
+    # Store restaurants, tags, and listings (idempotent, so a crash before the stage
+    # is recorded only repeats the writes)
+    await store_video_listings(video.id, resolved)
+    await complete_stage(video_job, VideoProcessingStage.STORED)
+    await finish_video(video_job, VideoProcessingStatus.COMPLETED)
+
+    logger.info(
+        f"Stored restaurant, tags, and listing for video {video.youtube_video_id}"
+    )
+    return True  # Return success value
+
+
+async def process_video(video: Video, usage: Optional[TokenUsage] = None, job_id: Optional[uuid.UUID] = None,
+                        video_job: Optional[VideoProcessingJob] = None):
+    """Process a single video: transcribe, extract entities, validate, and store.
+
+    Stages (downloaded -> transcribed -> extracted -> validated -> stored) are recorded in
+    video_processing_jobs with their results, so a rerun resumes after the last completed
+    stage. External calls (YouTube, audio download, Whisper, GPT, Google Maps) run outside
+    any database transaction; each stage's results are persisted in a short transaction.
+
+    Args:
+        video: Video to process (detached; only read here)
+        usage: Token usage accumulator of the calling job, if any
+        job_id: Job this run belongs to, if any
+        video_job: Processing record already claimed from the job queue (started here when None)
+    """
+    if video_job is None:
+        async with AsyncSessionLocal() as db:
+            video_job = await VideoProcessingJobService.start_video_processing(db, video.id, job_id)
+    last_stage = video_job.stage.value if video_job.stage else None
+    if last_stage:
+        logger.info(f"Resuming video {video.youtube_video_id} after stage '{last_stage}' (attempt {video_job.attempts})")
+
+    try:
+        # One run per video at a time, across jobs and workers
+        async with hold_lock(resource_lock_key("video", video.id), str(video_job.id), TASK_LEASE_SECONDS):
+            return await run_video_stages(video, video_job, usage)
     except Exception as e:
-        logger.error(f"Error in pipeline: {e}")
-        if job_id:
-            await JobService.update_tracking_stats(db, job_id, items_in_progress=0)
-        
-        # Return error information instead of raising
-        return {
-            "error": str(e),
-            "message": "Error in transcription pipeline",
-            "success": False
-        }
-    finally:
-        await db.close()
-        redis_client.delete(TRANSCRIPTION_NLP_LOCK)  # Ensure lock is released
+        logger.error(f"Error processing video {video.youtube_video_id}: {e}")
+        try:
+            await finish_video(video_job, VideoProcessingStatus.FAILED, str(e))
+        except Exception as record_error:
+            logger.error(f"Could not record failure of video {video.youtube_video_id}: {record_error}")
+        raise
+
+
+async def select_videos_for_processing(db: AsyncSession, video_ids: Optional[list] = None) -> list:
+    """Videos to transcribe and process: the given ones, or one video per influencer."""
+    if video_ids:
+        result = await db.execute(
+            select(Video)
+            .filter(Video.id.in_(video_ids))
+            .options(selectinload(Video.influencer))
+        )
+    else:
+        # Select one video per influencer
+        result = await db.execute(
+            select(Video)
+            .join(Influencer)
+            .distinct(Influencer.id)
+            .order_by(
+                Influencer.id,
+                case(
+                    (Video.transcription.is_(None), 1),
+                    else_=0
+                ).asc(),  # Videos with transcriptions (non-null) come first
+                func.length(Video.transcription).asc(),  # Sort by transcription length (smallest to largest)
+                Video.published_at.desc()
+            )
+            .limit(10)
+            .options(selectinload(Video.influencer))
+        )
+    return result.scalars().all()
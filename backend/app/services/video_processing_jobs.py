@@ -1,13 +1,13 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, or_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, and_, or_, exists
 
-from app.models.video_processing_job import VideoProcessingJob, VideoProcessingStatus
-from app.models.job import JobStatus
+from app.models.video_processing_job import VideoProcessingJob, VideoProcessingStatus, VideoProcessingStage
+from app.models.job import Job, JobStatus
 
 class VideoProcessingJobService:
     @staticmethod
@@ -162,4 +162,158 @@ class VideoProcessingJobService:
         """Filter video IDs into processable and already processing lists (sync version)."""
         active_video_ids = VideoProcessingJobService.get_videos_with_active_jobs_sync(db, video_ids)
         processable_video_ids = [vid for vid in video_ids if vid not in active_video_ids]
-        return processable_video_ids, active_video_ids
\ No newline at end of file
+        return processable_video_ids, active_video_ids
+
+    @staticmethod
+    async def get_latest_unfinished_attempts(db: AsyncSession, video_ids: List[UUID]) -> Dict[UUID, VideoProcessingJob]:
+        """
+        Latest failed or interrupted processing record with completed stages of each video, by video id.
+
+        Only attempts newer than the video's latest completed or skipped one count (the
+        stages of an older attempt are stale once the video was stored), and a record
+        still processing counts only once its job has finished: a live job's record is
+        not an interrupted attempt.
+        """
+        finished = aliased(VideoProcessingJob)
+        finished_since = exists().where(
+            finished.video_id == VideoProcessingJob.video_id,
+            finished.status.in_([VideoProcessingStatus.COMPLETED, VideoProcessingStatus.SKIPPED]),
+            finished.created_at >= VideoProcessingJob.created_at
+        )
+        finished_jobs = select(Job.id).where(Job.status.notin_([JobStatus.PENDING, JobStatus.RUNNING]))
+        result = await db.execute(
+            select(VideoProcessingJob)
+            .where(
+                and_(
+                    VideoProcessingJob.video_id.in_(video_ids),
+                    VideoProcessingJob.stage.isnot(None),
+                    or_(
+                        VideoProcessingJob.status == VideoProcessingStatus.FAILED,
+                        and_(
+                            VideoProcessingJob.status == VideoProcessingStatus.PROCESSING,
+                            VideoProcessingJob.job_id.in_(finished_jobs)
+                        )
+                    ),
+                    ~finished_since
+                )
+            )
+            .order_by(VideoProcessingJob.video_id, VideoProcessingJob.created_at.desc())
+            .distinct(VideoProcessingJob.video_id)
+        )
+        return {video_job.video_id: video_job for video_job in result.scalars().all()}
+
+    @staticmethod
+    def resume_from(video_job: VideoProcessingJob, previous: Optional[VideoProcessingJob]) -> VideoProcessingJob:
+        """Copy the completed stages (and their results) of a previous attempt onto a new record."""
+        if previous:
+            video_job.stage = previous.stage
+            video_job.audio_path = previous.audio_path
+            video_job.entities = previous.entities
+            video_job.resolved_entities = previous.resolved_entities
+        return video_job
+
+    @staticmethod
+    async def add_pending_videos(db: AsyncSession, video_ids: List[str], job_id: UUID) -> List[VideoProcessingJob]:
+        """Add a pending processing record per video of a job, without committing.
+
+        Each record resumes after the stages completed by the video's latest unfinished attempt.
+        """
+        video_uuids = [UUID(str(video_id)) for video_id in video_ids]
+        previous = await VideoProcessingJobService.get_latest_unfinished_attempts(db, video_uuids)
+        video_jobs = []
+        for video_id in video_uuids:
+            video_job = VideoProcessingJob(video_id=video_id, job_id=job_id, status=VideoProcessingStatus.PENDING)
+            db.add(VideoProcessingJobService.resume_from(video_job, previous.get(video_id)))
+            video_jobs.append(video_job)
+        return video_jobs
+
+    @staticmethod
+    async def enqueue_videos(db: AsyncSession, video_ids: List[str], job_id: UUID) -> List[VideoProcessingJob]:
+        """Queue a pending processing record per video of a job for workers to claim."""
+        video_jobs = await VideoProcessingJobService.add_pending_videos(db, video_ids, job_id)
+        await db.commit()
+        return video_jobs
+
+    @staticmethod
+    async def start_video_processing(db: AsyncSession, video_id: UUID, job_id: Optional[UUID] = None) -> VideoProcessingJob:
+        """Get or create the processing record of a video in a job and mark it processing.
+
+        A new record inherits the completed stages (and their results) of the video's
+        latest unfinished attempt, so the pipeline resumes after the last completed stage.
+        """
+        video_job = None
+        if job_id:
+            result = await db.execute(
+                select(VideoProcessingJob)
+                .where(
+                    and_(
+                        VideoProcessingJob.video_id == video_id,
+                        VideoProcessingJob.job_id == job_id
+                    )
+                )
+            )
+            video_job = result.scalar_one_or_none()
+
+        if video_job is None:
+            video_job = VideoProcessingJob(video_id=video_id, job_id=job_id, status=VideoProcessingStatus.PENDING)
+            previous = await VideoProcessingJobService.get_latest_unfinished_attempts(db, [video_id])
+            db.add(VideoProcessingJobService.resume_from(video_job, previous.get(video_id)))
+
+        video_job.status = VideoProcessingStatus.PROCESSING
+        video_job.attempts = (video_job.attempts or 0) + 1
+        video_job.started_at = datetime.utcnow()
+        video_job.error_message = None
+        await db.commit()
+        await db.refresh(video_job)
+        return video_job
+
+    @staticmethod
+    async def complete_stage(db: AsyncSession, video_job_id: UUID, stage: VideoProcessingStage, **results) -> None:
+        """Record a completed stage and its results; commits together with any other pending changes in ``db``."""
+        video_job = await db.get(VideoProcessingJob, video_job_id)
+        video_job.stage = stage
+        for field, value in results.items():
+            setattr(video_job, field, value)
+        await db.commit()
+
+    @staticmethod
+    async def record_finished_video(db: AsyncSession, video_id: UUID, job_id: Optional[UUID], status: VideoProcessingStatus,
+                                    stage: Optional[VideoProcessingStage], error_message: Optional[str] = None,
+                                    **results) -> VideoProcessingJob:
+        """Record a video processed outside the job queue (e.g. through the Batch API) as one finished attempt.
+
+        A rerun of the same job updates the video's record instead of adding another.
+        """
+        video_job = None
+        if job_id:
+            result = await db.execute(
+                select(VideoProcessingJob)
+                .where(VideoProcessingJob.video_id == video_id, VideoProcessingJob.job_id == job_id)
+            )
+            video_job = result.scalar_one_or_none()
+        if video_job is None:
+            video_job = VideoProcessingJob(video_id=video_id, job_id=job_id, attempts=0)
+            db.add(video_job)
+
+        now = datetime.utcnow()
+        video_job.status = status
+        video_job.stage = stage
+        video_job.attempts = (video_job.attempts or 0) + 1
+        video_job.started_at = video_job.started_at or now
+        video_job.completed_at = now
+        video_job.error_message = error_message
+        for field, value in results.items():
+            setattr(video_job, field, value)
+        await db.commit()
+        return video_job
+
+    @staticmethod
+    async def finish_video_processing(db: AsyncSession, video_job_id: UUID, status: VideoProcessingStatus,
+                                      error_message: Optional[str] = None) -> None:
+        """Mark a video's processing record completed, skipped or failed."""
+        video_job = await db.get(VideoProcessingJob, video_job_id)
+        video_job.status = status
+        video_job.error_message = error_message
+        video_job.completed_at = datetime.utcnow()
+        video_job.lease_expires_at = None
+        await db.commit()
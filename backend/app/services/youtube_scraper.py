@@ -13,8 +13,9 @@ from googleapiclient.http import HttpRequest
 from sqlalchemy.orm import Session
 
 from app.models import Influencer, Video, JobStatus
-from app.config import REDIS_URL, YOUTUBE_API_KEY, INFLUENCER_CHANNELS, SCRAPE_YOUTUBE_LOCK
+from app.config import REDIS_URL, YOUTUBE_API_KEY, INFLUENCER_CHANNELS, CHANNEL_LOCK_TTL
 from app.utils.logging import setup_logger
+from app.utils.redis_lock import hold_lock_sync, resource_lock_key
 from app.services.jobs import JobService
 from app.api_schema.jobs import JobUpdateRequest
 # from app.utils.country_utils import normalize_region_to_country_info
@@ -261,6 +262,7 @@ def scrape_youtube(db: Session, job_id: Optional[uuid.UUID] = None):
     processed_channels = 0
     total_videos_processed = 0
     failed_channels = 0
+    lock_token = str(job_id or uuid.uuid4())
     
     try:
         # Initialize job tracking
@@ -307,12 +309,17 @@ def scrape_youtube(db: Session, job_id: Optional[uuid.UUID] = None):
 
                 logger.info(f"Found channel ID: {channel_data['id']} for {channel['name']}")
 
-                # Store influencer
-                influencer = store_influencer(db, channel, channel_data)
-                
-                # Fetch and store videos
                 videos = get_videos(channel_data["id"])
 
+                # Store the influencer while holding the channel's lock (the transcription
+                # pipeline may be creating the same influencer); the lock is not renewed, so
+                # it covers only that one short transaction
+                with hold_lock_sync(redis_client, resource_lock_key("channel", channel_data["id"]), lock_token, CHANNEL_LOCK_TTL, wait=CHANNEL_LOCK_TTL):
+                    influencer = store_influencer(db, channel, channel_data)
+
+                if videos:
+                    store_videos(db, videos, influencer.id)
+
                 if not videos:
                     logger.warning(f"No videos found for channel {channel['name']} ({channel_data['id']})")
                     processed_channels += 1
@@ -322,8 +329,6 @@ def scrape_youtube(db: Session, job_id: Optional[uuid.UUID] = None):
                     continue
 
                 logger.info(f"Found {len(videos)} videos for channel {channel['name']} ({channel_data['id']}): {json.dumps(videos, indent=2)[:1000]}...")  # Log first 500 chars of video data
-
-                store_videos(db, videos, influencer.id)
                 total_videos_processed += len(videos)
                 processed_channels += 1
                 
@@ -377,4 +382,3 @@ def scrape_youtube(db: Session, job_id: Optional[uuid.UUID] = None):
         raise
     finally:
         db.close()
-        redis_client.delete(SCRAPE_YOUTUBE_LOCK)
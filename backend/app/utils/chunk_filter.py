@@ -0,0 +1,174 @@
+import re
+from typing import Iterable, Iterator, List, Optional, Sequence, Set
+
+from app.utils.logging import setup_logger
+from app.utils.transcript_utils import normalize_text
+
+logger = setup_logger(__name__)
+
+# Words naming a kind of food place
+VENUE_WORDS = {
+    "restaurant", "restaurants", "cafe", "café", "coffee shop", "bar", "pub", "bistro", "brasserie",
+    "diner", "eatery", "stall", "stalls", "food stall", "hawker", "food court", "market", "bakery",
+    "patisserie", "pizzeria", "trattoria", "osteria", "taqueria", "taquería", "izakaya", "ramen shop",
+    "noodle shop", "steakhouse", "grill", "bbq", "barbecue", "food truck", "tavern", "canteen",
+    "dhaba", "winery", "brewery", "butcher", "deli",
+}
+# Phrases used when arriving at, naming or locating a place (generic ones such as
+# "this is", "called" or "menu" come up in any long stretch of narration)
+VISIT_PHRASES = {
+    "we are at", "we're at", "welcome to", "we are here at", "we're here at", "located", "address",
+    "owner", "owners", "chef", "michelin", "reservation", "family run", "family-run", "run by",
+}
+# Words that show the narration is about food at all
+FOOD_WORDS = {
+    "eat", "eating", "ate", "taste", "tastes", "tasting", "delicious", "dish", "dishes", "flavor",
+    "flavour", "order", "ordered", "bite", "meal", "lunch", "dinner", "breakfast", "spicy", "sauce",
+    "fried", "grilled", "noodles", "rice", "soup", "dessert", "wine", "coffee",
+}
+
+WEIGHTS = {
+    "gazetteer": 3.0,  # Name also found in the video description or a known-place list
+    "venue": 1.5,
+    "named_place": 1.5,  # "at/called/named" followed by a capitalized name
+    "visit": 1.0,
+    "proper_noun": 0.5,  # Capitalized run in the middle of a sentence
+    "food": 0.25,
+}
+# Hits counted per signal and window
+MAX_HITS = {"gazetteer": 2, "venue": 3, "named_place": 2, "visit": 3, "proper_noun": 4, "food": 4}
+
+# Chunks are scored by their best window of WINDOW_WORDS words (windows overlap by half),
+# so the score of a chunk does not grow with its length: a place is named and described
+# within a few sentences, while a ~3000-token chunk of unrelated narration would collect
+# every signal somewhere
+WINDOW_WORDS = 120
+
+DEFAULT_THRESHOLD = 4.0
+
+_PROPER_NOUN_RUN = re.compile(r"(?<=[a-z,;:] )([A-Z][\w'’&-]+(?: (?:[A-Z][\w'’&-]+|de|da|di|del|la|le|of|the))*)")
+_NAME_CANDIDATE = re.compile(r"\b([A-Z][\w'’&-]+(?: (?:[A-Z][\w'’&-]+|&|de|da|di|del|la|le|of|the)){1,4})")
+_NAMED_PLACE = re.compile(r"\b(?:at|called|named)\s+(?:the\s+)?[A-Z][\w'’&-]+")
+_VISIT_PHRASES = [normalize_text(phrase) for phrase in VISIT_PHRASES]
+_COMMON_CAPITALIZED = {"i", "i'm", "i've", "i'll", "i'd", "we", "the", "this", "it", "and", "but", "so", "oh", "okay", "ok", "yes", "no"}
+
+
+def _count_phrases(text: str, phrases: Iterable[str]) -> int:
+    padded = f" {text} "
+    return sum(padded.count(f" {phrase} ") for phrase in phrases)
+
+
+def build_gazetteer(description: Optional[str], known_names: Iterable[str] = ()) -> Set[str]:
+    """
+    Collect normalized place-name candidates for a video.
+
+    Multi-word capitalized phrases in the description (where creators usually list the
+    places they visit) plus any known names, e.g. restaurants already in the database.
+    Known names that are just a venue or food word ("Bakery", "Noodles") are left out,
+    since they would match any chunk about food.
+    """
+    names = set()
+    for match in _NAME_CANDIDATE.findall(description or ""):
+        name = normalize_text(match)
+        if name and name.split()[0] not in _COMMON_CAPITALIZED:
+            names.add(name)
+    for known_name in known_names:
+        name = normalize_text(known_name or "")
+        if name and name not in VENUE_WORDS and name not in FOOD_WORDS:
+            names.add(name)
+    return names
+
+
+def _windows(chunk: str) -> Iterator[str]:
+    words = chunk.split()
+    step = WINDOW_WORDS // 2
+    for start in range(0, max(1, len(words) - step), step):
+        yield " ".join(words[start:start + WINDOW_WORDS])
+
+
+def _score_window(text: str, gazetteer: Set[str]) -> float:
+    normalized = normalize_text(text)
+    hits = {
+        "gazetteer": sum(1 for name in gazetteer if f" {name} " in f" {normalized} "),
+        "venue": _count_phrases(normalized, VENUE_WORDS),
+        "named_place": len(_NAMED_PLACE.findall(text)),
+        "visit": _count_phrases(normalized, _VISIT_PHRASES),
+        "proper_noun": sum(1 for run in _PROPER_NOUN_RUN.findall(text)
+                           if run.split()[0].lower() not in _COMMON_CAPITALIZED),
+        "food": _count_phrases(normalized, FOOD_WORDS),
+    }
+    return sum(WEIGHTS[signal] * min(count, MAX_HITS[signal]) for signal, count in hits.items())
+
+
+def score_chunk(chunk: str, gazetteer: Set[str] = frozenset()) -> float:
+    """
+    Score how likely a transcript chunk is to mention a specific food place.
+
+    Args:
+        chunk: Transcript chunk text
+        gazetteer: Normalized place names for the video (see build_gazetteer)
+
+    Returns:
+        Weighted sum of capped signal counts in the chunk's best window (see
+        WINDOW_WORDS); higher means more likely
+    """
+    return max(_score_window(window, gazetteer) for window in _windows(chunk))
+
+
+def select_candidate_chunks(
+    chunks: Sequence[str],
+    description: Optional[str] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    neighbors: int = 1,
+    known_names: Iterable[str] = (),
+) -> List[int]:
+    """
+    Pick the chunks worth sending to the full extractor.
+
+    Chunks scoring at least ``threshold`` are candidates; their ``neighbors`` on each
+    side are kept too, since a place is often named in one chunk and described in the next.
+    When no chunk qualifies every chunk is kept: the filter only ranks chunks, it does not
+    decide that a video has no places.
+
+    Returns:
+        Sorted indices of the selected chunks
+    """
+    gazetteer = build_gazetteer(description, known_names)
+    selected = set()
+    for index, chunk in enumerate(chunks):
+        if score_chunk(chunk, gazetteer) >= threshold:
+            selected.update(range(max(0, index - neighbors), min(len(chunks), index + neighbors + 1)))
+    if not selected:
+        return list(range(len(chunks)))
+    return sorted(selected)
+
+
+def evaluate_filter(samples: Sequence[dict], threshold: float = DEFAULT_THRESHOLD) -> dict:
+    """
+    Measure the filter on labeled chunks (without neighbor expansion).
+
+    Args:
+        samples: Dicts with "text", "has_place" (bool) and optionally "description"
+        threshold: Score threshold to evaluate
+
+    Returns:
+        Precision, recall and the share of chunks that would be sent to the extractor
+    """
+    true_positives = false_positives = false_negatives = 0
+    for sample in samples:
+        predicted = score_chunk(sample["text"], build_gazetteer(sample.get("description"))) >= threshold
+        if predicted and sample["has_place"]:
+            true_positives += 1
+        elif predicted:
+            false_positives += 1
+        elif sample["has_place"]:
+            false_negatives += 1
+
+    selected = true_positives + false_positives
+    positives = true_positives + false_negatives
+    return {
+        "samples": len(samples),
+        "precision": round(true_positives / selected, 3) if selected else 0.0,
+        "recall": round(true_positives / positives, 3) if positives else 0.0,
+        "selected_rate": round(selected / len(samples), 3) if samples else 0.0,
+    }
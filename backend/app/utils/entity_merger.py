@@ -0,0 +1,118 @@
+import unicodedata
+from difflib import SequenceMatcher
+from typing import List, Optional
+
+from app.utils.entity_parser import DEFAULT_CONFIDENCE_SCORE
+from app.utils.logging import setup_logger
+from app.utils.transcript_utils import normalize_text
+
+logger = setup_logger(__name__)
+
+# Minimum name similarity (0-1) for two entities to be treated as the same place
+NAME_SIMILARITY_THRESHOLD = 0.85
+# Leading words that do not distinguish one place from another
+_NAME_PREFIXES = ("the ",)
+_LOCATION_FIELDS = ("city", "county", "country")
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Normalize a place name for comparison: no accents, case, punctuation or leading article."""
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = normalize_text(text)
+    for prefix in _NAME_PREFIXES:
+        if text.startswith(prefix):
+            text = text[len(prefix):]
+    return text
+
+
+def _locations_compatible(a: dict, b: dict) -> bool:
+    """Locations conflict only when both sides name a different city or country."""
+    for field in ("city", "country"):
+        left = normalize_name((a or {}).get(field))
+        right = normalize_name((b or {}).get(field))
+        if left and right and left != right:
+            return False
+    return True
+
+
+def is_same_place(a: dict, b: dict, threshold: float = NAME_SIMILARITY_THRESHOLD) -> bool:
+    """Whether two extracted entities most likely refer to the same place."""
+    if not _locations_compatible(a.get("location"), b.get("location")):
+        return False
+    name_a = normalize_name(a.get("restaurant_name"))
+    name_b = normalize_name(b.get("restaurant_name"))
+    if not name_a or not name_b:
+        return False
+    return name_a == name_b or SequenceMatcher(None, name_a, name_b).ratio() >= threshold
+
+
+def _union(values: List[Optional[list]], key=normalize_text) -> Optional[list]:
+    """Concatenate lists in order, skipping items already present (compared by ``key``)."""
+    merged = []
+    seen = set()
+    for items in values:
+        for item in items or []:
+            marker = key(item)
+            if marker and marker not in seen:
+                seen.add(marker)
+                merged.append(item)
+    return merged
+
+
+def _merge_cluster(cluster: List[dict]) -> dict:
+    """Combine the entities of one place, preferring the most confident one for scalar fields."""
+    ranked = sorted(cluster, key=lambda entity: entity.get("confidence_score") or 0.0, reverse=True)
+    best = ranked[0]
+
+    location = {}
+    for field in _LOCATION_FIELDS:
+        location[field] = next(
+            ((entity.get("location") or {}).get(field) for entity in ranked if (entity.get("location") or {}).get(field)),
+            None,
+        )
+
+    quotes = _union([entity.get("quotes") for entity in cluster])
+    context = _union([entity.get("context") for entity in cluster])
+    scores = [entity["confidence_score"] for entity in cluster if entity.get("confidence_score") is not None]
+
+    merged = dict(best)
+    merged.update({
+        "location": location,
+        "quotes": quotes or None,
+        "tags": _union([entity.get("tags") for entity in cluster], key=str.casefold),
+        "cuisines": _union([entity.get("cuisines") for entity in cluster], key=str.casefold),
+        "context": context or None,
+        # Entities cached before every parsed place had a score may still lack one
+        "confidence_score": max(scores) if scores else DEFAULT_CONFIDENCE_SCORE,
+    })
+    return merged
+
+
+def merge_entities(entities: List[dict], threshold: float = NAME_SIMILARITY_THRESHOLD) -> List[dict]:
+    """
+    Merge entities extracted from different chunks that describe the same place.
+
+    Entities are clustered by normalized name (exact or fuzzy match) with compatible
+    locations. Each cluster becomes one entity whose quotes, context, tags and cuisines
+    are the union of its members and whose confidence is the highest among them.
+
+    Args:
+        entities: Flattened per-chunk entities, in transcript order
+        threshold: Minimum name similarity for a fuzzy match
+
+    Returns:
+        Merged entities, ordered by first mention
+    """
+    clusters: List[List[dict]] = []
+    for entity in entities:
+        for cluster in clusters:
+            if any(is_same_place(entity, member, threshold) for member in cluster):
+                cluster.append(entity)
+                break
+        else:
+            clusters.append([entity])
+
+    if len(clusters) < len(entities):
+        logger.info(f"Merged {len(entities)} extracted entities into {len(clusters)} places")
+    return [_merge_cluster(cluster) for cluster in clusters]
@@ -0,0 +1,220 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Parse outcomes reported by parse_entities
+PARSE_OK = "ok"
+PARSE_SALVAGED = "salvaged"
+PARSE_DROPPED = "dropped"
+
+# Confidence given to a place the model returned without a usable score
+DEFAULT_CONFIDENCE_SCORE = 0.8
+
+_NULLABLE_STRING = {"type": ["string", "null"]}
+_NULLABLE_STRING_ARRAY = {"type": ["array", "null"], "items": {"type": "string"}}
+
+# Structured-output schema (strict mode) for the extraction response. Strict mode needs an
+# object at the top level, so the entity array is wrapped in a "places" field.
+FOOD_PLACES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "food_places",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "places": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "restaurant_name": _NULLABLE_STRING,
+                            "location": {
+                                "type": "object",
+                                "properties": {
+                                    "city": _NULLABLE_STRING,
+                                    "county": _NULLABLE_STRING,
+                                    "country": _NULLABLE_STRING,
+                                },
+                                "required": ["city", "county", "country"],
+                                "additionalProperties": False,
+                            },
+                            "quotes": _NULLABLE_STRING_ARRAY,
+                            "tags": {"type": "array", "items": {"type": "string"}},
+                            "cuisines": {"type": "array", "items": {"type": "string"}},
+                            "context": _NULLABLE_STRING_ARRAY,
+                            "confidence_score": {"type": "number"},
+                        },
+                        "required": [
+                            "restaurant_name", "location", "quotes", "tags",
+                            "cuisines", "context", "confidence_score",
+                        ],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["places"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _as_string_list(value: Any) -> Optional[List[str]]:
+    """Repair list-of-string fields: wrap a bare string, drop blanks and non-strings."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return None
+    return [item.strip() for item in value if isinstance(item, str) and item.strip()]
+
+
+class ExtractedLocation(BaseModel):
+    city: Optional[str] = None
+    county: Optional[str] = None
+    country: Optional[str] = None
+
+
+class ExtractedPlace(BaseModel):
+    """One food place as returned by the extraction model, after repair."""
+    restaurant_name: str
+    location: ExtractedLocation = Field(default_factory=ExtractedLocation)
+    quotes: Optional[List[str]] = None
+    tags: List[str] = Field(default_factory=list)
+    cuisines: List[str] = Field(default_factory=list)
+    context: Optional[List[str]] = None
+    confidence_score: float = DEFAULT_CONFIDENCE_SCORE
+
+    @field_validator("restaurant_name", mode="before")
+    @classmethod
+    def validate_restaurant_name(cls, value):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("restaurant_name is required")
+        return value.strip()
+
+    @field_validator("location", mode="before")
+    @classmethod
+    def repair_location(cls, value):
+        return value if isinstance(value, dict) else {}
+
+    @field_validator("quotes", "context", mode="before")
+    @classmethod
+    def repair_optional_lists(cls, value):
+        return _as_string_list(value)
+
+    @field_validator("tags", "cuisines", mode="before")
+    @classmethod
+    def repair_lists(cls, value):
+        return _as_string_list(value) or []
+
+    @field_validator("confidence_score", mode="before")
+    @classmethod
+    def repair_confidence_score(cls, value):
+        try:
+            return min(1.0, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return DEFAULT_CONFIDENCE_SCORE
+
+
+def salvage_json_objects(text: str) -> List[dict]:
+    """
+    Recover the complete objects of a JSON array from truncated or malformed output.
+
+    Scans the entity array (the "places" field, or the first array in the text) and
+    parses every top-level object whose closing brace was reached, ignoring the
+    incomplete tail left when the model hit max_tokens.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        List of parsed objects (possibly empty)
+    """
+    anchor = text.find('"places"')
+    start = text.find("[", anchor if anchor >= 0 else 0)
+    if start < 0:
+        return []
+
+    objects = []
+    depth = 0
+    object_start = None
+    in_string = False
+    escaped = False
+    for position in range(start + 1, len(text)):
+        char = text[position]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == "{":
+            if depth == 0:
+                object_start = position
+            depth += 1
+        elif char == "}" and depth > 0:
+            depth -= 1
+            if depth == 0 and object_start is not None:
+                try:
+                    objects.append(json.loads(text[object_start:position + 1]))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unparseable object at offset {object_start}")
+                object_start = None
+        elif char == "]" and depth == 0:
+            break
+    return objects
+
+
+def validate_entities(items: List[Any]) -> List[dict]:
+    """Validate and repair raw entity dicts, dropping those that cannot be used."""
+    entities = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            entities.append(ExtractedPlace.model_validate(item).model_dump())
+        except ValidationError as e:
+            logger.info(f"Dropping invalid entity {item.get('restaurant_name')!r}: {e.errors()[0]['msg']}")
+    return entities
+
+
+def parse_entities(content: Optional[str]) -> Tuple[List[dict], str]:
+    """
+    Parse an extraction response into validated entity dicts.
+
+    Accepts the structured-output shape ({"places": [...]}), a bare array or a single
+    object. When the JSON is invalid (typically truncated), complete objects are salvaged.
+
+    Args:
+        content: Raw message content from the model
+
+    Returns:
+        Tuple of (entities, status) where status is PARSE_OK, PARSE_SALVAGED or PARSE_DROPPED
+    """
+    if not content or not content.strip():
+        return [], PARSE_DROPPED
+
+    try:
+        parsed = json.loads(content)
+    except json.JSONDecodeError:
+        salvaged = salvage_json_objects(content)
+        if not salvaged:
+            return [], PARSE_DROPPED
+        return validate_entities(salvaged), PARSE_SALVAGED
+
+    if isinstance(parsed, dict):
+        parsed = parsed["places"] if isinstance(parsed.get("places"), list) else [parsed]
+    if not isinstance(parsed, list):
+        return [], PARSE_DROPPED
+    return validate_entities(parsed), PARSE_OK
@@ -0,0 +1,48 @@
+import hashlib
+import json
+from typing import Optional
+
+from app.config import EXTRACTION_CACHE_TTL
+from app.utils.logging import setup_logger
+from app.utils.redis_utils import get_redis_client
+
+logger = setup_logger(__name__)
+
+EXTRACTION_CACHE_PREFIX = "extraction_cache"
+
+
+def extraction_cache_key(model: str, prompt_version: str, description: Optional[str], chunk: str) -> str:
+    """
+    Build the cache key of one chunk extraction.
+
+    Everything that changes the model's answer is hashed, so editing the prompt
+    (with a PROMPT_VERSION bump), switching model, or changing the description or
+    chunk text produces a new key and a fresh GPT call.
+    """
+    payload = json.dumps([model, prompt_version, description or "", chunk], ensure_ascii=False)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{EXTRACTION_CACHE_PREFIX}:{digest}"
+
+
+async def get_cached_entities(key: str) -> Optional[list]:
+    """Get the parsed entity list stored for a chunk, or None on a miss or when Redis is down."""
+    client = await get_redis_client()
+    if client is None:
+        return None
+    try:
+        cached = await client.get(key)
+        return json.loads(cached) if cached is not None else None
+    except Exception as e:
+        logger.warning(f"Extraction cache read failed for {key}: {e}")
+        return None
+
+
+async def set_cached_entities(key: str, entities: list) -> None:
+    """Store the parsed entity list of a chunk (an empty list is a valid, cacheable answer)."""
+    client = await get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.setex(key, EXTRACTION_CACHE_TTL, json.dumps(entities, ensure_ascii=False))
+    except Exception as e:
+        logger.warning(f"Extraction cache write failed for {key}: {e}")
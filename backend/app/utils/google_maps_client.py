@@ -0,0 +1,152 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import httpx
+
+from app.config import GOOGLE_MAPS_API_KEY, GOOGLE_MAPS_MAX_CONNECTIONS, GOOGLE_MAPS_QPS
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+GOOGLE_MAPS_BASE_URL = "https://maps.googleapis.com/maps/api"
+# Statuses meaning "no match" rather than a failure; returned to the caller instead of raised
+NO_MATCH_STATUSES = {"ZERO_RESULTS", "NOT_FOUND"}
+
+google_maps_client: Optional["GoogleMapsClient"] = None
+
+
+class GoogleMapsError(Exception):
+    """A Places/Geocoding request failed; ``status`` is the API status (e.g. OVER_QUERY_LIMIT)."""
+
+    def __init__(self, status: str, message: Optional[str] = None):
+        super().__init__(f"{status}: {message}" if message else status)
+        self.status = status
+        self.message = message
+
+
+def get_google_maps_client() -> "GoogleMapsClient":
+    """Get the process-wide GoogleMapsClient, creating it on first use."""
+    global google_maps_client
+    if google_maps_client is None:
+        google_maps_client = GoogleMapsClient(GOOGLE_MAPS_API_KEY)
+    return google_maps_client
+
+
+async def close_google_maps_client() -> None:
+    """Close the shared client's connection pool (on application shutdown)."""
+    global google_maps_client
+    if google_maps_client is not None:
+        await google_maps_client.aclose()
+        google_maps_client = None
+
+
+class GoogleMapsClient:
+    """
+    Async client for the Places (legacy) and Geocoding web services.
+
+    All requests share one pooled httpx.AsyncClient and a requests-per-second limit.
+    Identical requests issued while one is already in flight wait for that request
+    instead of sending their own (singleflight). Pass an httpx transport (e.g.
+    httpx.MockTransport) to run offline.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        qps: float = GOOGLE_MAPS_QPS,
+        max_connections: int = GOOGLE_MAPS_MAX_CONNECTIONS,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.api_key = api_key
+        self.http = httpx.AsyncClient(
+            base_url=GOOGLE_MAPS_BASE_URL,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+        self.interval = 1.0 / qps if qps > 0 else 0.0
+        self._next_slot = 0.0
+        self._throttle_lock = asyncio.Lock()
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+        self.metrics = {"requests": 0, "coalesced": 0, "errors": 0}
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def _throttle(self) -> None:
+        """Space requests at least ``interval`` seconds apart."""
+        async with self._throttle_lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _send(self, path: str, params: dict) -> dict:
+        await self._throttle()
+        self.metrics["requests"] += 1
+        try:
+            response = await self.http.get(f"/{path}/json", params={**params, "key": self.api_key})
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPError as e:
+            self.metrics["errors"] += 1
+            raise GoogleMapsError("HTTP_ERROR", str(e)) from e
+
+        status = data.get("status")
+        if status != "OK" and status not in NO_MATCH_STATUSES:
+            self.metrics["errors"] += 1
+            raise GoogleMapsError(status or "UNKNOWN_ERROR", data.get("error_message"))
+        return data
+
+    async def _request(self, path: str, params: dict) -> dict:
+        """Send a request, or join the identical one already in flight."""
+        key = (path, tuple(sorted(params.items())))
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.metrics["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._send(path, params))
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def places(self, query: str, language: Optional[str] = None) -> dict:
+        """Places Text Search; returns the response ({"status", "results", ...})."""
+        params = {"query": query}
+        if language:
+            params["language"] = language
+        return await self._request("place/textsearch", params)
+
+    async def place(self, place_id: str, fields: Optional[Iterable[str]] = None, language: Optional[str] = None) -> dict:
+        """Place Details; returns the response ({"status", "result", ...})."""
+        params: Dict[str, Any] = {"place_id": place_id}
+        if fields:
+            params["fields"] = ",".join(fields)
+        if language:
+            params["language"] = language
+        return await self._request("place/details", params)
+
+    async def photo(self, photo_reference: str, max_width: int) -> bytes:
+        """Download a Places photo (the API redirects to the image); returns the image bytes."""
+        await self._throttle()
+        self.metrics["requests"] += 1
+        try:
+            response = await self.http.get(
+                "/place/photo",
+                params={"photo_reference": photo_reference, "maxwidth": max_width, "key": self.api_key},
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.metrics["errors"] += 1
+            raise GoogleMapsError("HTTP_ERROR", str(e)) from e
+        return response.content
+
+    async def geocode(self, address: str) -> list:
+        """Geocode an address; returns the result list (empty for ZERO_RESULTS)."""
+        data = await self._request("geocode", {"address": address})
+        return data.get("results", [])
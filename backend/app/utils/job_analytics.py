@@ -0,0 +1,149 @@
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+# Aggregates of one (job_type, status) group of jobs, as returned by JobService.get_job_group_stats
+SUMMED_FIELDS = (
+    "jobs", "cancellation_requests", "failed_items", "processed_items", "queue_size", "items_in_progress",
+    "duration_count", "duration_sum", "rate_count", "rate_sum",
+)
+ACTIVE_STATUSES = ("running", "pending")
+
+
+def combine_groups(groups: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregates of several groups together (sums add up; minimums and maximums are kept)."""
+    combined = {field: 0 for field in SUMMED_FIELDS}
+    combined.update(duration_min=None, duration_max=None, rate_min=None, rate_max=None)
+    for group in groups:
+        for field in SUMMED_FIELDS:
+            combined[field] += float(group.get(field) or 0) if field.endswith("_sum") else int(group.get(field) or 0)
+        for field, pick in (("duration_min", min), ("duration_max", max), ("rate_min", min), ("rate_max", max)):
+            value = group.get(field)
+            if value is not None:
+                value = float(value)
+                combined[field] = value if combined[field] is None else pick(combined[field], value)
+    return combined
+
+
+def _select(groups: Sequence[Dict[str, Any]], job_type: Optional[str] = None,
+            statuses: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    statuses = set(statuses) if statuses is not None else None
+    return combine_groups(
+        group for group in groups
+        if (job_type is None or group["job_type"] == job_type) and (statuses is None or group["status"] in statuses)
+    )
+
+
+def _rate(part: float, total: float) -> float:
+    return (part / total * 100) if total > 0 else 0
+
+
+def job_analytics(groups: Sequence[Dict[str, Any]], job_types: Iterable[str]) -> Dict[str, Any]:
+    """
+    Completion rates, processing times, success ratios, processing rates and queue metrics
+    by job type (the fields of JobAnalyticsResponse but period_analyzed).
+
+    Args:
+        groups: Aggregates of the jobs of the period, by (job_type, status)
+        job_types: Job type values to report on
+    """
+    completion_rates_by_type = {}
+    average_processing_times = {}
+    success_failure_ratios = {}
+    for job_type in job_types:
+        durations = _select(groups, job_type)
+        total = durations["jobs"]
+        completed = _select(groups, job_type, ["completed"])["jobs"]
+        failed = _select(groups, job_type, ["failed"])["jobs"]
+        cancelled = _select(groups, job_type, ["cancelled"])["jobs"]
+
+        completion_rates_by_type[job_type] = {
+            "completed": completed,
+            "total": total,
+            "rate": _rate(completed, total)
+        }
+        average_processing_times[job_type] = {
+            "average_minutes": durations["duration_sum"] / durations["duration_count"] if durations["duration_count"] else 0,
+            "min_minutes": durations["duration_min"] or 0,
+            "max_minutes": durations["duration_max"] or 0,
+            "sample_size": durations["duration_count"]
+        }
+        total_finished = completed + failed + cancelled
+        success_failure_ratios[job_type] = {
+            "success_count": completed,
+            "failure_count": failed,
+            "cancelled_count": cancelled,
+            "success_rate": _rate(completed, total_finished),
+            "failure_rate": _rate(failed, total_finished)
+        }
+
+    every_job = _select(groups)
+    active = _select(groups, statuses=ACTIVE_STATUSES)
+    return {
+        "completion_rates_by_type": completion_rates_by_type,
+        "average_processing_times": average_processing_times,
+        "success_failure_ratios": success_failure_ratios,
+        "processing_rate_statistics": {
+            "average_rate": every_job["rate_sum"] / every_job["rate_count"] if every_job["rate_count"] else 0,
+            "min_rate": every_job["rate_min"] or 0,
+            "max_rate": every_job["rate_max"] or 0,
+            "sample_size": every_job["rate_count"]
+        },
+        "queue_metrics": {
+            "total_queue_size": active["queue_size"],
+            "total_items_in_progress": active["items_in_progress"],
+            "total_failed_items": every_job["failed_items"],
+            "active_jobs_count": active["jobs"]
+        },
+        "total_jobs": every_job["jobs"],
+    }
+
+
+def jobs_summary(groups: Sequence[Dict[str, Any]], statuses: Iterable[str]) -> Dict[str, Any]:
+    """
+    Job counts by status and item totals over all jobs.
+
+    Args:
+        groups: Aggregates of all jobs, by (job_type, status)
+        statuses: Job status values to count
+
+    Returns:
+        status_counts, total_jobs and statistics (as in the /status/summary/ response)
+    """
+    status_counts = {status: _select(groups, statuses=[status])["jobs"] for status in statuses}
+    every_job = _select(groups)
+    return {
+        "status_counts": status_counts,
+        "total_jobs": sum(status_counts.values()),
+        "statistics": {
+            "total_failed_items": every_job["failed_items"],
+            "total_processed_items": every_job["processed_items"],
+            "total_queue_size": every_job["queue_size"],
+            "active_jobs_with_cancellation": _select(groups, statuses=ACTIVE_STATUSES)["cancellation_requests"],
+            "total_cancellation_requests": every_job["cancellation_requests"]
+        },
+    }
+
+
+def performance_analytics(groups: Sequence[Dict[str, Any]], job_types: Iterable[str], days: int) -> Dict[str, Any]:
+    """
+    Job counts, success rate and average processing rate of completed jobs over a period.
+
+    Args:
+        groups: Aggregates of the jobs of the period, by (job_type, status)
+        job_types: Job type values to break the count down by
+        days: Length of the period
+    """
+    completed = _select(groups, statuses=["completed"])
+    failed = _select(groups, statuses=["failed"])["jobs"]
+    cancelled = _select(groups, statuses=["cancelled"])["jobs"]
+    total_finished = completed["jobs"] + failed + cancelled
+    average_rate = completed["rate_sum"] / completed["rate_count"] if completed["rate_count"] else 0
+    return {
+        "period_days": days,
+        "total_jobs": _select(groups)["jobs"],
+        "completed_jobs": completed["jobs"],
+        "failed_jobs": failed,
+        "cancelled_jobs": cancelled,
+        "success_rate": round(_rate(completed["jobs"], total_finished), 2),
+        "average_processing_rate": round(average_rate, 2),
+        "job_types_breakdown": {job_type: _select(groups, job_type)["jobs"] for job_type in job_types}
+    }
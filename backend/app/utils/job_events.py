@@ -0,0 +1,160 @@
+import json
+import time
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+from jose import JWTError, jwt
+
+from app.config import ALGORITHM
+from app.utils.logging import setup_logger
+from app.utils.redis_utils import get_redis_client
+
+logger = setup_logger(__name__)
+
+# Every job event is published on the job's channel and on the channel of all jobs
+JOB_EVENTS_CHANNEL = "jobs:events"
+
+# Job columns carried by progress events
+PROGRESS_FIELDS = (
+    "status", "progress", "total_items", "processed_items", "failed_items", "items_in_progress",
+    "queue_size", "processing_rate", "estimated_completion_time",
+)
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+# Audience of event stream tokens, so they are not accepted as API tokens (and vice versa)
+EVENTS_TOKEN_AUDIENCE = "job-events"
+
+
+def job_events_channel(job_id) -> str:
+    """Pub/sub channel of one job's events."""
+    return f"jobs:{job_id}:events"
+
+
+def create_events_token(user: Dict[str, Any], secret: str, ttl: int, now: Optional[float] = None) -> str:
+    """
+    Short-lived token for connecting to a job event stream.
+
+    EventSource cannot send an Authorization header, so the stream endpoints take this
+    token as a query parameter instead of the (long-lived) Supabase access token.
+    """
+    issued_at = int(time.time() if now is None else now)
+    claims = {
+        "sub": user.get("sub"),
+        "email": user.get("email"),
+        "aud": EVENTS_TOKEN_AUDIENCE,
+        "iat": issued_at,
+        "exp": issued_at + ttl,
+    }
+    return jwt.encode(claims, secret, algorithm=ALGORITHM)
+
+
+def verify_events_token(token: str, secret: str) -> Optional[Dict[str, Any]]:
+    """Claims of a valid, unexpired event stream token, or None."""
+    try:
+        return jwt.decode(token, secret, algorithms=[ALGORITHM], audience=EVENTS_TOKEN_AUDIENCE)
+    except JWTError:
+        return None
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def progress_event(job_id, values: Dict[str, Any]) -> Dict[str, Any]:
+    """A "progress" event from job column values (see PROGRESS_FIELDS; others are ignored)."""
+    event = {"type": "progress", "job_id": str(job_id)}
+    event.update({field: _jsonable(values[field]) for field in PROGRESS_FIELDS if field in values})
+    return event
+
+
+def job_event(job) -> Dict[str, Any]:
+    """A "progress" event with the current state of a job."""
+    return progress_event(job.id, {field: getattr(job, field) for field in PROGRESS_FIELDS})
+
+
+def video_event(job_id, video_id, stage: Optional[str] = None, status: Optional[str] = None,
+                error: Optional[str] = None) -> Dict[str, Any]:
+    """A "video" event: a video of the job completed a pipeline stage, or finished with a status."""
+    event = {"type": "video", "job_id": str(job_id), "video_id": str(video_id)}
+    if stage:
+        event["stage"] = stage
+    if status:
+        event["status"] = status
+    if error:
+        event["error"] = error
+    return event
+
+
+def is_terminal_event(event: Dict[str, Any]) -> bool:
+    """Whether an event reports that its job has finished."""
+    return event.get("type") == "progress" and event.get("status") in TERMINAL_STATUSES
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Server-sent events frame of an event (its type is the SSE event name)."""
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def publish_job_event(event: Dict[str, Any]) -> None:
+    """Publish an event to its job's subscribers; a no-op when Redis is unreachable."""
+    client = await get_redis_client()
+    if client is None:
+        return
+    message = json.dumps(event)
+    try:
+        await client.publish(job_events_channel(event["job_id"]), message)
+        await client.publish(JOB_EVENTS_CHANNEL, message)
+    except Exception as e:
+        logger.warning(f"Failed to publish event of job {event['job_id']}: {e}")
+
+
+async def subscribe_job_events(client, channels: Iterable[str]):
+    """A pub/sub connection subscribed to job event channels (subscribe before reading a job's state, so no event is missed)."""
+    pubsub = client.pubsub()
+    await pubsub.subscribe(*channels)
+    return pubsub
+
+
+async def stream_job_events(pubsub, keepalive: float = 15.0, first: Optional[Dict[str, Any]] = None,
+                            until: Optional[Callable[[Dict[str, Any]], bool]] = None) -> AsyncIterator[str]:
+    """
+    Server-sent events frames of the events received by ``pubsub``, until cancelled.
+
+    A comment frame is sent after ``keepalive`` idle seconds so proxies keep the
+    connection open (and a closed connection is noticed). The pub/sub connection is
+    closed when the stream ends.
+
+    Args:
+        pubsub: Subscribed pub/sub connection (see subscribe_job_events)
+        keepalive: Seconds between keepalive frames while idle
+        first: Event to send before those received (e.g. the job's current state)
+        until: Stop after the first event for which this returns True
+    """
+    try:
+        if first is not None:
+            yield format_sse(first)
+            if until and until(first):
+                return
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=keepalive)
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            if message.get("type") != "message":
+                continue
+            try:
+                event = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            yield format_sse(event)
+            if until and until(event):
+                return
+    finally:
+        try:
+            await pubsub.aclose()
+        except Exception:
+            pass
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Writes the current progress of a job, by id
+ProgressWriter = Callable[[Any], Awaitable[None]]
+
+
+def progress_values(total: int, processed: int, failed: int, in_progress: int, elapsed_seconds: float,
+                    now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Job columns describing the progress of a job over ``total`` items.
+
+    Args:
+        total: Items in the job
+        processed: Items finished successfully
+        failed: Items that failed
+        in_progress: Items being processed
+        elapsed_seconds: Seconds since the job started
+        now: Current time (UTC) to estimate the completion time from
+
+    Returns:
+        progress (percentage), processed_items, failed_items, items_in_progress, queue_size,
+        processing_rate (items per minute) and, once a rate is known, estimated_completion_time
+    """
+    done = processed + failed
+    remaining = max(0, total - done)
+    rate = processed / (elapsed_seconds / 60) if elapsed_seconds > 0 else 0.0
+    values = {
+        "progress": min(100, int(100 * done / total)) if total else 100,
+        "processed_items": done,
+        "failed_items": failed,
+        "items_in_progress": in_progress,
+        "queue_size": max(0, remaining - in_progress),
+        "processing_rate": rate,
+    }
+    if rate > 0:
+        values["estimated_completion_time"] = (now or datetime.utcnow()) + timedelta(minutes=remaining / rate)
+    return values
+
+
+class JobProgressReporter:
+    """
+    Coalesces the progress writes of the jobs whose items a worker is processing.
+
+    Items report to the reporter in memory (started / finished); a timer then writes
+    each reported job once every ``flush_interval`` seconds, instead of one locked
+    write per item. A job is written again on each tick while the process still has
+    items of it in progress, so its progress, ETA and heartbeat are never more than
+    ``flush_interval`` seconds old, even while a long item runs without reporting.
+    """
+
+    def __init__(self, writer: ProgressWriter, flush_interval: float = 2.0):
+        """
+        Args:
+            writer: Writes the current progress of a job, by id
+            flush_interval: Seconds between writes of a job
+        """
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.in_progress: Dict[Any, int] = {}
+        self.writes = 0
+        self._reported: Set[Any] = set()
+        self._lock = asyncio.Lock()
+
+    def item_started(self, job_id) -> None:
+        self.in_progress[job_id] = self.in_progress.get(job_id, 0) + 1
+        self._reported.add(job_id)
+
+    def item_finished(self, job_id) -> None:
+        left = self.in_progress.get(job_id, 0) - 1
+        if left > 0:
+            self.in_progress[job_id] = left
+        else:
+            self.in_progress.pop(job_id, None)
+        self._reported.add(job_id)
+
+    async def flush(self) -> None:
+        """Write every job reported since the last flush or with items in progress."""
+        async with self._lock:
+            job_ids = self._reported | set(self.in_progress)
+            self._reported = set()
+            for job_id in job_ids:
+                try:
+                    await self.writer(job_id)
+                except Exception as e:
+                    logger.warning(f"Could not write progress of job {job_id}: {e}")
+                    continue
+                self.writes += 1
+
+    async def run(self) -> None:
+        """Flush every ``flush_interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
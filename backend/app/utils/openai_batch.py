@@ -0,0 +1,185 @@
+import json
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openai.types.chat import ChatCompletion
+
+from app.utils.logging import setup_logger
+from app.utils.openai_client import get_openai_client
+
+logger = setup_logger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+# Batch statuses after which the batch will not change anymore
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+# Per-file limits of the Batch API
+BATCH_MAX_REQUESTS = 50_000
+BATCH_MAX_FILE_BYTES = 200 * 1024 * 1024
+
+
+def build_batch_line(custom_id: str, body: dict) -> dict:
+    """Build one request line of a Batch API input file."""
+    return {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+
+
+def encode_batch_file(lines: List[dict]) -> bytes:
+    """Serialize request lines as the JSONL payload uploaded to the Batch API."""
+    return "\n".join(json.dumps(line, ensure_ascii=False) for line in lines).encode("utf-8")
+
+
+def split_batch_lines(
+    lines: List[dict],
+    max_requests: int = BATCH_MAX_REQUESTS,
+    max_bytes: int = BATCH_MAX_FILE_BYTES,
+) -> List[List[dict]]:
+    """
+    Split request lines into groups that each fit in one Batch API input file.
+
+    Args:
+        lines: Request lines, in order
+        max_requests: Maximum number of requests per file
+        max_bytes: Maximum size of an encoded file
+
+    Returns:
+        Consecutive groups of lines; empty when there are no lines
+    """
+    groups: List[List[dict]] = []
+    current: List[dict] = []
+    current_bytes = 0
+    for line in lines:
+        # Encoded size of the line plus its newline separator
+        line_bytes = len(json.dumps(line, ensure_ascii=False).encode("utf-8")) + 1
+        if current and (len(current) >= max_requests or current_bytes + line_bytes > max_bytes):
+            groups.append(current)
+            current = []
+            current_bytes = 0
+        current.append(line)
+        current_bytes += line_bytes
+    if current:
+        groups.append(current)
+    return groups
+
+
+def parse_batch_output(text: str) -> Dict[str, Optional[ChatCompletion]]:
+    """
+    Parse a Batch API output (or error) file.
+
+    Args:
+        text: JSONL content of the output file
+
+    Returns:
+        Mapping of custom_id to the ChatCompletion, or None when that request failed
+    """
+    results: Dict[str, Optional[ChatCompletion]] = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping malformed batch output line: {line[:200]}")
+            continue
+        custom_id = record.get("custom_id")
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning(f"Batch request {custom_id} failed: {record.get('error') or response.get('status_code')}")
+            results[custom_id] = None
+            continue
+        try:
+            results[custom_id] = ChatCompletion.model_validate(response["body"])
+        except Exception as e:
+            logger.warning(f"Batch request {custom_id} returned an unexpected body: {e}")
+            results[custom_id] = None
+    return results
+
+
+class OpenAIBatchBackend:
+    """Submits request files to the OpenAI Batch API and reads their results."""
+
+    def __init__(self, client: Any = None):
+        self.client = client or get_openai_client()
+
+    async def submit(self, lines: List[dict], metadata: Optional[dict] = None) -> str:
+        """Upload the request lines and create a batch; returns the batch ID."""
+        input_file = await self.client.files.create(
+            file=("extraction_batch.jsonl", encode_batch_file(lines)),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+            metadata=metadata,
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+        return batch.id
+
+    async def retrieve(self, batch_id: str) -> Tuple[str, dict, Optional[str]]:
+        """
+        Get the state of a batch.
+
+        Returns:
+            Tuple of (status, request counts, output JSONL or None until the batch is terminal)
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        counts = batch.request_counts.model_dump() if batch.request_counts else {}
+        if batch.status not in TERMINAL_BATCH_STATUSES:
+            return batch.status, counts, None
+
+        # Expired and cancelled batches still return the requests finished before the cutoff
+        output = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.client.files.content(file_id)
+                output.append(content.text)
+        return batch.status, counts, "\n".join(output)
+
+    async def cancel(self, batch_id: str) -> None:
+        await self.client.batches.cancel(batch_id)
+
+
+class LocalBatchBackend:
+    """
+    In-process stand-in for the Batch API, for tests and local runs without OpenAI.
+
+    Each request is answered by ``responder(body)``, which returns the assistant message
+    content (e.g. a canned JSON answer); the batch completes on the first retrieve.
+    """
+
+    def __init__(self, responder: Callable[[dict], str]):
+        self.responder = responder
+        self.batches: Dict[str, List[dict]] = {}
+
+    async def submit(self, lines: List[dict], metadata: Optional[dict] = None) -> str:
+        batch_id = f"batch_local_{uuid.uuid4().hex}"
+        self.batches[batch_id] = lines
+        return batch_id
+
+    async def retrieve(self, batch_id: str) -> Tuple[str, dict, Optional[str]]:
+        lines = self.batches[batch_id]
+        output = []
+        for line in lines:
+            body = {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": line["body"].get("model", ""),
+                "choices": [{
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": self.responder(line["body"])},
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }
+            output.append(json.dumps({
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": line["custom_id"],
+                "response": {"status_code": 200, "body": body},
+                "error": None,
+            }))
+        counts = {"total": len(lines), "completed": len(lines), "failed": 0}
+        return "completed", counts, "\n".join(output)
+
+    async def cancel(self, batch_id: str) -> None:
+        self.batches.pop(batch_id, None)
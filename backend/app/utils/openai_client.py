@@ -0,0 +1,319 @@
+import asyncio
+import random
+import time
+from typing import Any, Iterable, Optional
+
+import openai
+from openai import AsyncOpenAI
+
+from app.config import (
+    GPT_CACHED_INPUT_PRICE_PER_MTOK,
+    GPT_INPUT_PRICE_PER_MTOK,
+    GPT_OUTPUT_PRICE_PER_MTOK,
+    OPENAI_API_KEY,
+    OPENAI_MAX_CONCURRENCY,
+    OPENAI_MAX_RETRIES,
+    OPENAI_REQUESTS_PER_MINUTE,
+    OPENAI_TOKENS_PER_MINUTE,
+    WHISPER_PRICE_PER_MINUTE,
+)
+from app.utils.logging import setup_logger
+from app.utils.pipeline_metrics import count_metric
+from app.utils.text_chunker import get_token_counter
+
+logger = setup_logger(__name__)
+
+# Errors worth retrying; everything else (bad request, auth, ...) fails immediately
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+)
+
+openai_client: Optional[AsyncOpenAI] = None
+openai_governor: Optional["OpenAIGovernor"] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Get the process-wide AsyncOpenAI client, creating it on first use.
+
+    Retries are disabled on the client itself; OpenAIGovernor owns retry and backoff.
+    """
+    global openai_client
+    if openai_client is None:
+        openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=0)
+    return openai_client
+
+
+def get_openai_governor() -> "OpenAIGovernor":
+    """Get the process-wide OpenAIGovernor wrapping the shared client."""
+    global openai_governor
+    if openai_governor is None:
+        openai_governor = OpenAIGovernor(get_openai_client())
+    return openai_governor
+
+
+# Additive TokenUsage fields (to_dict() also carries derived ones)
+TOKEN_USAGE_COUNTERS = (
+    "requests",
+    "input_tokens",
+    "cached_input_tokens",
+    "output_tokens",
+    "cached_chunks",
+    "salvaged_chunks",
+    "dropped_chunks",
+    "skipped_chunks",
+    "audio_seconds",
+)
+
+
+class TokenUsage:
+    """Accumulates OpenAI token usage and chunk outcomes for a job, separating prompt-cache hits from uncached input."""
+
+    def __init__(self):
+        self.requests = 0
+        self.input_tokens = 0
+        self.cached_input_tokens = 0
+        self.output_tokens = 0
+        self.cached_chunks = 0  # Chunks answered from the extraction cache without a request
+        self.salvaged_chunks = 0  # Chunks whose truncated or malformed answer was partially recovered
+        self.dropped_chunks = 0  # Chunks that yielded nothing usable (failed call or unparseable answer)
+        self.skipped_chunks = 0  # Chunks the pre-filter kept away from the extractor
+        self.audio_seconds = 0.0  # Audio sent to Whisper
+
+    def add(self, usage: Any) -> None:
+        """Add the `usage` block of a chat completion response."""
+        if usage is None:
+            return
+        self.requests += 1
+        self.input_tokens += usage.prompt_tokens or 0
+        self.output_tokens += usage.completion_tokens or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is not None:
+            self.cached_input_tokens += details.cached_tokens or 0
+
+    @classmethod
+    def from_dicts(cls, usages: Iterable[dict]) -> "TokenUsage":
+        """Sum to_dict() snapshots, e.g. those recorded by the workers that processed a job's videos."""
+        total = cls()
+        for usage in usages:
+            for counter in TOKEN_USAGE_COUNTERS:
+                setattr(total, counter, getattr(total, counter) + (usage.get(counter) or 0))
+        return total
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        return self.input_tokens - self.cached_input_tokens
+
+    def estimated_cost(self) -> float:
+        """Approximate spend in USD at the configured GPT and Whisper prices."""
+        return (
+            self.uncached_input_tokens * GPT_INPUT_PRICE_PER_MTOK
+            + self.cached_input_tokens * GPT_CACHED_INPUT_PRICE_PER_MTOK
+            + self.output_tokens * GPT_OUTPUT_PRICE_PER_MTOK
+        ) / 1_000_000 + self.audio_seconds / 60 * WHISPER_PRICE_PER_MINUTE
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "input_tokens": self.input_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+            "uncached_input_tokens": self.uncached_input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_hit_rate": round(self.cached_input_tokens / self.input_tokens, 3) if self.input_tokens else 0.0,
+            "cached_chunks": self.cached_chunks,
+            "salvaged_chunks": self.salvaged_chunks,
+            "dropped_chunks": self.dropped_chunks,
+            "skipped_chunks": self.skipped_chunks,
+            "audio_seconds": round(self.audio_seconds, 1),
+            "estimated_cost": round(self.estimated_cost(), 4),
+        }
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests per minute and tokens per minute.
+
+    Both buckets start full and refill continuously. ``acquire`` waits until a request
+    and its estimated tokens fit; ``refund`` returns over-estimated tokens once the real
+    usage is known, and ``pause`` blocks everyone until a server-imposed cooldown ends.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, clock=time.monotonic):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+        self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait until one request and ``tokens`` tokens are available, then consume them.
+
+        Args:
+            tokens: Estimated tokens of the request (clamped to the per-minute budget)
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+        waited = 0.0
+        # Callers queue on the lock so the bucket is handed out in arrival order
+        async with self._lock:
+            while True:
+                self._refill()
+                delay = self._paused_until - self._clock()
+                if delay <= 0:
+                    missing_requests = 1 - self._requests
+                    missing_tokens = tokens - self._tokens
+                    delay = max(
+                        missing_requests * 60 / self.requests_per_minute,
+                        missing_tokens * 60 / self.tokens_per_minute,
+                    )
+                    if delay <= 0:
+                        self._requests -= 1
+                        self._tokens -= tokens
+                        return waited
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def refund(self, tokens: int) -> None:
+        """Return unused tokens (or charge extra ones when negative) after a request completes."""
+        self._refill()
+        self._tokens = min(self.tokens_per_minute, self._tokens + tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquisitions for ``seconds`` (e.g. after a 429 with Retry-After)."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+class OpenAIGovernor:
+    """
+    Wraps an AsyncOpenAI client with process-wide concurrency and rate-limit control.
+
+    Every call draws from request/token budgets, then holds a slot of a shared
+    semaphore only while the request is sent, and is retried with Retry-After-aware exponential backoff on
+    rate limits and transient errors. A 429 pauses the whole limiter, so concurrent
+    callers back off together instead of each burning a retry.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+        requests_per_minute: int = OPENAI_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = OPENAI_TOKENS_PER_MINUTE,
+        max_retries: int = OPENAI_MAX_RETRIES,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.metrics = {
+            "requests": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "limiter_wait_seconds": 0.0,
+            "backoff_seconds": 0.0,
+        }
+
+    def get_metrics(self) -> dict:
+        """Snapshot of the governor counters."""
+        metrics = dict(self.metrics)
+        metrics["limiter_wait_seconds"] = round(metrics["limiter_wait_seconds"], 2)
+        metrics["backoff_seconds"] = round(metrics["backoff_seconds"], 2)
+        return metrics
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        """Add to a governor counter, and to the current metrics scope (see pipeline_metrics)."""
+        self.metrics[name] += amount
+        count_metric(f"openai_{name}", amount)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Use the server's Retry-After hint when present, else exponential backoff with jitter."""
+        response = getattr(error, "response", None)
+        headers = response.headers if response is not None else {}
+        try:
+            if headers.get("retry-after-ms"):
+                return min(self.max_delay, float(headers["retry-after-ms"]) / 1000)
+            if headers.get("retry-after"):
+                return min(self.max_delay, float(headers["retry-after"]))
+        except ValueError:
+            pass
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _call(self, func, estimated_tokens: int, **kwargs) -> Any:
+        """Run one API call under the rate limits and semaphore, retrying transient failures."""
+        for attempt in range(self.max_retries + 1):
+            # Wait for rate budget before taking a slot, so slots are only held by requests in flight
+            self._count("limiter_wait_seconds", await self.limiter.acquire(estimated_tokens))
+            async with self.semaphore:
+                self._count("requests")
+                self.metrics["in_flight"] += 1
+                self.metrics["max_in_flight"] = max(self.metrics["max_in_flight"], self.metrics["in_flight"])
+                try:
+                    response = await func(**kwargs)
+                    self._count("succeeded")
+                    usage = getattr(response, "usage", None)
+                    if usage is not None and getattr(usage, "total_tokens", None) is not None:
+                        self.limiter.refund(estimated_tokens - usage.total_tokens)
+                    return response
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_retries:
+                        self._count("failed")
+                        logger.error(f"OpenAI request failed after {attempt + 1} attempts: {e}")
+                        raise
+                    delay = self._retry_delay(e, attempt)
+                    if isinstance(e, openai.RateLimitError):
+                        self._count("rate_limited")
+                        self.limiter.pause(delay)
+                    logger.warning(f"OpenAI request failed ({type(e).__name__}), retrying in {delay:.2f}s")
+                except Exception:
+                    self._count("failed")
+                    raise
+                finally:
+                    self.metrics["in_flight"] -= 1
+
+            # Back off outside the semaphore so other callers can use the slot
+            self._count("retries")
+            self._count("backoff_seconds", delay)
+            await asyncio.sleep(delay)
+
+    async def chat_completion(self, **kwargs) -> Any:
+        """Governed `chat.completions.create`; the token estimate covers prompt plus max_tokens."""
+        count_tokens = get_token_counter(kwargs.get("model", ""))
+        prompt_tokens = sum(count_tokens(message.get("content") or "") for message in kwargs.get("messages", []))
+        estimated_tokens = prompt_tokens + (kwargs.get("max_tokens") or 0)
+        return await self._call(self.client.chat.completions.create, estimated_tokens, **kwargs)
+
+    async def transcription(self, **kwargs) -> Any:
+        """Governed `audio.transcriptions.create` (request budget only)."""
+        audio_file = kwargs.get("file")
+
+        async def create(**call_kwargs):
+            # Rewind so a retried upload sends the whole file again
+            if hasattr(audio_file, "seek"):
+                audio_file.seek(0)
+            return await self.client.audio.transcriptions.create(**call_kwargs)
+
+        return await self._call(create, 0, **kwargs)
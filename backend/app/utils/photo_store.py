@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import io
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from PIL import Image, ImageOps
+
+from app.config import PHOTO_STORAGE_DIR, PUBLIC_API_URL
+from app.utils.logging import setup_logger
+from app.utils.google_maps_client import get_google_maps_client
+
+logger = setup_logger(__name__)
+
+# Variant name -> maximum width in pixels (images are never upscaled)
+PHOTO_VARIANTS = {"thumbnail": 160, "card": 480, "hero": 1280}
+DEFAULT_VARIANT = "card"
+# Width requested from the Places Photo API; every variant is rendered from this one download
+PHOTO_SOURCE_WIDTH = 1600
+WEBP_QUALITY = 80
+# Variant URLs carry a version derived from the photo reference, so responses never change
+PHOTO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def photo_digest(photo_reference: str) -> str:
+    """Stable hex digest of a Google photo reference, used for file names and ETags."""
+    return hashlib.sha256(photo_reference.encode("utf-8")).hexdigest()
+
+
+def photo_etag(photo_reference: str, variant: str) -> str:
+    return f'"{photo_digest(photo_reference)[:32]}-{variant}"'
+
+
+def build_photo_url(restaurant_id, photo_reference: str, variant: str = DEFAULT_VARIANT) -> str:
+    """
+    Proxy path of a restaurant photo, as stored in ``photo_url``; ``v`` changes whenever
+    the photo reference does. Resolved against PUBLIC_API_URL at response time.
+    """
+    return f"/photos/{restaurant_id}?variant={variant}&v={photo_digest(photo_reference)[:12]}"
+
+
+def public_photo_url(photo_url: Optional[str]) -> Optional[str]:
+    """Absolute URL of a stored ``photo_url``; custom URLs set by an admin are returned as is."""
+    if photo_url and photo_url.startswith("/photos/"):
+        return f"{PUBLIC_API_URL}{photo_url}"
+    return photo_url
+
+
+def stored_photo_url(photo_url: Optional[str]) -> Optional[str]:
+    """Inverse of public_photo_url, so a resolved proxy URL sent back by a client is stored as a path."""
+    if photo_url and photo_url.startswith(f"{PUBLIC_API_URL}/photos/"):
+        return photo_url[len(PUBLIC_API_URL):]
+    return photo_url
+
+
+def extract_photo_reference(photo_url: Optional[str]) -> Optional[str]:
+    """Photo reference of a legacy keyed Places Photo URL, or None for any other URL."""
+    if not photo_url or "maps.googleapis.com/maps/api/place/photo" not in photo_url:
+        return None
+    params = parse_qs(urlparse(photo_url).query)
+    references = params.get("photoreference") or params.get("photo_reference")
+    return references[0] if references else None
+
+
+def render_variants(image_bytes: bytes) -> Dict[str, bytes]:
+    """Resize a source image into every PHOTO_VARIANTS width, encoded as WebP."""
+    with Image.open(io.BytesIO(image_bytes)) as source:
+        image = ImageOps.exif_transpose(source).convert("RGB")
+
+    variants = {}
+    for variant, max_width in PHOTO_VARIANTS.items():
+        resized = image
+        if image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            resized = image.resize((max_width, height), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        resized.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+        variants[variant] = buffer.getvalue()
+    return variants
+
+
+class PhotoStore:
+    """
+    Local disk store of resized restaurant photos, keyed by Google photo reference.
+
+    The first request for a reference downloads the photo once (``fetch``), renders all
+    variants and writes them under ``root``; later requests only read from disk.
+    Concurrent misses for the same reference share one download.
+    """
+
+    def __init__(self, root: str = PHOTO_STORAGE_DIR, fetch: Optional[Callable[[str], Awaitable[bytes]]] = None):
+        self.root = Path(root)
+        self._fetch = fetch or self._fetch_from_google
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.metrics = {"hits": 0, "misses": 0, "downloads": 0}
+
+    @staticmethod
+    async def _fetch_from_google(photo_reference: str) -> bytes:
+        return await get_google_maps_client().photo(photo_reference, PHOTO_SOURCE_WIDTH)
+
+    def path(self, photo_reference: str, variant: str) -> Path:
+        digest = photo_digest(photo_reference)
+        return self.root / digest[:2] / digest / f"{variant}.webp"
+
+    def _write(self, photo_reference: str, variants: Dict[str, bytes]) -> None:
+        for variant, data in variants.items():
+            path = self.path(photo_reference, variant)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a partial file
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+
+    async def _download(self, photo_reference: str) -> Dict[str, bytes]:
+        image_bytes = await self._fetch(photo_reference)
+        self.metrics["downloads"] += 1
+        variants = await asyncio.to_thread(render_variants, image_bytes)
+        await asyncio.to_thread(self._write, photo_reference, variants)
+        logger.info(f"Stored {len(variants)} photo variants for reference {photo_digest(photo_reference)[:12]}")
+        return variants
+
+    async def get(self, photo_reference: str, variant: str) -> bytes:
+        """WebP bytes of ``variant``, downloading and rendering the photo on first use."""
+        path = self.path(photo_reference, variant)
+        if path.exists():
+            self.metrics["hits"] += 1
+            return await asyncio.to_thread(path.read_bytes)
+
+        self.metrics["misses"] += 1
+        future = self._in_flight.get(photo_reference)
+        if future is None:
+            future = asyncio.ensure_future(self._download(photo_reference))
+            self._in_flight[photo_reference] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(photo_reference, None))
+        variants = await asyncio.shield(future)
+        return variants[variant]
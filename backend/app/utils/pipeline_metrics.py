@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, Optional
+
+# Counters of the current metrics scope; asyncio tasks started inside a scope share its dict
+_scope: ContextVar[Optional[Dict[str, float]]] = ContextVar("pipeline_metrics", default=None)
+
+
+@contextmanager
+def metrics_scope() -> Iterator[Dict[str, float]]:
+    """
+    Count the pipeline events of a block in a fresh dict.
+
+    The process-wide counters (OpenAI governor, Places cache, local restaurant matching)
+    add up every run of the process; a scope isolates one video or job, including the
+    tasks it starts, while other videos run concurrently in the same worker.
+    """
+    counters: Dict[str, float] = {}
+    token = _scope.set(counters)
+    try:
+        yield counters
+    finally:
+        _scope.reset(token)
+
+
+def count_metric(name: str, amount: float = 1) -> None:
+    """Add to a counter of the current scope (nothing happens outside metrics_scope)."""
+    counters = _scope.get()
+    if counters is not None:
+        counters[name] = counters.get(name, 0) + amount
+
+
+def combine_pipeline_metrics(scopes: Iterable[Optional[dict]]) -> dict:
+    """Sum the counters of several scopes (e.g. the videos of a job), rounding durations."""
+    total: Dict[str, float] = {}
+    for counters in scopes:
+        for name, amount in (counters or {}).items():
+            total[name] = total.get(name, 0) + amount
+    return {name: round(amount, 2) if isinstance(amount, float) else amount for name, amount in sorted(total.items())}
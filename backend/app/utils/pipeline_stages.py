@@ -0,0 +1,34 @@
+import uuid
+from typing import List, Optional, Tuple
+
+# Per-video pipeline stages in order (values of VideoProcessingStage)
+PIPELINE_STAGES = ("downloaded", "transcribed", "extracted", "validated", "stored")
+
+
+def stage_completed(last_stage: Optional[str], stage: str) -> bool:
+    """Whether ``stage`` is done when ``last_stage`` is the last completed stage (None: nothing done)."""
+    if last_stage is None:
+        return False
+    return PIPELINE_STAGES.index(last_stage) >= PIPELINE_STAGES.index(stage)
+
+
+def encode_resolved(resolved: List[Tuple[dict, dict]]) -> List[dict]:
+    """JSON-safe form of resolve_restaurants output (restaurant ids become strings)."""
+    encoded = []
+    for entity, validated in resolved:
+        validated = dict(validated)
+        if validated.get("restaurant_id") is not None:
+            validated["restaurant_id"] = str(validated["restaurant_id"])
+        encoded.append({"entity": entity, "validated": validated})
+    return encoded
+
+
+def decode_resolved(encoded: List[dict]) -> List[Tuple[dict, dict]]:
+    """Inverse of encode_resolved."""
+    resolved = []
+    for item in encoded:
+        validated = dict(item["validated"])
+        if validated.get("restaurant_id") is not None:
+            validated["restaurant_id"] = uuid.UUID(validated["restaurant_id"])
+        resolved.append((item["entity"], validated))
+    return resolved
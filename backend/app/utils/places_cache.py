@@ -0,0 +1,110 @@
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+from app.config import PLACES_CACHE_TTL, PLACES_NEGATIVE_CACHE_TTL
+from app.utils.logging import setup_logger
+from app.utils.pipeline_metrics import count_metric
+from app.utils.redis_utils import get_redis_client
+from app.utils.transcript_utils import normalize_text
+
+logger = setup_logger(__name__)
+
+PLACES_CACHE_PREFIX = "places_cache"
+
+# Outcomes of classifying an API response for caching
+POSITIVE = "positive"
+NEGATIVE = "negative"
+
+_metrics: dict = {}
+
+
+def _counters(kind: str) -> dict:
+    return _metrics.setdefault(kind, {"hits": 0, "negative_hits": 0, "misses": 0, "errors": 0})
+
+
+def _count(kind: str, name: str) -> None:
+    _counters(kind)[name] += 1
+    count_metric(f"places_{kind}_{name}")
+
+
+def get_places_cache_metrics() -> dict:
+    """Per-lookup-kind hit/miss counters of this process, with hit rates."""
+    metrics = {}
+    for kind, counters in _metrics.items():
+        lookups = counters["hits"] + counters["negative_hits"] + counters["misses"]
+        metrics[kind] = dict(
+            counters,
+            hit_rate=round((counters["hits"] + counters["negative_hits"]) / lookups, 3) if lookups else 0.0,
+        )
+    return metrics
+
+
+def places_cache_key(kind: str, query: str, normalize: bool = True) -> str:
+    """Cache key of a lookup; with ``normalize``, queries differing only in case, spacing or punctuation share it."""
+    digest = hashlib.sha256((normalize_text(query) if normalize else query).encode("utf-8")).hexdigest()
+    return f"{PLACES_CACHE_PREFIX}:{kind}:{digest}"
+
+
+async def cached_lookup(
+    kind: str,
+    query: str,
+    fetch: Callable[[], Awaitable[Any]],
+    classify: Callable[[Any], Optional[str]],
+    normalize: bool = True,
+) -> Any:
+    """
+    Return the cached API response for a lookup, calling ``fetch`` on a miss.
+
+    Args:
+        kind: Lookup kind ("textsearch", "geocode", "details"), used in keys and metrics
+        query: Query text or place ID identifying the lookup
+        fetch: Coroutine function performing the real API call
+        classify: Maps a response to POSITIVE (cache for PLACES_CACHE_TTL), NEGATIVE
+            (no match, cache for PLACES_NEGATIVE_CACHE_TTL) or None (do not cache, e.g. quota errors)
+        normalize: Normalize the query for the key (disable for case-sensitive place IDs)
+
+    Returns:
+        The API response, from the cache or freshly fetched
+    """
+    key = places_cache_key(kind, query, normalize)
+    client = await get_redis_client()
+
+    if client is not None:
+        try:
+            cached = await client.get(key)
+            if cached is not None:
+                response = json.loads(cached)
+                _count(kind, "negative_hits" if classify(response) == NEGATIVE else "hits")
+                return response
+        except Exception as e:
+            _count(kind, "errors")
+            logger.warning(f"Places cache read failed for {kind} '{query}': {e}")
+
+    _count(kind, "misses")
+    response = await fetch()
+
+    outcome = classify(response)
+    if client is not None and outcome is not None:
+        ttl = PLACES_CACHE_TTL if outcome == POSITIVE else PLACES_NEGATIVE_CACHE_TTL
+        try:
+            await client.setex(key, ttl, json.dumps(response, ensure_ascii=False))
+        except Exception as e:
+            _count(kind, "errors")
+            logger.warning(f"Places cache write failed for {kind} '{query}': {e}")
+    return response
+
+
+def classify_places_status(response: dict) -> Optional[str]:
+    """Classify a Places Text Search / Details response by its status field."""
+    status = (response or {}).get("status")
+    if status == "OK":
+        return POSITIVE
+    if status in ("ZERO_RESULTS", "NOT_FOUND"):
+        return NEGATIVE
+    return None
+
+
+def classify_geocode_results(results: list) -> Optional[str]:
+    """Classify a geocode result list (the client returns [] for ZERO_RESULTS)."""
+    return POSITIVE if results else NEGATIVE
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+from app.utils.logging import setup_logger
+from app.utils.redis_utils import get_redis_client
+
+logger = setup_logger(__name__)
+
+# Delete / extend the lock only if it still holds the caller's token, atomically
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class LockNotAcquired(Exception):
+    """The lock is held by another owner."""
+
+
+def resource_lock_key(kind: str, resource_id) -> str:
+    """Key of the lock on one resource, e.g. resource_lock_key("video", video.id)."""
+    return f"lock:{kind}:{resource_id}"
+
+
+async def acquire_lock(client, key: str, token: str, ttl: float) -> bool:
+    """
+    Take a lock for ``token`` with SET NX PX; a lock the token already holds is extended instead.
+
+    Args:
+        client: asyncio Redis client
+        key: Lock key
+        token: Owner token (e.g. the id of the job holding the lock)
+        ttl: Seconds before the lock expires unless extended
+
+    Returns:
+        Whether ``token`` holds the lock
+    """
+    if await client.set(key, token, nx=True, px=int(ttl * 1000)):
+        return True
+    return await extend_lock(client, key, token, ttl)
+
+
+async def extend_lock(client, key: str, token: str, ttl: float) -> bool:
+    """Reset the expiry of a lock held by ``token``; False if another owner holds it (or nobody)."""
+    return bool(await client.eval(EXTEND_SCRIPT, 1, key, token, int(ttl * 1000)))
+
+
+async def release_lock(client, key: str, token: str) -> bool:
+    """Delete a lock held by ``token``; a lock taken over by another owner is left alone."""
+    return bool(await client.eval(RELEASE_SCRIPT, 1, key, token))
+
+
+def acquire_lock_sync(client, key: str, token: str, ttl: float) -> bool:
+    """Take a lock for ``token`` (synchronous version)."""
+    if client.set(key, token, nx=True, px=int(ttl * 1000)):
+        return True
+    return bool(client.eval(EXTEND_SCRIPT, 1, key, token, int(ttl * 1000)))
+
+
+def release_lock_sync(client, key: str, token: str) -> bool:
+    """Delete a lock held by ``token`` (synchronous version)."""
+    return bool(client.eval(RELEASE_SCRIPT, 1, key, token))
+
+
+async def keep_lock(client, key: str, token: str, ttl: float) -> None:
+    """Extend a held lock every third of its TTL until cancelled."""
+    while True:
+        await asyncio.sleep(ttl / 3)
+        try:
+            if not await extend_lock(client, key, token, ttl):
+                logger.warning(f"Lost lock {key} held by {token}")
+                return
+        except Exception as e:
+            logger.warning(f"Failed to extend lock {key}: {e}")
+
+
+@asynccontextmanager
+async def hold_lock(key: str, token: str, ttl: float, wait: float = 0, client=None):
+    """
+    Hold a lock for the duration of a block, renewing it in the background.
+
+    Waits up to ``wait`` seconds for the lock, then raises LockNotAcquired. Without
+    Redis the block runs unlocked (per-resource locks only narrow what the database
+    claims already guarantee).
+
+    Args:
+        key: Lock key
+        token: Owner token
+        ttl: Seconds the lock outlives its holder if renewal stops (e.g. the process dies)
+        wait: Seconds to wait for a lock held by another owner
+        client: asyncio Redis client (default: the shared one)
+    """
+    client = client or await get_redis_client()
+    if client is None:
+        logger.warning(f"Redis unavailable, running without lock {key}")
+        yield
+        return
+
+    deadline = time.monotonic() + wait
+    while not await acquire_lock(client, key, token, ttl):
+        if time.monotonic() >= deadline:
+            raise LockNotAcquired(f"Lock {key} is held by another owner")
+        await asyncio.sleep(min(0.2, max(0.0, deadline - time.monotonic())))
+
+    renewal = asyncio.create_task(keep_lock(client, key, token, ttl))
+    try:
+        yield
+    finally:
+        renewal.cancel()
+        try:
+            await release_lock(client, key, token)
+        except Exception as e:
+            logger.warning(f"Failed to release lock {key}: {e}")
+
+
+@contextmanager
+def hold_lock_sync(client, key: str, token: str, ttl: float, wait: float = 0):
+    """Hold a lock for a short block (synchronous version; not renewed, so ``ttl`` must cover the block)."""
+    deadline = time.monotonic() + wait
+    while not acquire_lock_sync(client, key, token, ttl):
+        if time.monotonic() >= deadline:
+            raise LockNotAcquired(f"Lock {key} is held by another owner")
+        time.sleep(0.2)
+    try:
+        yield
+    finally:
+        try:
+            release_lock_sync(client, key, token)
+        except Exception as e:
+            logger.warning(f"Failed to release lock {key}: {e}")
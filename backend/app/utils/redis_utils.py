@@ -1,5 +1,4 @@
-import asyncio
-import redis
+import redis.asyncio as redis
 
 from app.config import REDIS_URL
 from app.utils.logging import setup_logger
@@ -9,13 +8,14 @@ logger = setup_logger(__name__)
 redis_client = None
 
 async def get_redis_client():
-    """Get Redis client instance."""
+    """Get the shared asyncio Redis client, or None if Redis is unreachable."""
     global redis_client
     if redis_client is None:
         try:
-            redis_client = redis.from_url(REDIS_URL or "redis://localhost:6379")
-            await redis_client.ping()
+            client = redis.from_url(REDIS_URL or "redis://localhost:6379", decode_responses=True)
+            await client.ping()
+            redis_client = client
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}. Proceeding without cache.")
             redis_client = None
-    return redis_client
\ No newline at end of file
+    return redis_client
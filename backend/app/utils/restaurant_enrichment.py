@@ -0,0 +1,87 @@
+import time
+from typing import Callable, Dict, Iterable, List
+
+from app.utils.photo_store import build_photo_url
+
+# Enrichment field -> Place Details fields it needs
+ENRICHMENT_FIELDS = {
+    "photo": ["photos"],
+    "rating": ["rating"],
+    "business_status": ["business_status"],
+}
+
+OUTCOMES = ("updated", "unchanged", "not_found", "failed")
+
+
+def details_fields(fields: Iterable[str]) -> List[str]:
+    """Place Details fields covering all requested enrichment fields (one request per restaurant)."""
+    return sorted({detail for field in fields for detail in ENRICHMENT_FIELDS[field]})
+
+
+def apply_place_details(restaurant, result: dict, fields: Iterable[str]) -> List[str]:
+    """
+    Copy the requested enrichment fields from a Place Details result onto a restaurant.
+
+    Args:
+        restaurant: Restaurant model instance
+        result: "result" object of a Place Details response
+        fields: Enrichment fields to apply (keys of ENRICHMENT_FIELDS)
+
+    Returns:
+        Names of the enrichment fields that changed
+    """
+    changed = []
+    for field in fields:
+        if field == "photo":
+            photos = result.get("photos") or []
+            photo_reference = photos[0].get("photo_reference") if photos else None
+            if photo_reference and photo_reference != restaurant.photo_reference:
+                restaurant.photo_reference = photo_reference
+                restaurant.photo_url = build_photo_url(restaurant.id, photo_reference)
+                changed.append(field)
+        elif field == "rating":
+            rating = result.get("rating")
+            if rating is not None and rating != restaurant.google_rating:
+                restaurant.google_rating = rating
+                changed.append(field)
+        elif field == "business_status":
+            business_status = result.get("business_status")
+            if business_status and business_status != restaurant.business_status:
+                restaurant.business_status = business_status
+                changed.append(field)
+    return changed
+
+
+class BackfillProgress:
+    """Outcome counters of a backfill run, with throughput and ETA for progress reports."""
+
+    def __init__(self, total: int, clock: Callable[[], float] = time.monotonic):
+        self.total = total
+        self.counts: Dict[str, int] = {outcome: 0 for outcome in OUTCOMES}
+        self._clock = clock
+        self._started = clock()
+
+    def record(self, outcome: str) -> None:
+        self.counts[outcome] += 1
+
+    @property
+    def processed(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def rate(self) -> float:
+        """Restaurants processed per second."""
+        elapsed = self._clock() - self._started
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> float:
+        remaining = max(0, self.total - self.processed)
+        return remaining / self.rate if self.rate > 0 else 0.0
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{outcome}={count}" for outcome, count in self.counts.items())
+        return (
+            f"{self.processed}/{self.total} restaurants ({counts}) "
+            f"at {self.rate:.1f}/s, ETA {self.eta_seconds:.0f}s"
+        )
@@ -0,0 +1,73 @@
+import math
+from difflib import SequenceMatcher
+from typing import Any, Optional
+
+from app.utils.entity_merger import normalize_name
+
+# Minimum name similarity (0-1) for an existing restaurant to be reused without a Places call
+LOCAL_MATCH_MIN_SIMILARITY = 0.8
+# Maximum distance between known coordinates for the same restaurant
+LOCAL_MATCH_MAX_DISTANCE_KM = 1.0
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in kilometers."""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+def _field(obj: Any, name: str) -> Any:
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def local_match_score(
+    entity: dict,
+    restaurant: Any,
+    min_similarity: float = LOCAL_MATCH_MIN_SIMILARITY,
+    max_distance_km: float = LOCAL_MATCH_MAX_DISTANCE_KM,
+) -> Optional[float]:
+    """
+    Score an existing restaurant as the place an extracted entity refers to.
+
+    The name must be the same after normalization, or at least ``min_similarity`` alike,
+    and the city or the coordinates (within ``max_distance_km``) must agree: chains and
+    common names repeat across cities, so neither a name alone nor a shared country is
+    enough. A conflicting city, country or coordinates (when both sides have them) rules
+    it out.
+
+    Args:
+        entity: Extracted entity ("restaurant_name", "location", optional "latitude"/"longitude")
+        restaurant: Restaurant row (or dict with the same fields)
+
+    Returns:
+        Name similarity (0-1) of a confident match, or None
+    """
+    entity_name = normalize_name(entity.get("restaurant_name"))
+    restaurant_name = normalize_name(_field(restaurant, "name"))
+    if not entity_name or not restaurant_name:
+        return None
+
+    location = entity.get("location") or {}
+    location_matches = False
+    for field in ("city", "country"):
+        wanted = normalize_name(location.get(field))
+        known = normalize_name(_field(restaurant, field))
+        if wanted and known:
+            if wanted != known:
+                return None
+            location_matches = location_matches or field == "city"
+
+    latitude, longitude = entity.get("latitude"), entity.get("longitude")
+    known_latitude, known_longitude = _field(restaurant, "latitude"), _field(restaurant, "longitude")
+    if None not in (latitude, longitude, known_latitude, known_longitude):
+        if haversine_km(latitude, longitude, known_latitude, known_longitude) > max_distance_km:
+            return None
+        location_matches = True
+
+    if not location_matches:
+        return None
+    if entity_name == restaurant_name:
+        return 1.0
+    similarity = SequenceMatcher(None, entity_name, restaurant_name).ratio()
+    return similarity if similarity >= min_similarity else None
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from app.utils.logging import setup_logger
+from app.utils.redis_utils import get_redis_client
+
+logger = setup_logger(__name__)
+
+
+class StaleWhileRevalidateCache:
+    """
+    Redis-backed cache serving stored values immediately and refreshing them in the background.
+
+    Entries younger than ``fresh_ttl`` are served as-is. Older entries are still served,
+    and a background refresh is started. Only one refresh per key runs in this process,
+    and a short Redis lock stops other workers from starting the same refresh. Entries
+    expire from Redis after ``max_age``, so the next request after that fetches inline.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        fresh_ttl: int,
+        max_age: int,
+        refresh_lock_ms: int = 30000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.prefix = prefix
+        self.fresh_ttl = fresh_ttl
+        self.max_age = max_age
+        self.refresh_lock_ms = refresh_lock_ms
+        self._clock = clock
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.metrics = {"fresh_hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    async def _read(self, client, key: str):
+        try:
+            cached = await client.get(self._key(key))
+            return json.loads(cached) if cached is not None else None
+        except Exception as e:
+            logger.warning(f"Cache read failed for {self._key(key)}: {e}")
+            return None
+
+    async def _write(self, client, key: str, value: Any) -> None:
+        entry = {"fetched_at": self._clock(), "value": value}
+        try:
+            await client.set(self._key(key), json.dumps(entry, ensure_ascii=False), ex=self.max_age)
+        except Exception as e:
+            logger.warning(f"Cache write failed for {self._key(key)}: {e}")
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Tuple[Any, dict]:
+        """
+        Get the value for ``key``, calling ``fetch`` only when nothing is stored.
+
+        Args:
+            key: Cache key (e.g. a Google place ID)
+            fetch: Coroutine function loading the current value
+
+        Returns:
+            Tuple of (value, info) where info has "cached", "stale" and "age" (seconds)
+        """
+        client = await get_redis_client()
+        if client is None:
+            return await fetch(), {"cached": False, "stale": False, "age": 0}
+
+        entry = await self._read(client, key)
+        if entry is not None:
+            age = max(0.0, self._clock() - entry["fetched_at"])
+            stale = age > self.fresh_ttl
+            if stale:
+                self.metrics["stale_hits"] += 1
+                self._schedule_refresh(client, key, fetch)
+            else:
+                self.metrics["fresh_hits"] += 1
+            return entry["value"], {"cached": True, "stale": stale, "age": round(age)}
+
+        self.metrics["misses"] += 1
+        value = await fetch()
+        await self._write(client, key, value)
+        return value, {"cached": False, "stale": False, "age": 0}
+
+    def _schedule_refresh(self, client, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing[key] = asyncio.create_task(self._refresh(client, key, fetch))
+
+    async def _refresh(self, client, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            # The lock is left to expire: once refreshed, the entry is fresh again anyway
+            if not await client.set(f"{self._key(key)}:refresh", "1", nx=True, px=self.refresh_lock_ms):
+                return
+            await self._write(client, key, await fetch())
+            self.metrics["refreshes"] += 1
+        except Exception as e:
+            self.metrics["refresh_errors"] += 1
+            logger.warning(f"Background refresh failed for {self._key(key)}, serving stale data: {e}")
+        finally:
+            self._refreshing.pop(key, None)
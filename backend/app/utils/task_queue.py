@@ -0,0 +1,77 @@
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class BacklogPriority(str, Enum):
+    """Order in which a backlog job queues eligible videos."""
+    RECENCY = "recency"  # Newest videos first
+    SUBSCRIBERS = "subscribers"  # Videos of the most-subscribed influencers first, newest first within one
+
+
+def summarize_video_tasks(counts: Dict[str, int]) -> Dict[str, int]:
+    """
+    Progress of a queued job from the number of its video tasks in each status.
+
+    Args:
+        counts: Task count by status value ("pending", "processing", "completed", "failed", "skipped")
+
+    Returns:
+        The counts plus total, done (finished in any way), remaining (pending or processing)
+        and progress percentage
+    """
+    summary = {status: counts.get(status, 0) for status in ("pending", "processing", "completed", "failed", "skipped")}
+    total = sum(summary.values())
+    done = summary["completed"] + summary["failed"] + summary["skipped"]
+    summary.update(
+        total=total,
+        done=done,
+        remaining=summary["pending"] + summary["processing"],
+        progress=int(100 * done / total) if total else 100,
+    )
+    return summary
+
+
+def encode_backlog_cursor(sort_key: Sequence[Any]) -> List[Any]:
+    """JSON-safe form of the sort key of the last video queued (..., published_at, video id)."""
+    return [value.isoformat() if isinstance(value, datetime) else str(value) if isinstance(value, uuid.UUID) else value
+            for value in sort_key]
+
+
+def decode_backlog_cursor(cursor: Sequence[Any]) -> List[Any]:
+    """Inverse of encode_backlog_cursor."""
+    values = list(cursor)
+    values[-2] = datetime.fromisoformat(values[-2])
+    values[-1] = uuid.UUID(values[-1])
+    return values
+
+
+def backlog_page_limit(payload: Dict[str, Any], page_size: int) -> int:
+    """Videos to queue in the next page: a full page, or what is left of the max_videos budget."""
+    max_videos = payload.get("max_videos")
+    if max_videos is None:
+        return page_size
+    return max(0, min(page_size, max_videos - payload.get("enqueued", 0)))
+
+
+def backlog_stop_reason(payload: Dict[str, Any], elapsed_minutes: float, spend: float) -> Optional[str]:
+    """
+    The budget a backlog job has used up, if any.
+
+    Args:
+        payload: Job payload with the optional max_videos, max_minutes and max_spend (USD) budgets
+            and the number of videos enqueued so far
+        elapsed_minutes: Minutes since the job started
+        spend: Estimated spend of the videos processed so far (USD)
+
+    Returns:
+        "max_videos", "max_minutes" or "max_spend", or None while within budget
+    """
+    if payload.get("max_videos") is not None and payload.get("enqueued", 0) >= payload["max_videos"]:
+        return "max_videos"
+    if payload.get("max_minutes") is not None and elapsed_minutes >= payload["max_minutes"]:
+        return "max_minutes"
+    if payload.get("max_spend") is not None and spend >= payload["max_spend"]:
+        return "max_spend"
+    return None
@@ -0,0 +1,137 @@
+import re
+from functools import lru_cache
+from typing import Callable, List
+
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Encoding used by the gpt-4o / gpt-4.1 family when tiktoken has no direct model mapping
+DEFAULT_ENCODING = "o200k_base"
+
+_SENTENCE_BOUNDARY = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"”')\]]))\s+")
+_LOCAL_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens_locally(text: str) -> int:
+    """Approximate token count (words and punctuation marks) used when tiktoken is unavailable."""
+    return len(_LOCAL_TOKEN.findall(text))
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(model: str) -> Callable[[str], int]:
+    """
+    Get a function counting tokens for the given model.
+
+    Uses tiktoken when it is installed and its encoding files can be loaded,
+    otherwise falls back to a local word/punctuation approximation.
+
+    Args:
+        model: OpenAI model name (e.g. "gpt-4.1")
+
+    Returns:
+        Callable returning the number of tokens in a string
+    """
+    try:
+        import tiktoken
+
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding(DEFAULT_ENCODING)
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception as e:
+        logger.warning(f"tiktoken unavailable for {model} ({e}), using local token estimate")
+        return count_tokens_locally
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text on sentence-ending punctuation, keeping the punctuation with its sentence."""
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def _split_long_sentence(sentence: str, max_tokens: int, count_tokens: Callable[[str], int]) -> List[str]:
+    """Break a sentence that alone exceeds the budget into word runs that fit."""
+    pieces = []
+    current = []
+    current_tokens = 0
+    for word in sentence.split():
+        # Words are counted individually (with their leading space) to keep this linear
+        tokens = count_tokens(" " + word)
+        if current and current_tokens + tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current = []
+            current_tokens = 0
+        current.append(word)
+        current_tokens += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int = 0,
+    count_tokens: Callable[[str], int] = count_tokens_locally,
+) -> List[str]:
+    """
+    Pack sentences into chunks close to a token budget, with sentence-level overlap.
+
+    Each chunk holds as many whole sentences as fit in ``max_tokens``. The next chunk
+    starts with the trailing sentences of the previous one, up to ``overlap_tokens``,
+    so that mentions straddling a boundary keep their surrounding context.
+
+    Args:
+        text: Text to split (e.g. a video transcription)
+        max_tokens: Token budget per chunk
+        overlap_tokens: Maximum tokens repeated from the end of the previous chunk
+        count_tokens: Token counting function (see get_token_counter)
+
+    Returns:
+        List of chunk strings
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens must be positive")
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+
+    sentences = []
+    for sentence in split_sentences(text or ""):
+        tokens = count_tokens(sentence)
+        if tokens > max_tokens:
+            for piece in _split_long_sentence(sentence, max_tokens, count_tokens):
+                sentences.append((piece, count_tokens(piece)))
+        else:
+            sentences.append((sentence, tokens))
+
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for sentence, tokens in sentences:
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(" ".join(s for s, _ in current))
+
+            # Carry over trailing sentences as overlap for the next chunk
+            overlap = []
+            overlap_total = 0
+            for prev_sentence, prev_tokens in reversed(current):
+                if overlap_total + prev_tokens > overlap_tokens:
+                    break
+                overlap.insert(0, (prev_sentence, prev_tokens))
+                overlap_total += prev_tokens
+
+            # Drop overlap from the front if it leaves no room for the new sentence
+            while overlap and overlap_total + tokens > max_tokens:
+                overlap_total -= overlap.pop(0)[1]
+
+            current = overlap
+            current_tokens = overlap_total
+
+        current.append((sentence, tokens))
+        current_tokens += tokens
+
+    if current:
+        chunks.append(" ".join(s for s, _ in current))
+
+    return chunks
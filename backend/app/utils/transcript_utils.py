@@ -0,0 +1,160 @@
+import re
+import unicodedata
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.utils.logging import setup_logger
+
+logger = setup_logger(__name__)
+
+# Number of leading quote words used for exact matching against the transcript
+QUOTE_PROBE_WORDS = 8
+# Number of consecutive segments scanned together when fuzzy matching a quote
+SEGMENT_WINDOW = 3
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase text and strip punctuation/quotation marks so transcript and quotes compare equal."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _get(segment: Any, key: str) -> Any:
+    """Read a field from either a dict or an OpenAI response object."""
+    if isinstance(segment, dict):
+        return segment.get(key)
+    return getattr(segment, key, None)
+
+
+def compact_segments(segments: Iterable[Any], offset: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    Convert Whisper segments into the compact form stored in Video.transcript_segments.
+
+    Args:
+        segments: Segments from a verbose_json transcription (objects or dicts)
+        offset: Seconds to add to every start/end (used for split audio files)
+
+    Returns:
+        List of {"start", "end", "text"} dictionaries
+    """
+    compacted = []
+    for segment in segments or []:
+        text = (_get(segment, "text") or "").strip()
+        if not text:
+            continue
+        start = float(_get(segment, "start") or 0.0) + offset
+        end = float(_get(segment, "end") or start) + offset
+        compacted.append({"start": round(start, 2), "end": round(end, 2), "text": text})
+    return compacted
+
+
+def find_quote_timestamp(quote: str, segments: List[Dict[str, Any]], min_overlap: float = 0.6) -> Optional[float]:
+    """
+    Find the start time (in seconds) of the segment where a quote begins.
+
+    The leading words of the quote are first searched for verbatim in the normalized
+    transcript; if that fails, the window of segments sharing the most words with the
+    quote is used, provided the overlap reaches ``min_overlap``.
+
+    Args:
+        quote: Quote text as extracted by GPT (may be wrapped in quotation marks)
+        segments: Compact transcript segments
+        min_overlap: Minimum fraction of quote words that must appear in a window
+
+    Returns:
+        Start time in seconds or None if the quote could not be located
+    """
+    quote_words = normalize_text(quote).split()
+    if not quote_words or not segments:
+        return None
+
+    # Build one normalized transcript with the character offset of every segment
+    offsets = []
+    parts = []
+    position = 0
+    for segment in segments:
+        normalized = normalize_text(segment.get("text"))
+        offsets.append(position)
+        parts.append(normalized)
+        position += len(normalized) + 1
+    full_text = " ".join(parts)
+
+    probe = " ".join(quote_words[:QUOTE_PROBE_WORDS])
+    index = full_text.find(probe)
+    if index >= 0:
+        return segments[bisect_right(offsets, index) - 1]["start"]
+
+    # Fall back to word overlap over a sliding window of segments; windows that tie are
+    # ranked by how much of the quote their first segment holds on its own
+    probe_words = set(quote_words[:QUOTE_PROBE_WORDS * 3])
+    best_score = (0.0, 0.0)
+    best_start = None
+    for i in range(len(segments)):
+        window_words = set(" ".join(parts[i:i + SEGMENT_WINDOW]).split())
+        score = (
+            len(probe_words & window_words) / len(probe_words),
+            len(probe_words & set(parts[i].split())) / len(probe_words),
+        )
+        if score > best_score:
+            best_score = score
+            best_start = segments[i]["start"]
+
+    if best_score[0] >= min_overlap:
+        return best_start
+    return None
+
+
+def find_listing_timestamp(quotes: Optional[List[str]], segments: Optional[List[Dict[str, Any]]]) -> Optional[int]:
+    """
+    Get the earliest video timestamp (whole seconds) at which any of the quotes is spoken.
+
+    Args:
+        quotes: Quotes extracted for a restaurant
+        segments: Compact transcript segments of the video
+
+    Returns:
+        Timestamp in seconds or None if no quote could be matched
+    """
+    if not quotes or not segments:
+        return None
+
+    starts = [find_quote_timestamp(quote, segments) for quote in quotes]
+    starts = [start for start in starts if start is not None]
+    if not starts:
+        logger.info("Could not map any quote to a transcript segment")
+        return None
+    return int(min(starts))
+
+
+def filter_segments(
+    segments: Optional[List[Dict[str, Any]]],
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    query: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Select the transcript segments overlapping a time range and/or containing a phrase.
+
+    Args:
+        segments: Compact transcript segments
+        start: Only include segments ending after this time (seconds)
+        end: Only include segments starting before this time (seconds)
+        query: Only include segments whose normalized text contains this phrase
+
+    Returns:
+        Matching segments in transcript order
+    """
+    normalized_query = normalize_text(query)
+    selected = []
+    for segment in segments or []:
+        if start is not None and segment["end"] < start:
+            continue
+        if end is not None and segment["start"] > end:
+            continue
+        if normalized_query and normalized_query not in normalize_text(segment["text"]):
+            continue
+        selected.append(segment)
+    return selected
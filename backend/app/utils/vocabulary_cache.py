@@ -0,0 +1,110 @@
+import asyncio
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from app.utils.logging import setup_logger
+from app.utils.redis_utils import get_redis_client
+
+logger = setup_logger(__name__)
+
+# Pub/sub channel carrying the kind ("tags" or "cuisines") of a vocabulary changed by an admin
+INVALIDATION_CHANNEL = "vocabulary:invalidate"
+
+
+class VocabularyCache:
+    """
+    In-process name -> id map of a small, slow-changing vocabulary (tags or cuisines).
+
+    The cache is loaded in full (at startup or on first use) and extended as names are
+    inserted. Renames and deletes clear it, here and in every other process through
+    Redis pub/sub, and the next use reloads it.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.loaded = False
+        self._ids: Dict[str, UUID] = {}
+        self.metrics = {"hits": 0, "misses": 0, "loads": 0, "invalidations": 0}
+
+    def load(self, rows: Iterable[Tuple[str, UUID]]) -> None:
+        """Replace the cache with all (name, id) rows of the vocabulary."""
+        self._ids = {name: id_ for name, id_ in rows}
+        self.loaded = True
+        self.metrics["loads"] += 1
+
+    def add(self, ids: Dict[str, UUID]) -> None:
+        self._ids.update(ids)
+
+    def lookup(self, names: Iterable[str]) -> Tuple[Dict[str, UUID], List[str]]:
+        """Split names into (cached name -> id, names not in the cache)."""
+        found, missing = {}, []
+        for name in names:
+            if name in self._ids:
+                found[name] = self._ids[name]
+            else:
+                missing.append(name)
+        self.metrics["hits"] += len(found)
+        self.metrics["misses"] += len(missing)
+        return found, missing
+
+    def missing_ids(self, ids: Iterable[UUID]) -> List[UUID]:
+        """Ids not present in the cache."""
+        known = set(self._ids.values())
+        return [id_ for id_ in ids if id_ not in known]
+
+    def invalidate(self) -> None:
+        self._ids = {}
+        self.loaded = False
+        self.metrics["invalidations"] += 1
+
+
+tag_cache = VocabularyCache("tags")
+cuisine_cache = VocabularyCache("cuisines")
+VOCABULARY_CACHES = {cache.kind: cache for cache in (tag_cache, cuisine_cache)}
+
+
+async def publish_invalidation(kind: str) -> None:
+    """Clear a vocabulary cache in this process and ask every other process to do the same."""
+    VOCABULARY_CACHES[kind].invalidate()
+    client = await get_redis_client()
+    if client is None:
+        return
+    try:
+        await client.publish(INVALIDATION_CHANNEL, kind)
+    except Exception as e:
+        logger.warning(f"Failed to publish {kind} vocabulary invalidation: {e}")
+
+
+async def listen_for_invalidations(retry_delay: float = 5.0, client=None) -> None:
+    """Clear vocabulary caches on messages from other processes; runs until cancelled."""
+    resubscribing = False
+    while True:
+        redis_client = client or await get_redis_client()
+        if redis_client is None:
+            await asyncio.sleep(retry_delay)
+            continue
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            if resubscribing:
+                # Invalidations may have been missed while disconnected
+                for cache in VOCABULARY_CACHES.values():
+                    cache.invalidate()
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                cache = VOCABULARY_CACHES.get(message.get("data"))
+                if cache is not None:
+                    cache.invalidate()
+                    logger.info(f"Invalidated {cache.kind} vocabulary cache")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Vocabulary invalidation listener failed, retrying: {e}")
+            resubscribing = True
+            await asyncio.sleep(retry_delay)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
@@ -0,0 +1,351 @@
+"""
+Pipeline worker: runs the jobs queued by the admin API, outside the API process.
+
+Transcription jobs are queued as one task per video (video_processing_jobs rows).
+A worker claims up to --concurrency videos at a time with FOR UPDATE SKIP LOCKED,
+renews each claim's lease while the video is processed and acknowledges it when
+done; a video whose worker died is redelivered once its lease expires. Scrape and
+batch extraction jobs are claimed whole, one at a time, and kept alive by a
+heartbeat; a job whose heartbeat stops is redelivered to another worker.
+Transcription job progress is written by each worker every few seconds
+(JOB_PROGRESS_FLUSH_INTERVAL) rather than once per video. OpenAI governor, Places
+cache and local match counters are kept per video (app.utils.pipeline_metrics) and
+summed into the job's result_data, as the process-wide counters mix every job.
+
+Run as many workers as ingestion needs, independently of the API replicas.
+
+Usage:
+    python -m app.worker
+    python -m app.worker --concurrency 10 --poll-interval 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+import uuid
+from typing import Set
+
+from app.config import (
+    WORKER_CONCURRENCY,
+    WORKER_POLL_INTERVAL,
+    TASK_LEASE_SECONDS,
+    JOB_HEARTBEAT_TIMEOUT,
+    JOB_PROGRESS_FLUSH_INTERVAL,
+)
+from app.database import AsyncSessionLocal, SyncSessionLocal
+from app.models import Job, VideoProcessingJob
+from app.models.job import JobType
+from app.services import scrape_youtube, batch_extraction_pipeline, JobService
+from app.services.job_queue import (
+    acquire_job_lock,
+    ack_video_task,
+    claim_job,
+    claim_video_task,
+    refresh_job_progress,
+    release_job_lock,
+    release_video_task,
+    renew_video_task_lease,
+    sweep_queue,
+)
+from app.services.taxonomy import warm_vocabulary_caches
+from app.services.transcription_nlp import process_video, select_videos_for_processing
+from app.utils.google_maps_client import close_google_maps_client
+from app.utils.job_events import job_event, publish_job_event
+from app.utils.job_progress import JobProgressReporter
+from app.utils.logging import setup_logger
+from app.utils.openai_client import TokenUsage
+from app.utils.pipeline_metrics import combine_pipeline_metrics, metrics_scope
+from app.utils.vocabulary_cache import listen_for_invalidations
+
+logger = setup_logger(__name__)
+
+
+def worker_name() -> str:
+    """Identity recorded on claimed tasks: host, process and a per-run suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+async def wait_for_stop(stopping: asyncio.Event, timeout: float) -> None:
+    """Sleep up to ``timeout`` seconds, waking early on shutdown."""
+    try:
+        await asyncio.wait_for(stopping.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def keep_lease(task: VideoProcessingJob, worker_id: str, work: asyncio.Task) -> None:
+    """Renew a task's lease until cancelled; stop the work if the claim was lost to another worker."""
+    while True:
+        await asyncio.sleep(TASK_LEASE_SECONDS / 3)
+        try:
+            async with AsyncSessionLocal() as db:
+                renewed = await renew_video_task_lease(db, task.id, worker_id)
+        except Exception as e:
+            logger.warning(f"Could not renew lease of task {task.id}: {e}")
+            continue
+        if not renewed:
+            logger.warning(f"Lost the claim on task {task.id}, stopping its processing")
+            work.cancel()
+            return
+
+
+async def write_job_progress(job_id: uuid.UUID) -> None:
+    async with AsyncSessionLocal() as db:
+        await refresh_job_progress(db, job_id)
+
+
+async def run_video_task(task: VideoProcessingJob, worker_id: str, reporter: JobProgressReporter) -> None:
+    """Run a claimed video task, counted in the progress of its job while it runs."""
+    reporter.item_started(task.job_id)
+    try:
+        await process_video_task(task, worker_id)
+    finally:
+        reporter.item_finished(task.job_id)
+
+
+async def process_video_task(task: VideoProcessingJob, worker_id: str) -> None:
+    """Process a claimed video and acknowledge it; on shutdown, hand it back to the queue."""
+    usage = TokenUsage()
+    async with AsyncSessionLocal() as db:
+        # With its influencer loaded: the video is used detached from the session (e.g. download_audio)
+        videos = await select_videos_for_processing(db, [task.video_id])
+    if not videos:
+        async with AsyncSessionLocal() as db:
+            await ack_video_task(db, task, worker_id, error_message=f"Video {task.video_id} not found")
+        return
+    video = videos[0]
+
+    # The processing task inherits the scope, so only this video's API and cache calls are counted
+    with metrics_scope() as metrics:
+        work = asyncio.create_task(process_video(video, usage=usage, job_id=task.job_id, video_job=task))
+    lease = asyncio.create_task(keep_lease(task, worker_id, work))
+    try:
+        await asyncio.wait([work])
+    except asyncio.CancelledError:
+        work.cancel()
+        lease.cancel()
+        await asyncio.gather(work, lease, return_exceptions=True)
+        async with AsyncSessionLocal() as db:
+            await release_video_task(db, task.id, worker_id)
+        logger.info(f"Released task {task.id} back to the queue")
+        raise
+    finally:
+        lease.cancel()
+
+    if work.cancelled():
+        return  # Claim lost; the redelivered task is acknowledged by its new worker
+    error = work.exception()
+    if error:
+        logger.error(f"Task {task.id} (video {task.video_id}) failed: {error}")
+    async with AsyncSessionLocal() as db:
+        job = await ack_video_task(
+            db, task, worker_id, token_usage=usage.to_dict(), error_message=str(error) if error else None,
+            pipeline_metrics=metrics,
+        )
+    if job:
+        logger.info(f"Job {job.id} finished with status {job.status.value}")
+
+
+async def heartbeat(job: Job) -> None:
+    """Keep a claimed job's heartbeat and lock fresh so it is neither redelivered nor overtaken while it runs."""
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_TIMEOUT / 4)
+        try:
+            async with AsyncSessionLocal() as db:
+                await JobService.update_heartbeat(db, job.id)
+        except Exception as e:
+            logger.warning(f"Could not update heartbeat of job {job.id}: {e}")
+        if not await acquire_job_lock(job):
+            logger.warning(f"Job {job.id} lost lock {job.redis_lock_key} to another job")
+
+
+def run_scrape_job(job_id: uuid.UUID) -> None:
+    """Run a scrape job (synchronous; scrape_youtube completes the job)."""
+    db = SyncSessionLocal()
+    try:
+        JobService.update_progress_sync(db, job_id, 0, 0)
+        scrape_youtube(db, job_id)
+    except Exception as e:
+        # Check if it's a cancellation
+        if "cancelled" in str(e).lower():
+            JobService.cancel_job_sync(db, job_id, str(e))
+        else:
+            JobService.fail_job_sync(db, job_id, str(e))
+        raise
+    finally:
+        db.close()
+
+
+async def run_batch_job(job: Job) -> None:
+    """Run a batch extraction job over the videos it was queued with."""
+    start_time = time.time()
+    video_ids = (job.payload or {}).get("video_ids") or []
+
+    async with AsyncSessionLocal() as db:
+        try:
+            await JobService.update_progress(db, job.id, 0, 0)
+
+            with metrics_scope() as metrics:
+                result = await batch_extraction_pipeline(db, video_ids=video_ids, job_id=job.id)
+
+            if result and result.get("cancelled"):
+                return
+
+            elapsed_time = time.time() - start_time
+            result_data = json.dumps({
+                "message": "Batch entity extraction completed successfully",
+                "elapsed_time": elapsed_time,
+                **result,
+                "pipeline_metrics": combine_pipeline_metrics([metrics]),
+            })
+            await JobService.complete_job(db, job.id, result_data)
+
+        except Exception as e:
+            if "cancelled" in str(e).lower():
+                await JobService.cancel_job(db, job.id, str(e))
+            else:
+                await JobService.fail_job(db, job.id, str(e))
+            raise
+
+
+async def run_job(job: Job) -> None:
+    """
+    Run a claimed scrape or batch extraction job with a heartbeat, holding its lock.
+
+    The lock is taken again on start, since a redelivered job's lock may have expired;
+    if another job of the same type took it over meanwhile, this job fails. The lock is
+    released when the job ends, but not on worker shutdown (the job will be redelivered).
+    """
+    if not await acquire_job_lock(job):
+        async with AsyncSessionLocal() as db:
+            await JobService.fail_job(db, job.id, f"Lock {job.redis_lock_key} is held by another job")
+        return
+
+    beat = asyncio.create_task(heartbeat(job))
+    try:
+        if job.job_type == JobType.SCRAPE_YOUTUBE:
+            await asyncio.to_thread(run_scrape_job, job.id)
+        elif job.job_type == JobType.BATCH_EXTRACTION:
+            await run_batch_job(job)
+    except Exception as e:
+        logger.error(f"Job {job.id} failed: {e}")
+    finally:
+        beat.cancel()
+    await release_job_lock(job)
+
+    # Scrape jobs finish through the synchronous session, which does not publish job events
+    if job.job_type == JobType.SCRAPE_YOUTUBE:
+        try:
+            async with AsyncSessionLocal() as db:
+                finished = await JobService.get_job(db, job.id)
+            if finished:
+                await publish_job_event(job_event(finished))
+        except Exception as e:
+            logger.warning(f"Could not publish the final state of job {job.id}: {e}")
+
+
+async def run_sweeper(poll_interval: float, stopping: asyncio.Event) -> None:
+    """Settle abandoned tasks and jobs (see sweep_queue) until shutdown."""
+    while not stopping.is_set():
+        try:
+            async with AsyncSessionLocal() as db:
+                await sweep_queue(db)
+        except Exception as e:
+            logger.error(f"Error sweeping the job queue: {e}")
+        await wait_for_stop(stopping, poll_interval)
+
+
+async def run_job_loop(worker_id: str, poll_interval: float, stopping: asyncio.Event) -> None:
+    """Run whole jobs, one at a time, until shutdown."""
+    while not stopping.is_set():
+        job = None
+        try:
+            async with AsyncSessionLocal() as db:
+                job = await claim_job(db, worker_id)
+        except Exception as e:
+            logger.error(f"Error polling the job queue: {e}")
+        if job is None:
+            await wait_for_stop(stopping, poll_interval)
+            continue
+        await run_job(job)
+
+
+async def run_worker(concurrency: int = WORKER_CONCURRENCY, poll_interval: float = WORKER_POLL_INTERVAL) -> None:
+    """
+    Claim and process queued work until SIGTERM or SIGINT.
+
+    On shutdown, videos in progress are handed back to the queue (their completed
+    stages are kept), and a running scrape or batch job is redelivered by its heartbeat
+    timing out.
+
+    Args:
+        concurrency: Videos processed at once
+        poll_interval: Seconds between polls of an empty queue
+    """
+    worker_id = worker_name()
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopping.set)
+
+    # Load tag/cuisine name -> id caches and keep them in sync with the API and other workers
+    try:
+        async with AsyncSessionLocal() as db:
+            await warm_vocabulary_caches(db)
+    except Exception as e:
+        logger.warning(f"Could not warm vocabulary caches, loading on first use: {e}")
+
+    # Progress of the transcription jobs whose videos this worker processes, written every few seconds
+    reporter = JobProgressReporter(write_job_progress, JOB_PROGRESS_FLUSH_INTERVAL)
+
+    logger.info(f"Worker {worker_id} started (concurrency {concurrency})")
+    background = [
+        asyncio.create_task(reporter.run()),
+        asyncio.create_task(listen_for_invalidations()),
+        asyncio.create_task(run_job_loop(worker_id, poll_interval, stopping)),
+        asyncio.create_task(run_sweeper(poll_interval, stopping)),
+    ]
+    running: Set[asyncio.Task] = set()
+    try:
+        while not stopping.is_set():
+            if len(running) >= concurrency:
+                await asyncio.wait(running, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            task = None
+            try:
+                async with AsyncSessionLocal() as db:
+                    task = await claim_video_task(db, worker_id)
+            except Exception as e:
+                logger.error(f"Error claiming a video task: {e}")
+            if task is None:
+                await wait_for_stop(stopping, poll_interval)
+                continue
+
+            logger.info(f"Claimed video {task.video_id} of job {task.job_id} (attempt {task.attempts})")
+            runner = asyncio.create_task(run_video_task(task, worker_id, reporter))
+            running.add(runner)
+            runner.add_done_callback(running.discard)
+    finally:
+        logger.info(f"Worker {worker_id} stopping, releasing {len(running)} videos in progress")
+        for runner in [*background, *running]:
+            runner.cancel()
+        await asyncio.gather(*background, *running, return_exceptions=True)
+        await reporter.flush()
+        await close_google_maps_client()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY, help="Videos processed at once")
+    parser.add_argument("--poll-interval", type=float, default=WORKER_POLL_INTERVAL, help="Seconds between polls of an empty queue")
+    args = parser.parse_args()
+
+    asyncio.run(run_worker(args.concurrency, args.poll_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""add job queue columns
+
+Revision ID: a8e6b7c9d0f1
+Revises: f7d5a6b8c9e0
+Create Date: 2026-10-19 18:02:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e6b7c9d0f1'
+down_revision: Union[str, Sequence[str], None] = 'f7d5a6b8c9e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('video_processing_jobs', sa.Column('worker_id', sa.String(length=255), nullable=True))
+    op.add_column('video_processing_jobs', sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('video_processing_jobs', sa.Column('token_usage', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_index('ix_video_processing_jobs_status_created_at', 'video_processing_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_video_processing_jobs_status_created_at', table_name='video_processing_jobs')
+    op.drop_column('video_processing_jobs', 'token_usage')
+    op.drop_column('video_processing_jobs', 'lease_expires_at')
+    op.drop_column('video_processing_jobs', 'worker_id')
+    op.drop_column('jobs', 'payload')
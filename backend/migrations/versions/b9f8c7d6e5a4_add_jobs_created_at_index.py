@@ -0,0 +1,28 @@
+"""add jobs created_at index
+
+Revision ID: b9f8c7d6e5a4
+Revises: a8e6b7c9d0f1
+Create Date: 2026-10-19 21:14:37.502918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9f8c7d6e5a4'
+down_revision: Union[str, Sequence[str], None] = 'a8e6b7c9d0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_jobs_created_at'), 'jobs', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_jobs_created_at'), table_name='jobs')
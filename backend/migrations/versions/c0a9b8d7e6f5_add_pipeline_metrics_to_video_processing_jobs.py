@@ -0,0 +1,29 @@
+"""add pipeline_metrics to video_processing_jobs
+
+Revision ID: c0a9b8d7e6f5
+Revises: b9f8c7d6e5a4
+Create Date: 2026-10-19 23:08:51.264390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0a9b8d7e6f5'
+down_revision: Union[str, Sequence[str], None] = 'b9f8c7d6e5a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('video_processing_jobs', sa.Column('pipeline_metrics', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('video_processing_jobs', 'pipeline_metrics')
@@ -0,0 +1,33 @@
+"""add batch_extraction job type
+
+Revision ID: c4a2d3e5f6b7
+Revises: b3f1c2d4e5a6
+Create Date: 2026-10-19 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a2d3e5f6b7'
+down_revision: Union[str, Sequence[str], None] = 'b3f1c2d4e5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'BATCH_EXTRACTION'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Postgres cannot drop a value from an enum type; rebuild it without BATCH_EXTRACTION
+    op.execute("DELETE FROM jobs WHERE job_type = 'BATCH_EXTRACTION'")
+    op.execute("ALTER TYPE jobtype RENAME TO jobtype_old")
+    op.execute("CREATE TYPE jobtype AS ENUM ('SCRAPE_YOUTUBE', 'TRANSCRIPTION_NLP')")
+    op.execute("ALTER TABLE jobs ALTER COLUMN job_type TYPE jobtype USING job_type::text::jobtype")
+    op.execute("DROP TYPE jobtype_old")
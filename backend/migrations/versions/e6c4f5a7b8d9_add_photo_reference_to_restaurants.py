@@ -0,0 +1,61 @@
+"""add photo_reference to restaurants
+
+Revision ID: e6c4f5a7b8d9
+Revises: d5b3e4f6a7c8
+Create Date: 2026-10-19 15:02:47.518204
+
+"""
+import hashlib
+from typing import Optional, Sequence, Union
+from urllib.parse import parse_qs, urlparse
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6c4f5a7b8d9'
+down_revision: Union[str, Sequence[str], None] = 'd5b3e4f6a7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Copied from app.utils.photo_store at the time of writing, so the migration does not
+# change along with the application code
+def extract_photo_reference(photo_url: str) -> Optional[str]:
+    params = parse_qs(urlparse(photo_url).query)
+    references = params.get("photoreference") or params.get("photo_reference")
+    return references[0] if references else None
+
+
+def build_photo_path(restaurant_id, photo_reference: str) -> str:
+    digest = hashlib.sha256(photo_reference.encode("utf-8")).hexdigest()
+    return f"/photos/{restaurant_id}?variant=card&v={digest[:12]}"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('restaurants', sa.Column('photo_reference', sa.Text(), nullable=True))
+
+    # Replace stored Google photo URLs (which embed the API key) with photo proxy paths
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT id, photo_url FROM restaurants "
+        "WHERE photo_url LIKE '%maps.googleapis.com/maps/api/place/photo%'"
+    )).fetchall()
+    for restaurant_id, photo_url in rows:
+        photo_reference = extract_photo_reference(photo_url)
+        bind.execute(
+            sa.text("UPDATE restaurants SET photo_reference = :reference, photo_url = :url WHERE id = :id"),
+            {
+                "id": restaurant_id,
+                "reference": photo_reference,
+                "url": build_photo_path(restaurant_id, photo_reference) if photo_reference else None,
+            },
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Proxy paths are left in photo_url; they stop resolving once the column is gone
+    op.drop_column('restaurants', 'photo_reference')
@@ -0,0 +1,54 @@
+"""add video_processing_jobs table
+
+Revision ID: f7d5a6b8c9e0
+Revises: e6c4f5a7b8d9
+Create Date: 2026-10-19 16:24:05.731862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d5a6b8c9e0'
+down_revision: Union[str, Sequence[str], None] = 'e6c4f5a7b8d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('video_processing_jobs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('video_id', sa.UUID(), nullable=False),
+    sa.Column('job_id', sa.UUID(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED', 'SKIPPED', name='videoprocessingstatus'), nullable=False),
+    sa.Column('stage', sa.Enum('DOWNLOADED', 'TRANSCRIBED', 'EXTRACTED', 'VALIDATED', 'STORED', name='videoprocessingstage'), nullable=True),
+    sa.Column('audio_path', sa.Text(), nullable=True),
+    sa.Column('entities', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('resolved_entities', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['video_id'], ['videos.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('video_id', 'job_id', name='uix_video_processing_job_video_job')
+    )
+    op.create_index(op.f('ix_video_processing_jobs_job_id'), 'video_processing_jobs', ['job_id'], unique=False)
+    op.create_index(op.f('ix_video_processing_jobs_video_id'), 'video_processing_jobs', ['video_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_video_processing_jobs_video_id'), table_name='video_processing_jobs')
+    op.drop_index(op.f('ix_video_processing_jobs_job_id'), table_name='video_processing_jobs')
+    op.drop_table('video_processing_jobs')
+    op.execute("DROP TYPE IF EXISTS videoprocessingstage")
+    op.execute("DROP TYPE IF EXISTS videoprocessingstatus")
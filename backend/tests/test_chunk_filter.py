@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+from app.utils.chunk_filter import (
+    DEFAULT_THRESHOLD,
+    build_gazetteer,
+    evaluate_filter,
+    score_chunk,
+    select_candidate_chunks,
+)
+from app.utils.text_chunker import count_tokens_locally
+
+# Labeled transcript chunks close to the pipeline's chunk size (CHUNK_TOKEN_BUDGET)
+FIXTURES = Path(__file__).parent / "fixtures" / "chunk_filter_samples.json"
+
+
+def test_filter_keeps_every_labeled_place_chunk():
+    samples = json.loads(FIXTURES.read_text(encoding="utf-8"))
+    assert all(count_tokens_locally(sample["text"]) > 2000 for sample in samples)
+
+    stats = evaluate_filter(samples)
+
+    assert stats["recall"] == 1.0
+    assert stats["precision"] == 1.0
+    assert stats["selected_rate"] < 1.0
+
+
+def test_score_does_not_grow_with_chunk_length():
+    narration = (
+        "This is the spot where we stopped since the rain started, it's called the old town. "
+        "We ate some rice and noodles in Bangkok, and I'm told the menu in Chiang Mai is spicy. "
+    )
+
+    assert score_chunk(narration * 40) == score_chunk(narration * 4)
+    assert score_chunk(narration * 40) < DEFAULT_THRESHOLD
+
+
+def test_description_names_boost_chunks():
+    gazetteer = build_gazetteer("Lahore food tour: Al Habib BBQ and Butt Karahi")
+
+    assert "al habib bbq" in gazetteer
+    assert score_chunk("then we went to al habib bbq", gazetteer) > score_chunk("then we went home", gazetteer)
+
+
+def test_candidate_chunks_include_neighbors():
+    chunks = [
+        "We landed and took a taxi to the hotel.",
+        "The weather was great all afternoon.",
+        "We're at Jay Fai, the famous street food stall run by a chef in ski goggles.",
+        "Her crab omelette is enormous and the line never ends.",
+        "Back at the hotel we packed our bags.",
+        "Thanks for watching and see you next time.",
+    ]
+
+    assert select_candidate_chunks(chunks, neighbors=1) == [1, 2, 3]
+
+
+def test_every_chunk_is_kept_when_none_qualifies():
+    chunks = [
+        "We landed and took a taxi to the hotel.",
+        "The weather was great all afternoon.",
+        "Thanks for watching and see you next time.",
+    ]
+
+    assert select_candidate_chunks(chunks) == [0, 1, 2]
+
+
+def test_known_restaurant_names_boost_chunks():
+    chunks = [
+        "We landed and took a taxi to the hotel.",
+        "Then we grabbed lunch at the old Sorn place everybody talks about, so spicy and delicious.",
+        "The weather was great all afternoon.",
+        "Thanks for watching and see you next time.",
+    ]
+
+    assert select_candidate_chunks(chunks, neighbors=0, known_names=["Sorn"]) == [1]
+    assert "bakery" not in build_gazetteer(None, ["Bakery", "Sorn"])
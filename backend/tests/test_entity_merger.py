@@ -0,0 +1,57 @@
+from app.utils.entity_parser import DEFAULT_CONFIDENCE_SCORE
+from app.utils.entity_merger import merge_entities, normalize_name
+
+
+def make_entity(name, city="Saigon", country="Vietnam", **fields):
+    entity = {
+        "restaurant_name": name,
+        "location": {"city": city, "county": None, "country": country},
+        "quotes": None,
+        "tags": [],
+        "cuisines": [],
+        "context": None,
+        "confidence_score": 0.5,
+    }
+    entity.update(fields)
+    return entity
+
+
+def test_normalize_name_ignores_accents_case_and_article():
+    assert normalize_name("The Bánh Mì Huỳnh Hoa!") == normalize_name("banh mi huynh hoa")
+
+
+def test_merge_unions_fields_across_chunks():
+    entities = [
+        make_entity("Bánh Mì Huỳnh Hoa", quotes=["So crunchy."], tags=["street food"], confidence_score=0.7),
+        make_entity("Pho Hoa", quotes=["Great broth."]),
+        make_entity("Banh Mi Huynh Hoa", city=None, quotes=["So crunchy!", "Worth the queue."],
+                    tags=["Street Food", "sandwich"], cuisines=["Vietnamese"], confidence_score=0.9),
+    ]
+
+    merged = merge_entities(entities)
+
+    assert [e["restaurant_name"] for e in merged] == ["Banh Mi Huynh Hoa", "Pho Hoa"]
+    banh_mi = merged[0]
+    assert banh_mi["location"]["city"] == "Saigon"
+    assert banh_mi["quotes"] == ["So crunchy.", "Worth the queue."]
+    assert banh_mi["tags"] == ["street food", "sandwich"]
+    assert banh_mi["cuisines"] == ["Vietnamese"]
+    assert banh_mi["confidence_score"] == 0.9
+
+
+def test_merge_keeps_similar_names_in_different_cities_apart():
+    entities = [make_entity("Joe's Pizza", city="New York", country="USA"), make_entity("Joe's Pizza", city="London", country="UK")]
+
+    assert len(merge_entities(entities)) == 2
+
+
+def test_merge_matches_misspelled_names():
+    entities = [make_entity("Al Habib BBQ", city="Lahore"), make_entity("Al Habeeb BBQ", city="Lahore")]
+
+    assert len(merge_entities(entities)) == 1
+
+
+def test_merge_fills_a_missing_confidence():
+    merged = merge_entities([make_entity("Pho Hoa", confidence_score=None)])
+
+    assert merged[0]["confidence_score"] == DEFAULT_CONFIDENCE_SCORE
@@ -0,0 +1,75 @@
+import json
+
+from app.utils.entity_parser import (
+    DEFAULT_CONFIDENCE_SCORE,
+    PARSE_DROPPED,
+    PARSE_OK,
+    PARSE_SALVAGED,
+    parse_entities,
+    salvage_json_objects,
+)
+
+PLACE = {
+    "restaurant_name": "Al Habib BBQ",
+    "location": {"city": "Lahore", "county": None, "country": "Pakistan"},
+    "quotes": ["The aroma here is just amazing.", "The juiciest chicken tikka."],
+    "tags": ["BBQ"],
+    "cuisines": ["Pakistani"],
+    "context": ["So today we're at Al Habib BBQ in Lahore."],
+    "confidence_score": 0.95,
+}
+
+
+def test_parse_structured_output():
+    entities, status = parse_entities(json.dumps({"places": [PLACE]}))
+
+    assert status == PARSE_OK
+    assert entities == [PLACE]
+
+
+def test_salvage_complete_objects_from_truncated_output():
+    second = dict(PLACE, restaurant_name="Bread {Me} Up \"Bakery\"")
+    content = json.dumps({"places": [PLACE, second, PLACE]})
+    truncated = content[: content.rindex("The aroma")]
+
+    assert salvage_json_objects(truncated) == [PLACE, second]
+    entities, status = parse_entities(truncated)
+    assert status == PARSE_SALVAGED
+    assert [e["restaurant_name"] for e in entities] == ["Al Habib BBQ", "Bread {Me} Up \"Bakery\""]
+
+
+def test_parse_repairs_fields_and_drops_unnamed_entities():
+    content = json.dumps([
+        {"restaurant_name": " Zhong Sik ", "location": None, "quotes": "Each course was a work of art.", "tags": None, "confidence_score": "1.4"},
+        {"restaurant_name": None, "quotes": ["x"]},
+    ])
+
+    entities, status = parse_entities(content)
+
+    assert status == PARSE_OK
+    assert entities == [{
+        "restaurant_name": "Zhong Sik",
+        "location": {"city": None, "county": None, "country": None},
+        "quotes": ["Each course was a work of art."],
+        "tags": [],
+        "cuisines": [],
+        "context": None,
+        "confidence_score": 1.0,
+    }]
+
+
+def test_missing_or_invalid_confidence_gets_the_default():
+    content = json.dumps({"places": [
+        {"restaurant_name": "Jay Fai"},
+        {"restaurant_name": "Raan Jay Fai", "confidence_score": None},
+        {"restaurant_name": "Thipsamai", "confidence_score": "high"},
+    ]})
+
+    entities, _ = parse_entities(content)
+
+    assert [entity["confidence_score"] for entity in entities] == [DEFAULT_CONFIDENCE_SCORE] * 3
+
+
+def test_unrecoverable_output_is_dropped():
+    assert parse_entities('{"places": [{"restaurant_name": "Al Ha') == ([], PARSE_DROPPED)
+    assert parse_entities("") == ([], PARSE_DROPPED)
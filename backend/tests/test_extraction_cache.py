@@ -0,0 +1,111 @@
+import asyncio
+
+from app.config import EXTRACTION_CACHE_TTL
+from app.utils import extraction_cache
+from app.utils.extraction_cache import extraction_cache_key, get_cached_entities, set_cached_entities
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+class FailingRedis:
+    async def get(self, key):
+        raise ConnectionError("connection reset")
+
+    async def setex(self, key, ttl, value):
+        raise ConnectionError("connection reset")
+
+
+def use_redis(monkeypatch, redis):
+    async def get_redis_client():
+        return redis
+
+    monkeypatch.setattr(extraction_cache, "get_redis_client", get_redis_client)
+
+
+def test_key_is_stable_and_namespaced():
+    key = extraction_cache_key("gpt-4.1", "v3", "Street food in Lahore", "We are at Butt Karahi")
+
+    assert key == extraction_cache_key("gpt-4.1", "v3", "Street food in Lahore", "We are at Butt Karahi")
+    assert key.startswith("extraction_cache:")
+    assert extraction_cache_key("gpt-4.1", "v3", None, "chunk") == extraction_cache_key("gpt-4.1", "v3", "", "chunk")
+
+
+def test_key_changes_with_every_input():
+    base = ("gpt-4.1", "v3", "Street food in Lahore", "We are at Butt Karahi")
+    key = extraction_cache_key(*base)
+
+    assert extraction_cache_key("gpt-4.1-mini", *base[1:]) != key
+    assert extraction_cache_key(base[0], "v4", *base[2:]) != key
+    assert extraction_cache_key(*base[:2], "Street food in Karachi", base[3]) != key
+    assert extraction_cache_key(*base[:3], "We are at Butt Karahi!") != key
+
+
+def test_round_trip(monkeypatch):
+    redis = FakeRedis()
+    use_redis(monkeypatch, redis)
+    key = extraction_cache_key("gpt-4.1", "v3", "desc", "chunk")
+    entities = [{"restaurant_name": "Taquería Los Cocuyos", "city": "Mexico City"}]
+
+    async def run():
+        await set_cached_entities(key, entities)
+        return await get_cached_entities(key)
+
+    assert asyncio.run(run()) == entities
+    assert redis.ttls[key] == EXTRACTION_CACHE_TTL
+
+
+def test_empty_result_is_a_hit(monkeypatch):
+    use_redis(monkeypatch, FakeRedis())
+    key = extraction_cache_key("gpt-4.1", "v3", "desc", "chunk without places")
+
+    async def run():
+        await set_cached_entities(key, [])
+        return await get_cached_entities(key)
+
+    assert asyncio.run(run()) == []
+
+
+def test_prompt_version_or_model_change_misses(monkeypatch):
+    use_redis(monkeypatch, FakeRedis())
+
+    async def run():
+        await set_cached_entities(extraction_cache_key("gpt-4.1", "v3", "desc", "chunk"), [{"restaurant_name": "Jay Fai"}])
+        return (
+            await get_cached_entities(extraction_cache_key("gpt-4.1", "v4", "desc", "chunk")),
+            await get_cached_entities(extraction_cache_key("gpt-4.1-mini", "v3", "desc", "chunk")),
+        )
+
+    assert asyncio.run(run()) == (None, None)
+
+
+def test_without_redis_everything_misses(monkeypatch):
+    use_redis(monkeypatch, None)
+    key = extraction_cache_key("gpt-4.1", "v3", "desc", "chunk")
+
+    async def run():
+        await set_cached_entities(key, [{"restaurant_name": "Jay Fai"}])
+        return await get_cached_entities(key)
+
+    assert asyncio.run(run()) is None
+
+
+def test_redis_errors_are_misses(monkeypatch):
+    use_redis(monkeypatch, FailingRedis())
+    key = extraction_cache_key("gpt-4.1", "v3", "desc", "chunk")
+
+    async def run():
+        await set_cached_entities(key, [{"restaurant_name": "Jay Fai"}])
+        return await get_cached_entities(key)
+
+    assert asyncio.run(run()) is None
@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.utils.google_maps_client import GoogleMapsClient, GoogleMapsError
+
+
+def make_client(handler, **kwargs) -> GoogleMapsClient:
+    return GoogleMapsClient("test-key", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_identical_concurrent_requests_are_coalesced():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"status": "OK", "results": [{"place_id": "abc"}]})
+
+    async def run():
+        client = make_client(handler, qps=0)
+        results = await asyncio.gather(*[client.places("Jay Fai Bangkok") for _ in range(5)], client.places("Jay Fai Thailand"))
+        await client.aclose()
+        return client, results
+
+    client, results = asyncio.run(run())
+
+    assert len(calls) == 2
+    assert calls[0].path == "/maps/api/place/textsearch/json"
+    assert calls[0].params["key"] == "test-key"
+    assert all(result["results"][0]["place_id"] == "abc" for result in results)
+    assert client.metrics["coalesced"] == 4
+
+
+def test_requests_are_spaced_by_qps():
+    async def handler(request):
+        return httpx.Response(200, json={"status": "OK", "results": []})
+
+    async def run():
+        client = make_client(handler, qps=20)
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(*[client.geocode(f"address {i}") for i in range(4)])
+        await client.aclose()
+        return asyncio.get_running_loop().time() - started
+
+    assert asyncio.run(run()) >= 0.14
+
+
+def test_error_statuses_raise_and_no_match_returns():
+    async def handler(request):
+        status = "OVER_QUERY_LIMIT" if request.url.params["place_id"] == "busy" else "NOT_FOUND"
+        return httpx.Response(200, json={"status": status})
+
+    async def run():
+        client = make_client(handler, qps=0)
+        try:
+            not_found = await client.place("missing", fields=["reviews"])
+            with pytest.raises(GoogleMapsError) as error:
+                await client.place("busy")
+            return not_found, error.value
+        finally:
+            await client.aclose()
+
+    not_found, error = asyncio.run(run())
+
+    assert not_found["status"] == "NOT_FOUND"
+    assert error.status == "OVER_QUERY_LIMIT"
+
+
+def test_photo_follows_the_redirect_to_the_image():
+    async def handler(request):
+        if request.url.path == "/maps/api/place/photo":
+            assert request.url.params["photo_reference"] == "ref-123"
+            return httpx.Response(302, headers={"Location": "https://lh3.googleusercontent.com/p/ref-123"})
+        return httpx.Response(200, content=b"image-bytes")
+
+    async def run():
+        client = make_client(handler, qps=0)
+        content = await client.photo("ref-123", 1600)
+        await client.aclose()
+        return content
+
+    assert asyncio.run(run()) == b"image-bytes"
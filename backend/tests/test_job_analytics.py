@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+from app.utils.job_analytics import combine_groups, job_analytics, jobs_summary, performance_analytics
+
+JOB_TYPES = ["scrape_youtube", "transcription_nlp", "batch_extraction"]
+STATUSES = ["pending", "running", "completed", "failed", "cancelled"]
+
+
+def group(job_type, status, jobs, **aggregates):
+    return {"job_type": job_type, "status": status, "jobs": jobs, **aggregates}
+
+
+GROUPS = [
+    group("transcription_nlp", "completed", 3, processed_items=30, failed_items=2,
+          duration_count=3, duration_sum=Decimal("30"), duration_min=Decimal("5"), duration_max=Decimal("15"),
+          rate_count=2, rate_sum=4.0, rate_min=1.0, rate_max=3.0),
+    group("transcription_nlp", "failed", 1, failed_items=5, cancellation_requests=0,
+          duration_count=1, duration_sum=Decimal("2"), duration_min=Decimal("2"), duration_max=Decimal("2")),
+    group("transcription_nlp", "running", 2, processed_items=4, queue_size=6, items_in_progress=3,
+          cancellation_requests=1, rate_count=1, rate_sum=8.0, rate_min=8.0, rate_max=8.0),
+    group("scrape_youtube", "cancelled", 1, cancellation_requests=1),
+]
+
+
+def test_combine_groups_without_groups():
+    combined = combine_groups([])
+
+    assert combined["jobs"] == 0
+    assert combined["duration_sum"] == 0
+    assert combined["duration_min"] is None
+
+
+def test_job_analytics():
+    analytics = job_analytics(GROUPS, JOB_TYPES)
+
+    assert analytics["total_jobs"] == 7
+    assert analytics["completion_rates_by_type"]["transcription_nlp"] == {"completed": 3, "total": 6, "rate": 50.0}
+    assert analytics["completion_rates_by_type"]["batch_extraction"] == {"completed": 0, "total": 0, "rate": 0}
+    assert analytics["average_processing_times"]["transcription_nlp"] == {
+        "average_minutes": 8.0,
+        "min_minutes": 2.0,
+        "max_minutes": 15.0,
+        "sample_size": 4,
+    }
+    assert analytics["average_processing_times"]["scrape_youtube"] == {
+        "average_minutes": 0,
+        "min_minutes": 0,
+        "max_minutes": 0,
+        "sample_size": 0,
+    }
+    assert analytics["success_failure_ratios"]["transcription_nlp"] == {
+        "success_count": 3,
+        "failure_count": 1,
+        "cancelled_count": 0,
+        "success_rate": 75.0,
+        "failure_rate": 25.0,
+    }
+    assert analytics["success_failure_ratios"]["scrape_youtube"]["cancelled_count"] == 1
+    assert analytics["processing_rate_statistics"] == {
+        "average_rate": 4.0,
+        "min_rate": 1.0,
+        "max_rate": 8.0,
+        "sample_size": 3,
+    }
+    assert analytics["queue_metrics"] == {
+        "total_queue_size": 6,
+        "total_items_in_progress": 3,
+        "total_failed_items": 7,
+        "active_jobs_count": 2,
+    }
+
+
+def test_jobs_summary():
+    summary = jobs_summary(GROUPS, STATUSES)
+
+    assert summary["status_counts"] == {"pending": 0, "running": 2, "completed": 3, "failed": 1, "cancelled": 1}
+    assert summary["total_jobs"] == 7
+    assert summary["statistics"] == {
+        "total_failed_items": 7,
+        "total_processed_items": 34,
+        "total_queue_size": 6,
+        "active_jobs_with_cancellation": 1,
+        "total_cancellation_requests": 2,
+    }
+
+
+def test_performance_analytics():
+    performance = performance_analytics(GROUPS, JOB_TYPES, days=7)
+
+    assert performance == {
+        "period_days": 7,
+        "total_jobs": 7,
+        "completed_jobs": 3,
+        "failed_jobs": 1,
+        "cancelled_jobs": 1,
+        "success_rate": 60.0,
+        "average_processing_rate": 2.0,
+        "job_types_breakdown": {"scrape_youtube": 1, "transcription_nlp": 6, "batch_extraction": 0},
+    }
@@ -0,0 +1,169 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+from enum import Enum
+from types import SimpleNamespace
+
+from jose import jwt
+
+from app.utils import job_events
+from app.utils.job_events import (
+    create_events_token,
+    format_sse,
+    is_terminal_event,
+    job_event,
+    progress_event,
+    publish_job_event,
+    stream_job_events,
+    verify_events_token,
+    video_event,
+)
+
+
+class Status(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.closed = False
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        return self.messages.pop(0) if self.messages else None
+
+    async def aclose(self):
+        self.closed = True
+
+
+def collect(stream, limit=10):
+    async def run():
+        frames = []
+        async for frame in stream:
+            frames.append(frame)
+            if len(frames) == limit:
+                break
+        await stream.aclose()
+        return frames
+
+    return asyncio.run(run())
+
+
+def test_progress_event_keeps_progress_fields_only():
+    event = progress_event("job-1", {
+        "progress": 40,
+        "processed_items": 4,
+        "estimated_completion_time": datetime(2026, 1, 1, 12, 4),
+        "result_data": "{}",
+    })
+
+    assert event == {
+        "type": "progress",
+        "job_id": "job-1",
+        "progress": 40,
+        "processed_items": 4,
+        "estimated_completion_time": "2026-01-01T12:04:00",
+    }
+
+
+def test_job_event_reports_the_job_state():
+    job = SimpleNamespace(
+        id="job-1", status=Status.COMPLETED, progress=100, total_items=3, processed_items=3, failed_items=0,
+        items_in_progress=0, queue_size=0, processing_rate=1.5, estimated_completion_time=None,
+    )
+
+    event = job_event(job)
+
+    assert event["status"] == "completed"
+    assert event["processing_rate"] == 1.5
+    assert is_terminal_event(event)
+    assert not is_terminal_event({**event, "status": "running"})
+    assert not is_terminal_event(video_event("job-1", "video-1", status="completed"))
+
+
+def test_video_event_and_sse_frame():
+    event = video_event("job-1", "video-1", stage="transcribed")
+
+    assert event == {"type": "video", "job_id": "job-1", "video_id": "video-1", "stage": "transcribed"}
+    assert format_sse(event) == f"event: video\ndata: {json.dumps(event)}\n\n"
+
+
+def test_events_are_published_to_the_job_and_to_all_jobs(monkeypatch):
+    redis = FakeRedis()
+
+    async def get_redis_client():
+        return redis
+
+    monkeypatch.setattr(job_events, "get_redis_client", get_redis_client)
+
+    asyncio.run(publish_job_event(video_event("job-1", "video-1", stage="extracted")))
+
+    assert [channel for channel, _ in redis.published] == ["jobs:job-1:events", "jobs:events"]
+
+
+def test_publishing_without_redis_is_a_no_op(monkeypatch):
+    async def get_redis_client():
+        return None
+
+    monkeypatch.setattr(job_events, "get_redis_client", get_redis_client)
+
+    asyncio.run(publish_job_event(video_event("job-1", "video-1")))
+
+
+def test_stream_sends_the_current_state_then_events_until_the_job_finishes():
+    running = progress_event("job-1", {"status": "running", "progress": 50})
+    stage = video_event("job-1", "video-1", stage="stored")
+    finished = progress_event("job-1", {"status": "completed", "progress": 100})
+    pubsub = FakePubSub([
+        None,
+        {"type": "message", "data": json.dumps(stage)},
+        {"type": "message", "data": "not json"},
+        {"type": "message", "data": json.dumps(finished)},
+        {"type": "message", "data": json.dumps(stage)},
+    ])
+
+    frames = collect(stream_job_events(pubsub, first=running, until=is_terminal_event))
+
+    assert frames == [format_sse(running), ": keepalive\n\n", format_sse(stage), format_sse(finished)]
+    assert pubsub.closed
+
+
+def test_stream_of_a_finished_job_ends_after_its_state():
+    finished = progress_event("job-1", {"status": "cancelled"})
+    pubsub = FakePubSub([{"type": "message", "data": json.dumps(finished)}])
+
+    frames = collect(stream_job_events(pubsub, first=finished, until=is_terminal_event))
+
+    assert frames == [format_sse(finished)]
+    assert pubsub.closed
+
+
+def test_events_token_round_trip():
+    token = create_events_token({"sub": "user-1", "email": "admin@example.com"}, "secret", ttl=60)
+
+    claims = verify_events_token(token, "secret")
+
+    assert claims["sub"] == "user-1" and claims["email"] == "admin@example.com"
+    assert verify_events_token(token, "other-secret") is None
+
+
+def test_events_token_expires():
+    token = create_events_token({"sub": "user-1"}, "secret", ttl=60, now=time.time() - 120)
+
+    assert verify_events_token(token, "secret") is None
+
+
+def test_api_tokens_are_not_events_tokens():
+    api_token = jwt.encode({"sub": "user-1", "aud": "authenticated", "exp": int(time.time()) + 3600}, "secret", algorithm="HS256")
+
+    assert verify_events_token(api_token, "secret") is None
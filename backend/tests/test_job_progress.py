@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime
+
+from app.utils.job_progress import JobProgressReporter, progress_values
+
+
+class Writer:
+    def __init__(self):
+        self.writes = []
+
+    async def __call__(self, job_id):
+        self.writes.append(job_id)
+
+
+def test_progress_values():
+    now = datetime(2026, 1, 1, 12, 0)
+
+    values = progress_values(total=10, processed=3, failed=1, in_progress=2, elapsed_seconds=120, now=now)
+
+    assert values == {
+        "progress": 40,
+        "processed_items": 4,
+        "failed_items": 1,
+        "items_in_progress": 2,
+        "queue_size": 4,
+        "processing_rate": 1.5,
+        "estimated_completion_time": datetime(2026, 1, 1, 12, 4),
+    }
+
+
+def test_progress_values_without_items_or_rate():
+    assert progress_values(0, 0, 0, 0, 0) == {
+        "progress": 100,
+        "processed_items": 0,
+        "failed_items": 0,
+        "items_in_progress": 0,
+        "queue_size": 0,
+        "processing_rate": 0.0,
+    }
+
+
+def test_reports_are_coalesced_into_one_write_per_job():
+    writer = Writer()
+    reporter = JobProgressReporter(writer)
+
+    async def run():
+        for job_id in ["job-1", "job-1", "job-2"]:
+            reporter.item_started(job_id)
+            reporter.item_finished(job_id)
+        await reporter.flush()
+        await reporter.flush()
+
+    asyncio.run(run())
+
+    assert sorted(writer.writes) == ["job-1", "job-2"]  # Nothing to write on the second flush
+    assert reporter.in_progress == {}
+
+
+def test_jobs_with_items_in_progress_are_written_on_every_flush():
+    writer = Writer()
+    reporter = JobProgressReporter(writer)
+
+    async def run():
+        reporter.item_started("job-1")
+        reporter.item_started("job-1")
+        reporter.item_finished("job-1")
+        await reporter.flush()
+        await reporter.flush()  # A long item keeps its job's progress and heartbeat fresh
+        reporter.item_finished("job-1")
+        await reporter.flush()
+        await reporter.flush()
+
+    asyncio.run(run())
+
+    assert writer.writes == ["job-1", "job-1", "job-1"]
+
+
+def test_the_timer_flushes_without_events():
+    writer = Writer()
+    reporter = JobProgressReporter(writer, flush_interval=0.01)
+
+    async def run():
+        reporter.item_started("job-1")
+        timer = asyncio.create_task(reporter.run())
+        await asyncio.sleep(0.05)
+        timer.cancel()
+
+    asyncio.run(run())
+
+    assert len(writer.writes) >= 2
+
+
+def test_a_failed_write_is_not_fatal():
+    async def failing_writer(job_id):
+        raise ConnectionError("database is down")
+
+    reporter = JobProgressReporter(failing_writer)
+
+    async def run():
+        reporter.item_started("job-1")
+        await reporter.flush()
+
+    asyncio.run(run())
+
+    assert reporter.writes == 0
@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+from app.utils.openai_batch import LocalBatchBackend, build_batch_line, encode_batch_file, parse_batch_output, split_batch_lines
+
+
+def test_batch_file_is_jsonl_of_chat_completion_requests():
+    lines = [build_batch_line("video-1:0", {"model": "gpt-4.1", "messages": []}), build_batch_line("video-1:1", {"model": "gpt-4.1", "messages": []})]
+
+    decoded = [json.loads(line) for line in encode_batch_file(lines).decode("utf-8").splitlines()]
+
+    assert decoded[0] == {"custom_id": "video-1:0", "method": "POST", "url": "/v1/chat/completions", "body": {"model": "gpt-4.1", "messages": []}}
+    assert [line["custom_id"] for line in decoded] == ["video-1:0", "video-1:1"]
+
+
+def test_local_backend_echoes_canned_results():
+    canned = json.dumps({"places": [{"restaurant_name": "Al Habib BBQ"}]})
+    backend = LocalBatchBackend(lambda body: canned)
+
+    async def run():
+        batch_id = await backend.submit([build_batch_line("video-1:0", {"model": "gpt-4.1", "messages": []})])
+        return await backend.retrieve(batch_id)
+
+    status, counts, output = asyncio.run(run())
+    results = parse_batch_output(output)
+
+    assert status == "completed"
+    assert counts["completed"] == 1
+    assert results["video-1:0"].choices[0].message.content == canned
+
+
+def test_failed_batch_requests_map_to_none():
+    output = "\n".join([
+        json.dumps({"custom_id": "video-1:0", "response": {"status_code": 500, "body": {}}, "error": None}),
+        json.dumps({"custom_id": "video-1:1", "response": None, "error": {"code": "batch_expired", "message": "expired"}}),
+        "not json",
+    ])
+
+    assert parse_batch_output(output) == {"video-1:0": None, "video-1:1": None}
+
+
+def test_split_batch_lines_respects_request_limit():
+    lines = [build_batch_line(f"video-1:{index}", {"model": "gpt-4.1", "messages": []}) for index in range(5)]
+
+    groups = split_batch_lines(lines, max_requests=2)
+
+    assert [len(group) for group in groups] == [2, 2, 1]
+    assert [line for group in groups for line in group] == lines
+
+
+def test_split_batch_lines_keeps_each_file_under_byte_limit():
+    lines = [build_batch_line(f"video-1:{index}", {"model": "gpt-4.1", "messages": [{"role": "user", "content": "x" * 100}]}) for index in range(10)]
+    max_bytes = len(encode_batch_file(lines[:3])) + 1
+
+    groups = split_batch_lines(lines, max_bytes=max_bytes)
+
+    assert [len(group) for group in groups] == [3, 3, 3, 1]
+    assert all(len(encode_batch_file(group)) <= max_bytes for group in groups)
+
+
+def test_split_batch_lines_without_lines():
+    assert split_batch_lines([]) == []
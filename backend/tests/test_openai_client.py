@@ -0,0 +1,140 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from app.utils.openai_client import OpenAIGovernor, RateLimiter, TokenUsage
+
+
+def make_rate_limit_error(retry_after: str) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": retry_after}, request=request)
+    return openai.RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class FakeCompletions:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures > 0:
+                self.failures -= 1
+                raise make_rate_limit_error("0.01")
+            return SimpleNamespace(usage=SimpleNamespace(total_tokens=10))
+        finally:
+            self.in_flight -= 1
+
+
+def make_governor(completions: FakeCompletions, **kwargs) -> OpenAIGovernor:
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return OpenAIGovernor(client, **kwargs)
+
+
+def test_rate_limiter_waits_when_request_budget_is_spent():
+    async def run():
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=100000)
+        limiter._requests = 0  # Next request slot refills after 0.1s
+        return await limiter.acquire()
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_governor_retries_rate_limits_using_retry_after():
+    completions = FakeCompletions(failures=2)
+    governor = make_governor(completions, max_retries=3)
+
+    response = asyncio.run(governor.chat_completion(model="gpt-4.1", messages=[{"role": "user", "content": "hi"}]))
+
+    assert response.usage.total_tokens == 10
+    assert completions.calls == 3
+    metrics = governor.get_metrics()
+    assert metrics["rate_limited"] == 2
+    assert metrics["retries"] == 2
+    assert metrics["succeeded"] == 1
+
+
+def test_governor_bounds_concurrency():
+    completions = FakeCompletions()
+    governor = make_governor(completions, max_concurrency=2)
+
+    async def run():
+        await asyncio.gather(*[
+            governor.chat_completion(model="gpt-4.1", messages=[{"role": "user", "content": "hi"}])
+            for _ in range(6)
+        ])
+
+    asyncio.run(run())
+    assert completions.max_in_flight == 2
+    assert governor.get_metrics()["max_in_flight"] == 2
+
+
+def test_governor_does_not_hold_a_slot_while_waiting_for_rate_budget():
+    completions = FakeCompletions()
+    governor = make_governor(completions, max_concurrency=1)
+    budget = asyncio.Event()
+    waits = []
+
+    async def acquire(tokens=0):
+        # The first caller waits for rate budget, later ones get it right away
+        waits.append(tokens)
+        if len(waits) == 1:
+            await budget.wait()
+        return 0.0
+
+    governor.limiter.acquire = acquire
+
+    async def run():
+        waiting = asyncio.create_task(governor.chat_completion(model="gpt-4.1", messages=[{"role": "user", "content": "hi"}]))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(
+            governor.chat_completion(model="gpt-4.1", messages=[{"role": "user", "content": "hello"}]), timeout=1
+        )
+        budget.set()
+        await waiting
+
+    asyncio.run(run())
+    assert completions.calls == 2
+
+
+def test_token_usage_separates_cached_tokens():
+    usage = TokenUsage()
+    usage.add(SimpleNamespace(prompt_tokens=1000, completion_tokens=50, prompt_tokens_details=SimpleNamespace(cached_tokens=800)))
+    usage.add(SimpleNamespace(prompt_tokens=1000, completion_tokens=50, prompt_tokens_details=None))
+
+    assert usage.to_dict() == {
+        "requests": 2,
+        "input_tokens": 2000,
+        "cached_input_tokens": 800,
+        "uncached_input_tokens": 1200,
+        "output_tokens": 100,
+        "cache_hit_rate": 0.4,
+        "cached_chunks": 0,
+        "salvaged_chunks": 0,
+        "dropped_chunks": 0,
+        "skipped_chunks": 0,
+        "audio_seconds": 0,
+        "estimated_cost": 0.0036,
+    }
+
+
+def test_token_usage_from_dicts_sums_worker_snapshots():
+    first, second = TokenUsage(), TokenUsage()
+    first.add(SimpleNamespace(prompt_tokens=1000, completion_tokens=50, prompt_tokens_details=SimpleNamespace(cached_tokens=800)))
+    second.add(SimpleNamespace(prompt_tokens=1000, completion_tokens=50, prompt_tokens_details=None))
+    second.dropped_chunks = 1
+
+    total = TokenUsage.from_dicts([first.to_dict(), second.to_dict(), {}])
+
+    assert total.requests == 2
+    assert total.uncached_input_tokens == 1200
+    assert total.to_dict()["cache_hit_rate"] == 0.4
+    assert total.dropped_chunks == 1
@@ -0,0 +1,82 @@
+import asyncio
+import io
+
+from PIL import Image
+
+from app.utils.photo_store import (
+    PHOTO_VARIANTS,
+    PhotoStore,
+    build_photo_url,
+    extract_photo_reference,
+    photo_etag,
+    public_photo_url,
+    render_variants,
+    stored_photo_url,
+)
+from app.config import PUBLIC_API_URL
+
+
+def make_jpeg(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 80, 40)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def test_render_variants_resizes_to_webp_without_upscaling():
+    variants = render_variants(make_jpeg(800, 600))
+
+    sizes = {name: Image.open(io.BytesIO(data)).size for name, data in variants.items()}
+    formats = {Image.open(io.BytesIO(data)).format for data in variants.values()}
+
+    assert set(variants) == set(PHOTO_VARIANTS)
+    assert formats == {"WEBP"}
+    assert sizes["thumbnail"] == (160, 120)
+    assert sizes["card"] == (480, 360)
+    assert sizes["hero"] == (800, 600)
+
+
+def test_photo_urls_and_etags_do_not_expose_the_api_key():
+    legacy_url = "https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference=ref-123&key=secret"
+
+    reference = extract_photo_reference(legacy_url)
+    url = build_photo_url("4f1c", reference)
+
+    assert reference == "ref-123"
+    assert "secret" not in url and "ref-123" not in url
+    assert url.startswith("/photos/4f1c?variant=card&v=")
+    assert extract_photo_reference("https://images.pexels.com/photo.jpg") is None
+    assert photo_etag(reference, "card") != photo_etag(reference, "hero")
+    assert photo_etag(reference, "card") != photo_etag("ref-456", "card")
+
+
+def test_photo_paths_resolve_against_the_public_api_url():
+    path = build_photo_url("4f1c", "ref-123")
+
+    assert public_photo_url(path) == f"{PUBLIC_API_URL}{path}"
+    assert stored_photo_url(public_photo_url(path)) == path
+    assert public_photo_url("https://images.pexels.com/photo.jpg") == "https://images.pexels.com/photo.jpg"
+    assert stored_photo_url("https://images.pexels.com/photo.jpg") == "https://images.pexels.com/photo.jpg"
+    assert public_photo_url(None) is None
+
+
+def test_photo_store_downloads_each_reference_once(tmp_path):
+    downloads = []
+
+    async def fetch(photo_reference):
+        downloads.append(photo_reference)
+        await asyncio.sleep(0.01)
+        return make_jpeg(1000, 500)
+
+    store = PhotoStore(str(tmp_path), fetch=fetch)
+
+    async def run():
+        first = await asyncio.gather(*[store.get("ref-123", variant) for variant in PHOTO_VARIANTS])
+        second = await store.get("ref-123", "card")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert downloads == ["ref-123"]
+    assert second == first[list(PHOTO_VARIANTS).index("card")]
+    assert all(store.path("ref-123", variant).exists() for variant in PHOTO_VARIANTS)
+    assert store.metrics == {"hits": 1, "misses": 3, "downloads": 1}
@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.utils.openai_client import OpenAIGovernor
+from app.utils.pipeline_metrics import combine_pipeline_metrics, count_metric, metrics_scope
+
+
+class FakeCompletions:
+    async def create(self, **kwargs):
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=10))
+
+
+def test_counts_only_inside_a_scope():
+    count_metric("resolver_lookups")
+
+    with metrics_scope() as metrics:
+        count_metric("resolver_lookups")
+        count_metric("openai_backoff_seconds", 1.5)
+
+    count_metric("resolver_lookups")
+    assert metrics == {"resolver_lookups": 1, "openai_backoff_seconds": 1.5}
+
+
+def test_concurrent_videos_count_their_own_calls():
+    governor = OpenAIGovernor(SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions())))
+
+    async def process_video(calls):
+        for _ in range(calls):
+            await governor.chat_completion(model="gpt-4.1", messages=[{"role": "user", "content": "hi"}])
+
+    async def run_video(calls):
+        # Like the worker: the processing task is started inside the video's scope
+        with metrics_scope() as metrics:
+            work = asyncio.create_task(process_video(calls))
+        await work
+        return metrics
+
+    async def run():
+        return await asyncio.gather(run_video(1), run_video(3))
+
+    first, second = asyncio.run(run())
+
+    assert first["openai_requests"] == 1 and first["openai_succeeded"] == 1
+    assert second["openai_requests"] == 3 and second["openai_succeeded"] == 3
+    assert governor.get_metrics()["requests"] == 4
+
+
+def test_combine_sums_the_videos_of_a_job():
+    combined = combine_pipeline_metrics([
+        {"openai_requests": 2, "openai_limiter_wait_seconds": 0.104, "places_textsearch_hits": 1},
+        None,
+        {"openai_requests": 3, "openai_limiter_wait_seconds": 0.2, "resolver_local_matches": 1},
+    ])
+
+    assert combined == {
+        "openai_limiter_wait_seconds": 0.3,
+        "openai_requests": 5,
+        "places_textsearch_hits": 1,
+        "resolver_local_matches": 1,
+    }
@@ -0,0 +1,24 @@
+import uuid
+
+from app.utils.pipeline_stages import decode_resolved, encode_resolved, stage_completed
+
+
+def test_stage_completed_follows_pipeline_order():
+    assert not stage_completed(None, "downloaded")
+    assert stage_completed("extracted", "transcribed")
+    assert stage_completed("extracted", "extracted")
+    assert not stage_completed("extracted", "validated")
+
+
+def test_resolved_entities_round_trip_through_json_form():
+    restaurant_id = uuid.uuid4()
+    resolved = [
+        ({"restaurant_name": "Jay Fai"}, {"valid": True, "restaurant_id": restaurant_id, "name": "Jay Fai"}),
+        ({"restaurant_name": "Nowhere"}, {"valid": False}),
+    ]
+
+    encoded = encode_resolved(resolved)
+
+    assert encoded[0]["validated"]["restaurant_id"] == str(restaurant_id)
+    assert decode_resolved(encoded) == resolved
+    assert resolved[0][1]["restaurant_id"] == restaurant_id  # Input is not modified
@@ -0,0 +1,68 @@
+import asyncio
+
+from app.config import PLACES_CACHE_TTL, PLACES_NEGATIVE_CACHE_TTL
+from app.utils import places_cache
+from app.utils.places_cache import cached_lookup, classify_places_status, get_places_cache_metrics
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+def run_lookups(monkeypatch, responses, queries):
+    redis = FakeRedis()
+
+    async def get_redis_client():
+        return redis
+
+    monkeypatch.setattr(places_cache, "get_redis_client", get_redis_client)
+    monkeypatch.setattr(places_cache, "_metrics", {})
+    calls = []
+
+    async def run():
+        results = []
+        for query in queries:
+            async def fetch(query=query):
+                calls.append(query)
+                return responses[len(calls) - 1]
+            results.append(await cached_lookup("textsearch", query, fetch, classify_places_status))
+        return results
+
+    return asyncio.run(run()), calls, redis
+
+
+def test_normalized_queries_share_one_lookup(monkeypatch):
+    ok = {"status": "OK", "results": [{"place_id": "abc"}]}
+
+    results, calls, redis = run_lookups(monkeypatch, [ok], ["Jay Fai Bangkok Thailand", "jay fai, bangkok  thailand"])
+
+    assert results == [ok, ok]
+    assert len(calls) == 1
+    assert list(redis.ttls.values()) == [PLACES_CACHE_TTL]
+    assert get_places_cache_metrics()["textsearch"]["hit_rate"] == 0.5
+
+
+def test_zero_results_are_negatively_cached(monkeypatch):
+    results, calls, redis = run_lookups(monkeypatch, [{"status": "ZERO_RESULTS", "results": []}], ["Nowhere Cafe", "Nowhere Cafe"])
+
+    assert len(calls) == 1
+    assert list(redis.ttls.values()) == [PLACES_NEGATIVE_CACHE_TTL]
+    assert get_places_cache_metrics()["textsearch"]["negative_hits"] == 1
+
+
+def test_quota_errors_are_not_cached(monkeypatch):
+    denied = {"status": "OVER_QUERY_LIMIT", "results": []}
+
+    results, calls, redis = run_lookups(monkeypatch, [denied, denied], ["Jay Fai", "Jay Fai"])
+
+    assert len(calls) == 2
+    assert redis.values == {}
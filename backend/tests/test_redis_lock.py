@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from app.utils.redis_lock import (
+    EXTEND_SCRIPT,
+    RELEASE_SCRIPT,
+    LockNotAcquired,
+    acquire_lock,
+    extend_lock,
+    hold_lock,
+    release_lock,
+    resource_lock_key,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        self.ttls[key] = px
+        return True
+
+    async def eval(self, script, numkeys, key, token, *args):
+        if self.values.get(key) != token:
+            return 0
+        if script == RELEASE_SCRIPT:
+            del self.values[key]
+        elif script == EXTEND_SCRIPT:
+            self.ttls[key] = args[0]
+        return 1
+
+
+def test_resource_lock_key():
+    assert resource_lock_key("video", 42) == "lock:video:42"
+
+
+def test_lock_is_exclusive_to_its_owner():
+    redis = FakeRedis()
+
+    async def run():
+        first = await acquire_lock(redis, "lock:job", "job-1", 10)
+        second = await acquire_lock(redis, "lock:job", "job-2", 10)
+        again = await acquire_lock(redis, "lock:job", "job-1", 20)
+        return first, second, again
+
+    assert asyncio.run(run()) == (True, False, True)
+    assert redis.values["lock:job"] == "job-1"
+    assert redis.ttls["lock:job"] == 20000
+
+
+def test_only_the_owner_extends_or_releases_a_lock():
+    redis = FakeRedis()
+
+    async def run():
+        await acquire_lock(redis, "lock:job", "job-1", 10)
+        results = [
+            await extend_lock(redis, "lock:job", "job-2", 30),
+            await release_lock(redis, "lock:job", "job-2"),
+        ]
+        held_by = await redis.get("lock:job")
+        results.append(await release_lock(redis, "lock:job", "job-1"))
+        return results, held_by
+
+    results, held_by = asyncio.run(run())
+
+    assert results == [False, False, True]
+    assert held_by == "job-1"
+    assert "lock:job" not in redis.values
+
+
+def test_hold_lock_releases_on_exit_and_on_error():
+    redis = FakeRedis()
+
+    async def run():
+        async with hold_lock("lock:video:1", "task-1", 10, client=redis):
+            inside = await redis.get("lock:video:1")
+        with pytest.raises(ValueError):
+            async with hold_lock("lock:video:1", "task-1", 10, client=redis):
+                raise ValueError("stage failed")
+        return inside
+
+    assert asyncio.run(run()) == "task-1"
+    assert redis.values == {}
+
+
+def test_hold_lock_renews_the_lock_while_held():
+    redis = FakeRedis()
+
+    async def run():
+        async with hold_lock("lock:video:1", "task-1", 0.03, client=redis):
+            redis.ttls["lock:video:1"] = None
+            await asyncio.sleep(0.05)
+            return redis.ttls["lock:video:1"]
+
+    assert asyncio.run(run()) == 30
+
+
+def test_hold_lock_gives_up_after_waiting():
+    redis = FakeRedis()
+
+    async def run():
+        await acquire_lock(redis, "lock:channel:c1", "other", 10)
+        async with hold_lock("lock:channel:c1", "task-1", 10, wait=0.05, client=redis):
+            pass
+
+    with pytest.raises(LockNotAcquired):
+        asyncio.run(run())
+    assert redis.values["lock:channel:c1"] == "other"
+
+
+def test_hold_lock_waits_for_the_holder_to_release():
+    redis = FakeRedis()
+
+    async def run():
+        await acquire_lock(redis, "lock:channel:c1", "other", 10)
+
+        async def release_soon():
+            await asyncio.sleep(0.05)
+            await release_lock(redis, "lock:channel:c1", "other")
+
+        releaser = asyncio.create_task(release_soon())
+        async with hold_lock("lock:channel:c1", "task-1", 10, wait=1, client=redis):
+            holder = await redis.get("lock:channel:c1")
+        await releaser
+        return holder
+
+    assert asyncio.run(run()) == "task-1"
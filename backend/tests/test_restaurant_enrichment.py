@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from app.utils.restaurant_enrichment import BackfillProgress, apply_place_details, details_fields
+
+
+def make_restaurant(**overrides):
+    fields = dict(
+        id="4f1c",
+        photo_reference=None,
+        photo_url=None,
+        google_rating=None,
+        business_status="BUSINESS_STATUS_UNSPECIFIED",
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_details_fields_merge_into_one_lookup():
+    assert details_fields(["rating", "photo", "business_status"]) == ["business_status", "photos", "rating"]
+
+
+def test_apply_place_details_only_reports_changed_fields():
+    restaurant = make_restaurant(google_rating=4.5)
+    result = {
+        "photos": [{"photo_reference": "ref-123"}],
+        "rating": 4.5,
+        "business_status": "OPERATIONAL",
+    }
+
+    changed = apply_place_details(restaurant, result, ["photo", "rating", "business_status"])
+
+    assert changed == ["photo", "business_status"]
+    assert restaurant.photo_reference == "ref-123"
+    assert "/photos/4f1c?variant=card" in restaurant.photo_url
+    assert restaurant.business_status == "OPERATIONAL"
+    assert apply_place_details(restaurant, result, ["photo", "rating", "business_status"]) == []
+
+
+def test_apply_place_details_ignores_fields_not_requested_or_missing():
+    restaurant = make_restaurant()
+
+    assert apply_place_details(restaurant, {"rating": 4.0}, ["photo", "business_status"]) == []
+    assert restaurant.google_rating is None
+
+
+def test_backfill_progress_reports_rate_and_eta():
+    now = [0.0]
+    progress = BackfillProgress(total=10, clock=lambda: now[0])
+    for outcome in ["updated", "updated", "not_found", "failed"]:
+        progress.record(outcome)
+    now[0] = 2.0
+
+    assert progress.processed == 4
+    assert progress.rate == 2.0
+    assert progress.eta_seconds == 3.0
+    assert progress.summary() == "4/10 restaurants (updated=2, unchanged=0, not_found=1, failed=1) at 2.0/s, ETA 3s"
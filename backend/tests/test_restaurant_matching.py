@@ -0,0 +1,42 @@
+from app.utils.restaurant_matching import haversine_km, local_match_score
+
+JAY_FAI = {"name": "Jay Fai", "city": "Bangkok", "country": "Thailand", "latitude": 13.7527, "longitude": 100.5048}
+
+
+def make_entity(name, city=None, country=None, **fields):
+    return dict({"restaurant_name": name, "location": {"city": city, "county": None, "country": country}}, **fields)
+
+
+def test_exact_normalized_name_matches():
+    assert local_match_score(make_entity("JAY FAI!", city="Bangkok", country="Thailand"), JAY_FAI) == 1.0
+    assert local_match_score(make_entity("Jay Fai", latitude=13.7528, longitude=100.5049), JAY_FAI) == 1.0
+
+
+def test_exact_name_needs_matching_location():
+    assert local_match_score(make_entity("Jay Fai"), JAY_FAI) is None
+    assert local_match_score(make_entity("Jay Fai", city="Bangkok"), {"name": "Jay Fai"}) is None
+
+
+def test_same_country_is_not_enough():
+    # Two branches of one name in different cities of the same country
+    chiang_mai_branch = {"name": "Jay Fai", "city": "Chiang Mai", "country": "Thailand"}
+
+    assert local_match_score(make_entity("Jay Fai", country="Thailand"), JAY_FAI) is None
+    assert local_match_score(make_entity("Jay Fai", country="Thailand"), chiang_mai_branch) is None
+    assert local_match_score(make_entity("Jay Fai", city="Chiang Mai", country="Thailand"), JAY_FAI) is None
+    assert local_match_score(make_entity("Jay Fai", city="Chiang Mai", country="Thailand"), chiang_mai_branch) == 1.0
+
+
+def test_fuzzy_name_needs_matching_location():
+    assert local_match_score(make_entity("Jay Fay", city="bangkok"), JAY_FAI) >= 0.8
+    assert local_match_score(make_entity("Jay Fay"), JAY_FAI) is None
+
+
+def test_conflicting_location_or_coordinates_reject():
+    assert local_match_score(make_entity("Jay Fai", city="Chiang Mai"), JAY_FAI) is None
+    assert local_match_score(make_entity("Jay Fai", latitude=18.79, longitude=98.98), JAY_FAI) is None
+    assert local_match_score(make_entity("Jay Fay", latitude=13.753, longitude=100.505), JAY_FAI) >= 0.8
+
+
+def test_haversine_km():
+    assert round(haversine_km(0, 0, 0, 1)) == 111
@@ -0,0 +1,112 @@
+import asyncio
+
+from app.utils import swr_cache
+from app.utils.swr_cache import StaleWhileRevalidateCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class LockFailingRedis(FakeRedis):
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx:
+            raise ConnectionError("connection reset")
+        return await super().set(key, value, ex=ex, px=px, nx=nx)
+
+
+def make_cache(monkeypatch, redis=None):
+    redis = redis or FakeRedis()
+
+    async def get_redis_client():
+        return redis
+
+    monkeypatch.setattr(swr_cache, "get_redis_client", get_redis_client)
+    clock = Clock()
+    return StaleWhileRevalidateCache("reviews", fresh_ttl=60, max_age=3600, clock=clock), clock
+
+
+def test_fresh_entries_are_served_without_fetching(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    calls = []
+
+    async def fetch():
+        calls.append(clock.now)
+        return {"rating": 4.5}
+
+    async def run():
+        first = await cache.get("place-1", fetch)
+        clock.now += 30
+        second = await cache.get("place-1", fetch)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == ({"rating": 4.5}, {"cached": False, "stale": False, "age": 0})
+    assert second == ({"rating": 4.5}, {"cached": True, "stale": False, "age": 30})
+    assert len(calls) == 1
+
+
+def test_stale_entries_are_served_and_refreshed_once(monkeypatch):
+    cache, clock = make_cache(monkeypatch)
+    ratings = iter([4.0, 4.8, 5.0])
+    calls = []
+
+    async def fetch():
+        calls.append(clock.now)
+        await asyncio.sleep(0.01)
+        return {"rating": next(ratings)}
+
+    async def run():
+        await cache.get("place-1", fetch)
+        clock.now += 120
+        stale = await asyncio.gather(*[cache.get("place-1", fetch) for _ in range(3)])
+        await asyncio.sleep(0.05)  # Let the background refresh finish
+        refreshed = await cache.get("place-1", fetch)
+        return stale, refreshed
+
+    stale, refreshed = asyncio.run(run())
+
+    assert all(value == {"rating": 4.0} and info["stale"] for value, info in stale)
+    assert refreshed[0] == {"rating": 4.8}
+    assert len(calls) == 2
+    assert cache.metrics["refreshes"] == 1
+
+
+
+def test_refresh_lock_errors_are_logged_and_cleared(monkeypatch):
+    cache, clock = make_cache(monkeypatch, LockFailingRedis())
+
+    async def fetch():
+        return {"rating": 4.0}
+
+    async def run():
+        await cache.get("place-1", fetch)
+        clock.now += 120
+        stale = await cache.get("place-1", fetch)
+        await asyncio.sleep(0.01)  # Let the background refresh fail
+        return stale
+
+    value, info = asyncio.run(run())
+
+    assert value == {"rating": 4.0} and info["stale"]
+    assert cache.metrics["refresh_errors"] == 1
+    assert "place-1" not in cache._refreshing
@@ -0,0 +1,54 @@
+import json
+import uuid
+from datetime import datetime, timezone
+
+from app.utils.task_queue import (
+    backlog_page_limit,
+    backlog_stop_reason,
+    decode_backlog_cursor,
+    encode_backlog_cursor,
+    summarize_video_tasks,
+)
+
+
+def test_summary_counts_finished_and_remaining_tasks():
+    summary = summarize_video_tasks({"pending": 2, "processing": 1, "completed": 4, "failed": 2, "skipped": 1})
+
+    assert summary["total"] == 10
+    assert summary["done"] == 7
+    assert summary["remaining"] == 3
+    assert summary["progress"] == 70
+
+
+def test_summary_of_a_job_without_tasks_is_complete():
+    summary = summarize_video_tasks({})
+
+    assert summary["total"] == 0
+    assert summary["remaining"] == 0
+    assert summary["progress"] == 100
+
+
+def test_backlog_cursor_round_trips_through_json_form():
+    video_id = uuid.uuid4()
+    sort_key = (1200, datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc), video_id)
+
+    cursor = encode_backlog_cursor(sort_key)
+
+    assert json.loads(json.dumps(cursor)) == cursor
+    assert decode_backlog_cursor(cursor) == list(sort_key)
+
+
+def test_backlog_page_limit_respects_the_video_budget():
+    assert backlog_page_limit({"enqueued": 40}, 50) == 50
+    assert backlog_page_limit({"max_videos": 60, "enqueued": 40}, 50) == 20
+    assert backlog_page_limit({"max_videos": 60, "enqueued": 60}, 50) == 0
+
+
+def test_backlog_stops_at_the_first_budget_used_up():
+    payload = {"max_videos": 100, "max_minutes": 60, "max_spend": 5.0, "enqueued": 40}
+
+    assert backlog_stop_reason(payload, elapsed_minutes=10, spend=1.0) is None
+    assert backlog_stop_reason(payload, elapsed_minutes=61, spend=1.0) == "max_minutes"
+    assert backlog_stop_reason(payload, elapsed_minutes=10, spend=5.0) == "max_spend"
+    assert backlog_stop_reason({**payload, "enqueued": 100}, elapsed_minutes=10, spend=1.0) == "max_videos"
+    assert backlog_stop_reason({"enqueued": 10_000}, elapsed_minutes=600, spend=500.0) is None
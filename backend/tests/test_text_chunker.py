@@ -0,0 +1,49 @@
+import pytest
+
+from app.utils.text_chunker import chunk_text, count_tokens_locally, split_sentences
+
+TRANSCRIPT = " ".join(
+    f"Sentence number {i} talks about the food at stall {i}." for i in range(40)
+)
+
+
+def test_split_sentences_keeps_punctuation():
+    assert split_sentences("We're at Jay Fai! Is it good? “Yes.” Next stop.") == [
+        "We're at Jay Fai!",
+        "Is it good?",
+        "“Yes.”",
+        "Next stop.",
+    ]
+
+
+def test_chunks_respect_budget_and_cover_every_sentence():
+    chunks = chunk_text(TRANSCRIPT, max_tokens=60, overlap_tokens=0)
+    assert all(count_tokens_locally(chunk) <= 60 for chunk in chunks)
+    assert " ".join(chunks) == TRANSCRIPT
+
+
+def test_chunks_are_packed_close_to_budget():
+    chunks = chunk_text(TRANSCRIPT, max_tokens=60, overlap_tokens=0)
+    # Each sentence is 12 local tokens, so five fit per chunk
+    assert len(chunks) == 8
+
+
+def test_consecutive_chunks_overlap_by_whole_sentences():
+    chunks = chunk_text(TRANSCRIPT, max_tokens=60, overlap_tokens=12)
+    for previous, current in zip(chunks, chunks[1:]):
+        last_sentence = split_sentences(previous)[-1]
+        assert split_sentences(current)[0] == last_sentence
+    assert all(count_tokens_locally(chunk) <= 60 for chunk in chunks)
+
+
+def test_sentence_longer_than_budget_is_split_on_words():
+    long_sentence = " ".join(["word"] * 50) + "."
+    chunks = chunk_text(long_sentence, max_tokens=20)
+    assert len(chunks) == 3
+    assert all(count_tokens_locally(chunk) <= 20 for chunk in chunks)
+
+
+def test_empty_text_and_invalid_budget():
+    assert chunk_text("", max_tokens=100) == []
+    with pytest.raises(ValueError):
+        chunk_text(TRANSCRIPT, max_tokens=0)
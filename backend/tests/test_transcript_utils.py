@@ -0,0 +1,46 @@
+from app.utils.transcript_utils import (
+    compact_segments,
+    filter_segments,
+    find_listing_timestamp,
+    find_quote_timestamp,
+)
+
+SEGMENTS = [
+    {"start": 0.0, "end": 4.5, "text": "Welcome back to the channel, today we're in Bangkok."},
+    {"start": 4.5, "end": 9.0, "text": "We're at Jay Fai, the legendary street food stall."},
+    {"start": 9.0, "end": 14.2, "text": "This crab omelette is unbelievable, so fluffy and rich."},
+    {"start": 14.2, "end": 20.0, "text": "Next we head to Chinatown for some dessert."},
+]
+
+
+def test_compact_segments_applies_offset_and_drops_empty_text():
+    raw = [{"start": 1.234, "end": 2.5, "text": " hello "}, {"start": 3, "end": 4, "text": "  "}]
+    assert compact_segments(raw, offset=600) == [{"start": 601.23, "end": 602.5, "text": "hello"}]
+
+
+def test_find_quote_timestamp_exact_match_ignores_punctuation():
+    quote = "“This crab omelette is unbelievable, so fluffy and rich.”"
+    assert find_quote_timestamp(quote, SEGMENTS) == 9.0
+
+
+def test_find_quote_timestamp_fuzzy_match_across_segments():
+    quote = "We are at Jay Fai the legendary street food stall this crab omelette"
+    assert find_quote_timestamp(quote, SEGMENTS) == 4.5
+
+
+def test_find_quote_timestamp_returns_none_for_unrelated_quote():
+    assert find_quote_timestamp("Totally unrelated sentence about Paris museums", SEGMENTS) is None
+
+
+def test_find_listing_timestamp_uses_earliest_quote():
+    quotes = [
+        "This crab omelette is unbelievable, so fluffy and rich.",
+        "We're at Jay Fai, the legendary street food stall.",
+    ]
+    assert find_listing_timestamp(quotes, SEGMENTS) == 4
+    assert find_listing_timestamp(quotes, None) is None
+
+
+def test_filter_segments_by_time_and_phrase():
+    assert [s["start"] for s in filter_segments(SEGMENTS, start=5, end=15)] == [4.5, 9.0, 14.2]
+    assert [s["start"] for s in filter_segments(SEGMENTS, query="crab omelette")] == [9.0]
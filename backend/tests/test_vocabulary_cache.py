@@ -0,0 +1,85 @@
+import asyncio
+import uuid
+
+from app.utils import vocabulary_cache
+from app.utils.vocabulary_cache import INVALIDATION_CHANNEL, VocabularyCache
+
+
+def test_lookup_splits_cached_and_missing_names():
+    cache = VocabularyCache("tags")
+    ramen, sushi = uuid.uuid4(), uuid.uuid4()
+    cache.load([("ramen", ramen)])
+    cache.add({"sushi": sushi})
+
+    found, missing = cache.lookup(["ramen", "sushi", "tacos"])
+
+    assert found == {"ramen": ramen, "sushi": sushi}
+    assert missing == ["tacos"]
+    assert cache.missing_ids([ramen, uuid.UUID(int=1)]) == [uuid.UUID(int=1)]
+    assert cache.metrics["hits"] == 2 and cache.metrics["misses"] == 1
+
+
+def test_invalidate_clears_the_cache_until_reloaded():
+    cache = VocabularyCache("cuisines")
+    cache.load([("thai", uuid.uuid4())])
+
+    cache.invalidate()
+
+    assert not cache.loaded
+    assert cache.lookup(["thai"]) == ({}, ["thai"])
+
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = messages
+        self.channels = []
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        await asyncio.Event().wait()  # Stay subscribed until cancelled
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self, messages):
+        self.pubsub_instance = FakePubSub(messages)
+        self.published = []
+
+    def pubsub(self):
+        return self.pubsub_instance
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def test_published_invalidations_clear_the_matching_cache(monkeypatch):
+    redis = FakeRedis([
+        {"type": "subscribe", "data": 1},
+        {"type": "message", "data": "cuisines"},
+    ])
+
+    async def get_redis_client():
+        return redis
+
+    monkeypatch.setattr(vocabulary_cache, "get_redis_client", get_redis_client)
+    vocabulary_cache.tag_cache.load([("ramen", uuid.uuid4())])
+    vocabulary_cache.cuisine_cache.load([("thai", uuid.uuid4())])
+
+    async def run():
+        listener = asyncio.create_task(vocabulary_cache.listen_for_invalidations())
+        await asyncio.sleep(0.01)
+        listener.cancel()
+        await vocabulary_cache.publish_invalidation("tags")
+
+    asyncio.run(run())
+
+    assert redis.pubsub_instance.channels == [INVALIDATION_CHANNEL]
+    assert redis.published == [(INVALIDATION_CHANNEL, "tags")]
+    assert not vocabulary_cache.cuisine_cache.loaded
+    assert not vocabulary_cache.tag_cache.loaded
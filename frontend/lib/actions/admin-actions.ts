@@ -16,7 +16,7 @@ export const adminActions = {
   // Job Management
   getJobs: async (params?: {
     status?: 'pending' | 'running' | 'completed' | 'failed' | 'cancelled';
-    job_type?: 'scrape_youtube' | 'transcription_nlp';
+    job_type?: 'scrape_youtube' | 'transcription_nlp' | 'batch_extraction';
     started_by?: string;
     sort_by?: 'created_at' | 'started_at' | 'completed_at' | 'progress' | 'status';
     sort_order?: 'asc' | 'desc';
@@ -6,7 +6,7 @@ import type { Job, JobsSummary, JobCreateRequest, JobUpdateRequest, JobAnalytics
 
 export const useJobs = (params?: {
   status?: 'pending' | 'running' | 'completed' | 'failed' | 'cancelled';
-  job_type?: 'scrape_youtube' | 'transcription_nlp';
+  job_type?: 'scrape_youtube' | 'transcription_nlp' | 'batch_extraction';
   started_by?: string;
   sort_by?: 'created_at' | 'started_at' | 'completed_at' | 'progress' | 'status';
   sort_order?: 'asc' | 'desc';
@@ -3,7 +3,7 @@
 // Admin actions types
 export interface Job {
   id: string;
-  job_type: 'scrape_youtube' | 'transcription_nlp';
+  job_type: 'scrape_youtube' | 'transcription_nlp' | 'batch_extraction';
   status: 'pending' | 'running' | 'completed' | 'failed';
   title: string;
   description: string;
@@ -30,7 +30,7 @@ export interface Job {
 }
 
 export interface JobCreateRequest {
-  job_type: 'scrape_youtube' | 'transcription_nlp';
+  job_type: 'scrape_youtube' | 'transcription_nlp' | 'batch_extraction';
   title: string;
   description?: string;
   total_items?: number;